@@ -16,6 +16,7 @@ from app.models.user import User
 from app.models.product import Product
 from app.models.sale_record import SaleRecord
 from app.models.purchase_info import PurchaseInfo
+from app.models.inventory_movement import InventoryMovement, InventorySnapshot
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,65 @@
+"""Key sync change log by company to record tombstones for moved rows
+
+Revision ID: 4d7b2e9a1c63
+Revises: b6c1e4f7a2d9
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d7b2e9a1c63'
+down_revision = 'b6c1e4f7a2d9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # (테이블, 행 ID) 고유 키를 (테이블, 행 ID, 회사 ID)로 바꾸고 이전 회사 툼스톤을 남기는 트리거로 교체
+    from app.models.sync_change import upgrade_sync_log
+    upgrade_sync_log(op.get_bind())
+
+
+def downgrade() -> None:
+    from app.models.sync_change import SYNC_ROW_INDEX, SYNC_TABLES
+
+    for table in SYNC_TABLES:
+        for suffix in ('ai', 'au', 'ad'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_{suffix}")
+    op.execute(f"DROP INDEX IF EXISTS {SYNC_ROW_INDEX}")
+    op.drop_index('idx_sync_changes_entity', table_name='sync_changes')
+    op.drop_index('idx_sync_changes_entity_company', table_name='sync_changes')
+    op.rename_table('sync_changes', 'sync_changes_old')
+    op.create_table('sync_changes',
+    sa.Column('seq', sa.Integer(), nullable=False, comment='변경 순번'),
+    sa.Column('entity', sa.String(length=30), nullable=False, comment='대상 테이블'),
+    sa.Column('row_id', sa.Integer(), nullable=False, comment='대상 행 ID'),
+    sa.Column('company_id', sa.Integer(), nullable=True, comment='회사 ID'),
+    sa.Column('deleted', sa.Boolean(), nullable=False, comment='삭제 여부'),
+    sa.Column('changed_at', sa.DateTime(), nullable=False, comment='변경일시'),
+    sa.PrimaryKeyConstraint('seq'),
+    sa.UniqueConstraint('entity', 'row_id', name='uq_sync_changes_row'),
+    sqlite_autoincrement=True
+    )
+    op.create_index('idx_sync_changes_entity_company', 'sync_changes', ['entity', 'company_id'], unique=False)
+    op.create_index('idx_sync_changes_entity', 'sync_changes', ['entity'], unique=False)
+
+    # 행마다 가장 최근 기록만 남김 (순번 순으로 교체)
+    op.execute(
+        "INSERT OR REPLACE INTO sync_changes(seq, entity, row_id, company_id, deleted, changed_at) "
+        "SELECT seq, entity, row_id, company_id, deleted, changed_at FROM sync_changes_old ORDER BY seq"
+    )
+    op.drop_table('sync_changes_old')
+
+    # 이전 트리거 (행마다 한 건)
+    record = (
+        "INSERT OR REPLACE INTO sync_changes(entity, row_id, company_id, deleted, changed_at) "
+        "VALUES ('{table}', {row}.id, {company}, {deleted}, CURRENT_TIMESTAMP);"
+    )
+    for table, company_expr in SYNC_TABLES.items():
+        for suffix, timing, row, deleted in (('ai', 'INSERT', 'new', 0), ('au', 'UPDATE', 'new', 0),
+                                              ('ad', 'DELETE', 'old', 1)):
+            body = record.format(table=table, row=row, company=company_expr.format(row=row), deleted=deleted)
+            op.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_sync_{suffix} AFTER {timing} ON {table} BEGIN {body} END")
@@ -0,0 +1,60 @@
+"""Add inventory movement ledger and stock snapshots
+
+Revision ID: 7c3e9a41b2d8
+Revises: 2ebd5631d2a5
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c3e9a41b2d8'
+down_revision = '2ebd5631d2a5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('inventory_movements',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False, comment='제품 ID'),
+    sa.Column('company_id', sa.Integer(), nullable=False, comment='회사 ID'),
+    sa.Column('quantity', sa.Integer(), nullable=False, comment='변동 수량 (입고 +, 출고 -)'),
+    sa.Column('movement_type', sa.String(length=20), nullable=False, comment='변동 유형'),
+    sa.Column('reference_id', sa.Integer(), nullable=True, comment='관련 판매/구매 ID'),
+    sa.Column('created_by', sa.Integer(), nullable=True, comment='처리자'),
+    sa.Column('created_at', sa.DateTime(), nullable=False, comment='변동일시'),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.ForeignKeyConstraint(['created_by'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_inventory_movements_product_id', 'inventory_movements', ['product_id', 'id'], unique=False)
+    op.create_table('inventory_snapshots',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False, comment='제품 ID'),
+    sa.Column('company_id', sa.Integer(), nullable=False, comment='회사 ID'),
+    sa.Column('stock', sa.Integer(), nullable=False, comment='스냅샷 시점 재고'),
+    sa.Column('last_movement_id', sa.Integer(), nullable=True, comment='스냅샷에 반영된 마지막 원장 ID'),
+    sa.Column('snapshot_at', sa.DateTime(), nullable=False, comment='스냅샷 일시'),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_inventory_snapshots_product_at', 'inventory_snapshots', ['product_id', 'snapshot_at'], unique=False)
+    
+    # 기존 제품의 현재 재고를 기초 재고로 원장에 기록
+    op.execute(
+        "INSERT INTO inventory_movements (product_id, company_id, quantity, movement_type, created_at) "
+        "SELECT id, company_id, current_stock, 'initial', datetime('now', 'localtime') "
+        "FROM products WHERE current_stock != 0"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_inventory_snapshots_product_at', table_name='inventory_snapshots')
+    op.drop_table('inventory_snapshots')
+    op.drop_index('idx_inventory_movements_product_id', table_name='inventory_movements')
+    op.drop_table('inventory_movements')
@@ -0,0 +1,30 @@
+"""Add system settings for fleet-wide password hash cost
+
+Revision ID: 7e3a9c5d2b81
+Revises: 4d7b2e9a1c63
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7e3a9c5d2b81'
+down_revision = '4d7b2e9a1c63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 같은 DB를 쓰는 서버들이 공유하는 설정 (bcrypt 비용은 처음 시작한 서버가 측정해 저장)
+    op.create_table('system_settings',
+    sa.Column('key', sa.String(length=50), nullable=False, comment='설정 이름'),
+    sa.Column('value', sa.String(length=200), nullable=False, comment='설정 값'),
+    sa.Column('updated_at', sa.DateTime(), nullable=False, comment='수정일시'),
+    sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('system_settings')
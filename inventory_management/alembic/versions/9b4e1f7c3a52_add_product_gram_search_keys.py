@@ -0,0 +1,26 @@
+"""Add product substring gram search keys for short search terms
+
+Revision ID: 9b4e1f7c3a52
+Revises: 7e3a9c5d2b81
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b4e1f7c3a52'
+down_revision = '7e3a9c5d2b81'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # trigram 색인으로 찾을 수 없는 1~2글자 검색어용 부분 문자열 조각 키를 기존 제품으로 생성
+    from app.models.product_search import rebuild_product_search_keys
+    rebuild_product_search_keys(op.get_bind())
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM product_search_keys WHERE kind = 'g'")
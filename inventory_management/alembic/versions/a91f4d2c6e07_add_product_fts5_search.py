@@ -0,0 +1,57 @@
+"""Add FTS5 product search index
+
+Revision ID: a91f4d2c6e07
+Revises: 7c3e9a41b2d8
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a91f4d2c6e07'
+down_revision = '7c3e9a41b2d8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 검색 테이블과 동기화 트리거 생성 후 기존 제품으로 색인 구성
+    # trigram 토크나이저로 단어 중간의 부분 문자열도 검색 (이전 unicode61 색인이 있으면 다시 생성)
+    op.execute("DROP TABLE IF EXISTS products_fts")
+    op.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+            name, code, brand, model, description,
+            content='products', content_rowid='id',
+            tokenize='trigram'
+        )
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN
+            INSERT INTO products_fts(rowid, name, code, brand, model, description)
+            VALUES (new.id, new.name, new.code, new.brand, new.model, new.description);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN
+            INSERT INTO products_fts(products_fts, rowid, name, code, brand, model, description)
+            VALUES ('delete', old.id, old.name, old.code, old.brand, old.model, old.description);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF name, code, brand, model, description ON products BEGIN
+            INSERT INTO products_fts(products_fts, rowid, name, code, brand, model, description)
+            VALUES ('delete', old.id, old.name, old.code, old.brand, old.model, old.description);
+            INSERT INTO products_fts(rowid, name, code, brand, model, description)
+            VALUES (new.id, new.name, new.code, new.brand, new.model, new.description);
+        END
+    """)
+    op.execute("INSERT INTO products_fts(products_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS products_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS products_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS products_fts_ai")
+    op.execute("DROP TABLE IF EXISTS products_fts")
@@ -0,0 +1,48 @@
+"""Add sync change log for delta sync
+
+Revision ID: b6c1e4f7a2d9
+Revises: f5a2d8c4e1b7
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6c1e4f7a2d9'
+down_revision = 'f5a2d8c4e1b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('sync_changes',
+    sa.Column('seq', sa.Integer(), nullable=False, comment='변경 순번'),
+    sa.Column('entity', sa.String(length=30), nullable=False, comment='대상 테이블'),
+    sa.Column('row_id', sa.Integer(), nullable=False, comment='대상 행 ID'),
+    sa.Column('company_id', sa.Integer(), nullable=True, comment='회사 ID'),
+    sa.Column('deleted', sa.Boolean(), nullable=False, comment='삭제 여부'),
+    sa.Column('changed_at', sa.DateTime(), nullable=False, comment='변경일시'),
+    sa.PrimaryKeyConstraint('seq'),
+    sa.UniqueConstraint('entity', 'row_id', name='uq_sync_changes_row'),
+    sqlite_autoincrement=True
+    )
+    op.create_index('idx_sync_changes_entity_company', 'sync_changes', ['entity', 'company_id'], unique=False)
+    op.create_index('idx_sync_changes_entity', 'sync_changes', ['entity'], unique=False)
+
+    # 변경 기록 트리거 생성 후 기존 행으로 변경 로그 채움
+    from app.models.sync_change import SYNC_BACKFILL, SYNC_TRIGGER_DDL
+    for statement in SYNC_TRIGGER_DDL + SYNC_BACKFILL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    from app.models.sync_change import SYNC_TABLES
+
+    for table in SYNC_TABLES:
+        for suffix in ('ai', 'au', 'ad'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_{suffix}")
+    op.drop_index('idx_sync_changes_entity', table_name='sync_changes')
+    op.drop_index('idx_sync_changes_entity_company', table_name='sync_changes')
+    op.drop_table('sync_changes')
@@ -0,0 +1,41 @@
+"""Add product chosung/jamo search keys
+
+Revision ID: c52d7e8f1a94
+Revises: a91f4d2c6e07
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c52d7e8f1a94'
+down_revision = 'a91f4d2c6e07'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('product_search_keys',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False, comment='제품 ID'),
+    sa.Column('company_id', sa.Integer(), nullable=False, comment='회사 ID'),
+    sa.Column('kind', sa.String(length=1), nullable=False, comment='키 종류 (c: 초성, j: 자모)'),
+    sa.Column('key', sa.String(length=100), nullable=False, comment='검색 키'),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_product_search_keys_lookup', 'product_search_keys',
+                    ['kind', 'key', 'company_id', 'product_id'], unique=False)
+    op.create_index('idx_product_search_keys_product', 'product_search_keys', ['product_id'], unique=False)
+    
+    # 초성/자모 분해는 SQL로 표현할 수 없으므로 애플리케이션 함수로 기존 제품 키 생성
+    from app.models.product_search import rebuild_product_search_keys
+    rebuild_product_search_keys(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_index('idx_product_search_keys_product', table_name='product_search_keys')
+    op.drop_index('idx_product_search_keys_lookup', table_name='product_search_keys')
+    op.drop_table('product_search_keys')
@@ -0,0 +1,42 @@
+"""Add composite indexes for tenant-scoped list queries
+
+Revision ID: d8e4b6a1f3c5
+Revises: c52d7e8f1a94
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8e4b6a1f3c5'
+down_revision = 'c52d7e8f1a94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_products_company_created', 'products', ['company_id', 'created_at'], unique=False)
+    op.create_index('idx_sale_records_sale_date', 'sale_records', ['sale_date'], unique=False)
+    op.create_index('idx_sale_records_product_date', 'sale_records', ['product_id', 'sale_date'], unique=False)
+    op.create_index('idx_purchase_infos_purchase_date', 'purchase_infos', ['purchase_date'], unique=False)
+    op.create_index('idx_purchase_infos_product_date', 'purchase_infos', ['product_id', 'purchase_date'], unique=False)
+    
+    # 초기 마이그레이션의 users 테이블에는 is_active/created_at이 없으므로
+    # (init_db로 생성한 DB에만 존재) 컬럼이 있을 때만 인덱스 생성
+    user_columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('users')}
+    if {'is_active', 'created_at'} <= user_columns:
+        op.create_index('idx_users_company_active_created', 'users', ['company_id', 'is_active', 'created_at'], unique=False)
+    
+    # 쿼리 플래너가 새 인덱스를 선택할 수 있도록 통계 갱신
+    op.execute("ANALYZE")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_users_company_active_created")
+    op.drop_index('idx_purchase_infos_product_date', table_name='purchase_infos')
+    op.drop_index('idx_purchase_infos_purchase_date', table_name='purchase_infos')
+    op.drop_index('idx_sale_records_product_date', table_name='sale_records')
+    op.drop_index('idx_sale_records_sale_date', table_name='sale_records')
+    op.drop_index('idx_products_company_created', table_name='products')
@@ -0,0 +1,48 @@
+"""Add sales_daily rollup table
+
+Revision ID: e3b7c9d2a4f6
+Revises: d8e4b6a1f3c5
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3b7c9d2a4f6'
+down_revision = 'd8e4b6a1f3c5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('sales_daily',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False, comment='회사 ID'),
+    sa.Column('product_id', sa.Integer(), nullable=False, comment='제품 ID'),
+    sa.Column('sale_date', sa.Date(), nullable=False, comment='판매일'),
+    sa.Column('quantity', sa.Integer(), nullable=False, comment='판매 수량 합계'),
+    sa.Column('revenue', sa.Float(), nullable=False, comment='매출 합계'),
+    sa.Column('sale_count', sa.Integer(), nullable=False, comment='판매 건수'),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('company_id', 'product_id', 'sale_date', name='uq_sales_daily_key')
+    )
+    op.create_index('idx_sales_daily_company_date', 'sales_daily', ['company_id', 'sale_date'], unique=False)
+    
+    # 기존 판매 기록으로 일별 집계 백필 (취소/반품 제외)
+    op.execute("""
+        INSERT INTO sales_daily (company_id, product_id, sale_date, quantity, revenue, sale_count)
+        SELECT p.company_id, s.product_id, date(s.sale_date),
+               SUM(s.quantity), COALESCE(SUM(s.total_price), 0), COUNT(s.id)
+        FROM sale_records s JOIN products p ON p.id = s.product_id
+        WHERE s.status NOT IN ('cancelled', 'returned')
+        GROUP BY p.company_id, s.product_id, date(s.sale_date)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_sales_daily_company_date', table_name='sales_daily')
+    op.drop_table('sales_daily')
@@ -0,0 +1,56 @@
+"""Add sales_monthly rollup and covering stats indexes
+
+Revision ID: f5a2d8c4e1b7
+Revises: e3b7c9d2a4f6
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5a2d8c4e1b7'
+down_revision = 'e3b7c9d2a4f6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 통계 쿼리가 테이블 조회 없이 처리되도록 일별 집계 인덱스를 커버링 인덱스로 교체
+    op.drop_index('idx_sales_daily_company_date', table_name='sales_daily')
+    op.create_index('idx_sales_daily_company_date', 'sales_daily',
+                    ['company_id', 'sale_date', 'product_id', 'quantity', 'revenue', 'sale_count'], unique=False)
+
+    op.create_table('sales_monthly',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('company_id', sa.Integer(), nullable=False, comment='회사 ID'),
+    sa.Column('product_id', sa.Integer(), nullable=False, comment='제품 ID'),
+    sa.Column('sale_month', sa.Date(), nullable=False, comment='판매월 (매월 1일)'),
+    sa.Column('quantity', sa.Integer(), nullable=False, comment='판매 수량 합계'),
+    sa.Column('revenue', sa.Float(), nullable=False, comment='매출 합계'),
+    sa.Column('sale_count', sa.Integer(), nullable=False, comment='판매 건수'),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('company_id', 'product_id', 'sale_month', name='uq_sales_monthly_key')
+    )
+    op.create_index('idx_sales_monthly_company_month', 'sales_monthly',
+                    ['company_id', 'sale_month', 'product_id', 'quantity', 'revenue', 'sale_count'], unique=False)
+
+    # 일별 집계로 월별 집계 백필
+    op.execute("""
+        INSERT INTO sales_monthly (company_id, product_id, sale_month, quantity, revenue, sale_count)
+        SELECT company_id, product_id, date(sale_date, 'start of month'),
+               SUM(quantity), SUM(revenue), SUM(sale_count)
+        FROM sales_daily
+        GROUP BY company_id, product_id, date(sale_date, 'start of month')
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_sales_monthly_company_month', table_name='sales_monthly')
+    op.drop_table('sales_monthly')
+
+    op.drop_index('idx_sales_daily_company_date', table_name='sales_daily')
+    op.create_index('idx_sales_daily_company_date', 'sales_daily', ['company_id', 'sale_date'], unique=False)
@@ -1,6 +1,7 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, scoped_session, Session
-from app.config import DATABASE_URL, DATA_DIR
+from app.config import DATABASE_URL, ASYNC_DATABASE_URL, DATA_DIR, DB_PROFILE, DB_ENGINE_PROFILES
 import os
 import bcrypt
 
@@ -8,12 +9,52 @@ import bcrypt
 os.makedirs(DATA_DIR, exist_ok=True)
 
 
+def _get_engine_settings(profile: str) -> dict:
+    """엔진 프로필 설정 조회"""
+    if profile not in DB_ENGINE_PROFILES:
+        raise ValueError(f"알 수 없는 데이터베이스 프로필입니다: {profile}")
+    return DB_ENGINE_PROFILES[profile]
+
+def _register_pragmas(sync_engine, pragmas: dict):
+    """커넥션마다 SQLite PRAGMA 적용"""
+    if not pragmas:
+        return
+    
+    @event.listens_for(sync_engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+def create_db_engine(profile: str = DB_PROFILE, url: str = DATABASE_URL):
+    """프로필 설정에 맞춰 데이터베이스 엔진 생성"""
+    settings = _get_engine_settings(profile)
+    db_engine = create_engine(url, echo=settings['echo'], **settings['pool'])
+    _register_pragmas(db_engine, settings['pragmas'])
+    return db_engine
+
+def create_async_db_engine(profile: str = DB_PROFILE, url: str = ASYNC_DATABASE_URL):
+    """프로필 설정에 맞춰 비동기(aiosqlite) 데이터베이스 엔진 생성"""
+    settings = _get_engine_settings(profile)
+    db_engine = create_async_engine(url, echo=settings['echo'], **settings['pool'])
+    _register_pragmas(db_engine.sync_engine, settings['pragmas'])
+    return db_engine
+
 # 데이터베이스 엔진 생성
-engine = create_engine(DATABASE_URL, echo=True)
+engine = create_db_engine()
+async_engine = create_async_db_engine()
 
 # 세션 팩토리
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 세션 팩토리 (커밋 후 지연 로딩이 일어나지 않도록 expire_on_commit 비활성화)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 def get_db():
     """Dependency for getting database session"""
     db = SessionLocal()
@@ -22,6 +63,11 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """Dependency for getting async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def get_db_session() -> Session:
     """데이터베이스 세션을 생성하는 함수"""
     return SessionLocal()
@@ -30,8 +76,9 @@ def get_db_session() -> Session:
 from app.models import *
 
 def create_password_hash(password: str) -> str:
-    """비밀번호 해시 생성"""
-    salt = bcrypt.gensalt()
+    """비밀번호 해시 생성 (서버와 같은 bcrypt 비용 사용)"""
+    from app.utils.password_cost import bcrypt_rounds
+    salt = bcrypt.gensalt(rounds=bcrypt_rounds())
     return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -45,9 +92,19 @@ def init_db():
     from app.models.base import Base
     import bcrypt
     
+    from app.models.product_search import ensure_product_search_index
+    from app.models.sync_change import ensure_sync_log
+    
     # 테이블 생성
     Base.metadata.create_all(bind=engine)
     
+    # 제품 검색 색인 및 변경 기록 트리거 생성 (기존 데이터베이스 포함)
+    with engine.begin() as connection:
+        ensure_product_search_index(connection)
+        ensure_sync_log(connection)
+        # idx_products_company_created의 앞부분과 같은 단독 인덱스 (이전 버전에서 생성된 DB 정리)
+        connection.exec_driver_sql("DROP INDEX IF EXISTS idx_products_company_id")
+    
     # 초기 데이터 삽입
     db = SessionLocal()
     try:
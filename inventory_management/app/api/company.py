@@ -1,7 +1,9 @@
 import time
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session, Query
-from sqlalchemy import text
+import functools
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import text, select, func, Select
 from typing import List, Dict, Any, Tuple, Optional
 import logging
 from datetime import datetime
@@ -9,14 +11,18 @@ from datetime import datetime
 # 로거 설정
 logger = logging.getLogger(__name__)
 
-from app import get_db
+from app import get_db, get_async_db
 from app.models.company import Company
 from app.models.user import User
 from app.schemas.company import CompanyCreate, CompanyResponse, CompanyUpdate
-from app.utils.auth import get_current_user, check_super_admin, check_admin
+from app.utils.auth import get_current_user, get_current_user_async, check_super_admin, check_admin
+from app.utils.pagination import paginate, split_page
+from app.utils.query_plan import analyze_plan
+from app.utils.sync import MAX_SYNC_PAGE_SIZE, SYNC_PAGE_SIZE, fetch_changes
 
 # 쿼리 실행 시간을 측정하는 데코레이터
 def log_query_time(func):
+    @functools.wraps(func)
     async def wrapper(*args, **kwargs):
         start_time = time.time()
         try:
@@ -27,26 +33,31 @@ def log_query_time(func):
             logger.info(f"{func.__name__} 쿼리 실행 시간: {end_time - start_time:.4f}초")
     return wrapper
 
-def _execute_query(query: Query, skip: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
-    """실제 쿼리를 실행하고 결과를 반환하는 헬퍼 함수"""
+async def _execute_query(
+    db: AsyncSession, query: Select, skip: int, limit: int, cursor: Optional[str] = None
+) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+    """실제 쿼리를 실행하고 결과, 총 개수, 다음 페이지 커서를 반환하는 헬퍼 함수"""
     # 총 개수 조회 (COUNT 쿼리 최적화를 위해 서브쿼리 사용)
-    count_query = query.with_entities(Company.id).statement.with_only_columns([text('COUNT(1)')])
-    total = query.session.execute(count_query).scalar() or 0
-    
-    # EXPLAIN ANALYZE를 사용하여 쿼리 실행 계획 확인
-    explain_sql = str(query.statement.compile(compile_kwargs={"literal_binds": True}))
-    explain_query = f"EXPLAIN ANALYZE {explain_sql}"
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    total = (await db.execute(count_query)).scalar() or 0
     
+    # EXPLAIN QUERY PLAN으로 쿼리 실행 계획 확인 (SQLite는 EXPLAIN ANALYZE 미지원)
     try:
         # 실행 계획 로깅 (DEBUG 레벨에서만 출력)
         if logger.isEnabledFor(logging.DEBUG):
-            explain_result = query.session.execute(text(explain_query)).fetchall()
-            logger.debug("\n" + "\n".join([str(row) for row in explain_result]))
+            explain_sql = str(query.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True}))
+            plan = [row[3] for row in (await db.execute(text(f"EXPLAIN QUERY PLAN {explain_sql}"))).fetchall()]
+            logger.debug("\n" + "\n".join(plan))
+            for issue in analyze_plan(explain_sql, plan):
+                logger.debug(f"[실행 계획 경고] {issue['detail']} -> {issue['suggestion'] or '제안 없음'}")
     except Exception as e:
         logger.warning(f"쿼리 실행 계획 조회 실패: {e}")
     
-    # 실제 쿼리 실행 (필요한 필드만 선택적으로 로드)
-    companies = query.offset(skip).limit(limit).all()
+    # 실제 쿼리 실행 (필요한 필드만 선택적으로 로드, 회사명 + ID 커서 페이지네이션)
+    query = paginate(query, [Company.name, Company.id], cursor, limit)
+    if not cursor and skip:
+        query = query.offset(skip)
+    companies, next_cursor = split_page((await db.execute(query)).all(), limit, lambda row: [row.name, row.id])
     
     # 결과를 딕셔너리로 변환
     result = [
@@ -60,7 +71,7 @@ def _execute_query(query: Query, skip: int, limit: int) -> Tuple[List[Dict[str,
         for id, name, business_number, address, phone in companies
     ]
     
-    return result, total
+    return result, total, next_cursor
 
 router = APIRouter(prefix="/api/companies", tags=["companies"])
 
@@ -91,19 +102,21 @@ def create_company(
 
 @router.get("/", response_model=Dict[str, Any])
 @log_query_time
-def get_companies(
+async def get_companies(
     request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """
     회사 목록 조회 (슈퍼 관리자는 전체, 일반 관리자/사용자는 자신의 회사만)
     
     - **skip**: 건너뛸 레코드 수 (페이징용)
     - **limit**: 반환할 최대 레코드 수 (페이징용)
+    - **cursor**: 이전 응답의 next_cursor (지정 시 skip 대신 사용)
     - **search**: 회사명 또는 사업자등록번호로 검색 (선택사항)
     """
     try:
@@ -111,7 +124,7 @@ def get_companies(
         start_time = time.time()
         
         # 필요한 필드만 선택적으로 로드
-        query = db.query(
+        query = select(
             Company.id,
             Company.name,
             Company.business_number,
@@ -122,7 +135,7 @@ def get_companies(
         # 검색어가 있는 경우 필터링
         if search:
             search = f"%{search}%"
-            query = query.filter(
+            query = query.where(
                 (Company.name.ilike(search)) | 
                 (Company.business_number.ilike(search))
             )
@@ -133,9 +146,10 @@ def get_companies(
         # 사용자 역할에 따라 쿼리 필터링
         if current_user.role != "super_admin":
             # 일반 사용자/관리자는 자신의 회사만 조회
-            query = query.filter(Company.id == current_user.company_id)
+            query = query.where(Company.id == current_user.company_id)
             total = 1  # 일반 사용자는 자신의 회사 1개만 조회 가능
-            companies = query.all()
+            next_cursor = None
+            companies = (await db.execute(query)).all()
             
             # 결과를 딕셔너리로 변환
             result = [
@@ -150,7 +164,7 @@ def get_companies(
             ]
         else:
             # 슈퍼 관리자는 모든 회사 조회 (페이징 적용)
-            result, total = _execute_query(query, skip, limit)
+            result, total, next_cursor = await _execute_query(db, query, skip, limit, cursor)
         
         # 응답 메타데이터 추가
         response = {
@@ -158,7 +172,8 @@ def get_companies(
             "total": total,
             "skip": skip,
             "limit": limit,
-            "has_more": (skip + len(result)) < total if total > 0 else False,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
             "timestamp": datetime.utcnow().isoformat()
         }
         
@@ -173,14 +188,25 @@ def get_companies(
         print(f"[오류] 회사 목록 조회 중 오류 발생: {error_detail}")
         raise HTTPException(status_code=500, detail=f"회사 목록 조회 중 오류 발생: {str(e)}")
 
+@router.get("/changes")
+async def get_company_changes(
+    since: int = Query(0, description="마지막 동기화 토큰 (0이면 전체)"),
+    limit: int = Query(SYNC_PAGE_SIZE, ge=1, le=MAX_SYNC_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
+):
+    """마지막 동기화 이후 변경/삭제된 회사 (증분 동기화, 슈퍼 관리자가 아니면 자신의 회사만)"""
+    company_id = None if current_user.role == "super_admin" else current_user.company_id
+    return await db.run_sync(fetch_changes, 'companies', since, company_id, limit)
+
 @router.get("/{company_id}", response_model=CompanyResponse)
-def get_company(
+async def get_company(
     company_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async)
 ):
     """회사 상세 조회 (슈퍼 관리자 또는 해당 회사 관리자만 가능)"""
-    company = db.query(Company).filter(Company.id == company_id).first()
+    company = await db.get(Company, company_id)
     if not company:
         raise HTTPException(status_code=404, detail="회사를 찾을 수 없습니다.")
     
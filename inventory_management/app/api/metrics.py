@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, status
+from typing import Any, Dict
+
+from app.models.user import User
+from app.utils.auth import get_current_user_async, check_super_admin
+from app.utils.sql_metrics import get_sql_metrics, reset_sql_metrics
+
+router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+@router.get("/sql", response_model=Dict[str, Dict[str, Any]])
+async def read_sql_metrics(current_user: User = Depends(get_current_user_async)):
+    """라우트별 누적 SQL 통계 조회 (슈퍼 관리자만 가능)"""
+    check_super_admin(current_user)
+    return get_sql_metrics()
+
+@router.delete("/sql", status_code=status.HTTP_204_NO_CONTENT)
+async def clear_sql_metrics(current_user: User = Depends(get_current_user_async)):
+    """누적 SQL 통계 초기화 (슈퍼 관리자만 가능)"""
+    check_super_admin(current_user)
+    reset_sql_metrics()
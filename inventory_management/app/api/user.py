@@ -1,13 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Body, Query, Response
 import sqlalchemy
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 
-from app import get_db
+from app import get_db, get_async_db
 from app.models.user import User as UserModel
 from app.models.company import Company
 from app.schemas.user import User, UserCreate, UserUpdate, UserRole
-from app.utils.auth import get_current_user, check_super_admin, check_admin, get_password_hash
+from app.utils.auth import (
+    get_current_user, get_current_user_async, check_super_admin, check_admin, hash_password
+)
+from app.utils.principal_cache import mark_user_changed
+from app.utils.pagination import NEXT_CURSOR_HEADER, paginate, split_page
+from app.utils.sync import MAX_SYNC_PAGE_SIZE, SYNC_PAGE_SIZE, fetch_changes
 
 router = APIRouter(prefix="/api/users", tags=["users"])
 
@@ -83,7 +90,7 @@ def create_user(
             )
     
     # 사용자 생성
-    hashed_password = get_password_hash(user.password)
+    hashed_password = hash_password(user.password)
     db_user = UserModel(
         username=user.username,
         email=user.email,
@@ -122,33 +129,42 @@ def create_user(
     return user_dict
 
 @router.get("/", response_model=List[User])
-def list_users(
+async def list_users(
+    response: Response,
     skip: int = 0, 
     limit: int = 100,
+    cursor: Optional[str] = None,
     company_id: Optional[int] = None,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserModel = Depends(get_current_user_async)
 ):
     """사용자 목록 조회"""
     # 회사 정보를 함께 로드하기 위해 joinedload 사용
-    query = db.query(UserModel).options(joinedload(UserModel.company))
+    query = select(UserModel).options(joinedload(UserModel.company))
     
     # 슈퍼 관리자가 아닌 경우 자신의 회사 사용자만 조회 가능
     if current_user.role != "super_admin":
-        query = query.filter(UserModel.company_id == current_user.company_id)
+        query = query.where(UserModel.company_id == current_user.company_id)
     # 특정 회사 필터링
     elif company_id is not None:
-        query = query.filter(UserModel.company_id == company_id)
+        query = query.where(UserModel.company_id == company_id)
     
     # 슈퍼 관리자는 모든 사용자 조회, 그 외는 회사 내 사용자만
     if current_user.role != "super_admin":
-        query = query.filter(UserModel.role != "super_admin")
+        query = query.where(UserModel.role != "super_admin")
     
     # 활성 사용자만 조회
-    query = query.filter(UserModel.is_active == True)
+    query = query.where(UserModel.is_active == True)
+    
+    # 정렬 (최근 생성일자 순, 생성일자 + ID 커서 페이지네이션)
+    query = paginate(query, [UserModel.created_at, UserModel.id], cursor, limit, descending=True)
+    if not cursor and skip:
+        query = query.offset(skip)
     
-    # 정렬 (최근 생성일자 순)
-    users = query.order_by(UserModel.created_at.desc()).offset(skip).limit(limit).all()
+    result = await db.execute(query)
+    users, next_cursor = split_page(result.scalars().unique().all(), limit, lambda row: [row.created_at, row.id])
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     
     # 응답 모델에 맞게 변환
     result = []
@@ -174,20 +190,50 @@ def list_users(
     
     return result
 
+@router.get("/changes")
+async def list_user_changes(
+    since: int = Query(0, description="마지막 동기화 토큰 (0이면 전체)"),
+    limit: int = Query(SYNC_PAGE_SIZE, ge=1, le=MAX_SYNC_PAGE_SIZE),
+    company_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserModel = Depends(get_current_user_async)
+):
+    """
+    마지막 동기화 이후 변경/삭제된 사용자 (증분 동기화)
+    
+    목록 조회와 같은 조건(활성 사용자, 슈퍼 관리자가 아니면 본인 회사의 일반 계정만)을 적용하며,
+    비활성화되거나 조건에 맞지 않게 된 사용자는 삭제로 반환합니다.
+    """
+    filters = [UserModel.is_active == True]
+    if current_user.role != "super_admin":
+        company_id = current_user.company_id
+        filters.append(UserModel.role != "super_admin")
+    return await db.run_sync(fetch_changes, 'users', since, company_id, limit, filters)
+
 @router.get("/me", response_model=User)
-def read_user_me(current_user: UserModel = Depends(get_current_user)):
+def read_user_me(
+    db: Session = Depends(get_db),
+    current_user: UserModel = Depends(get_current_user)
+):
     """현재 로그인한 사용자 정보 조회"""
-    return current_user
+    # 인증 정보에는 권한 확인용 값만 있으므로 전체 정보를 다시 조회
+    db_user = db.query(UserModel).options(joinedload(UserModel.company)).filter(UserModel.id == current_user.id).first()
+    if not db_user:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    return db_user
 
 @router.get("/{user_id}", response_model=User)
-def read_user(
+async def read_user(
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: UserModel = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: UserModel = Depends(get_current_user_async)
 ):
     """사용자 상세 조회"""
     # 회사 정보를 함께 로드
-    db_user = db.query(UserModel).options(joinedload(UserModel.company)).filter(UserModel.id == user_id).first()
+    result = await db.execute(
+        select(UserModel).options(joinedload(UserModel.company)).where(UserModel.id == user_id)
+    )
+    db_user = result.scalars().first()
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -281,12 +327,14 @@ def update_user(
     
     # 비밀번호 업데이트
     if 'password' in update_data:
-        update_data['password_hash'] = get_password_hash(update_data.pop('password'))
+        update_data['password_hash'] = hash_password(update_data.pop('password'))
     
     # 슈퍼 관리자는 회사에 속하지 않음
     if update_data.get('role') == 'super_admin':
         update_data['company_id'] = None
     
+    # 커밋되면 변경 전/후 사용자명의 인증 캐시 제거
+    mark_user_changed(db, db_user.username, update_data.get('username'))
     for key, value in update_data.items():
         setattr(db_user, key, value)
     
@@ -325,6 +373,7 @@ def delete_user(
             detail="슈퍼 관리자는 삭제할 수 없습니다."
         )
     
+    mark_user_changed(db, db_user.username)
     db.delete(db_user)
     db.commit()
     return None
@@ -1,5 +1,9 @@
 import os
 import json
+import base64
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -12,6 +16,50 @@ DATA_DIR = BASE_DIR / 'data'
 
 # 데이터베이스 설정
 DATABASE_URL = f"sqlite:///{DATA_DIR}/inventory.db"
+ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{DATA_DIR}/inventory.db"
+
+# 데이터베이스 엔진 프로필 (development / production)
+DB_PROFILE = os.getenv('DB_PROFILE', 'development')
+
+# uvicorn 워커의 스레드풀(anyio 기본 40개)에 맞춘 커넥션 풀 크기
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '40'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '30'))
+
+# 잠금 대기 시간 (밀리초)
+DB_BUSY_TIMEOUT_MS = int(os.getenv('DB_BUSY_TIMEOUT_MS', '5000'))
+
+# 전체 SQL 로그 출력 여부 (기본은 끄고 요청 단위 SQL 계측으로 대체)
+DB_ECHO = os.getenv('DB_ECHO', 'false').lower() == 'true'
+
+# 한 요청에서 같은 SQL이 이 횟수 이상 반복되면 N+1 의심으로 경고
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv('SQL_N_PLUS_ONE_THRESHOLD', '5'))
+
+DB_ENGINE_PROFILES = {
+    # 개발용: SQLite 기본 설정 유지 (DB_ECHO=true면 SQL 로그 출력)
+    'development': {
+        'echo': DB_ECHO,
+        'pool': {},
+        'pragmas': {},
+    },
+    # 운영용: SQL 로그 비활성화, WAL 모드 및 캐시/mmap 튜닝
+    'production': {
+        'echo': False,
+        'pool': {
+            'pool_size': DB_POOL_SIZE,
+            'max_overflow': DB_MAX_OVERFLOW,
+            'pool_timeout': DB_POOL_TIMEOUT,
+        },
+        'pragmas': {
+            'journal_mode': 'WAL',
+            'synchronous': 'NORMAL',
+            'busy_timeout': DB_BUSY_TIMEOUT_MS,
+            'cache_size': -64000,  # 약 64MB (음수는 KiB 단위)
+            'mmap_size': 268435456,  # 256MB
+            'temp_store': 'MEMORY',
+        },
+    },
+}
 
 # 애플리케이션 설정
 APP_NAME = "Inventory Management System"
@@ -28,6 +76,16 @@ TOKEN_KEY = 'inventory_auth_token'
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# 비밀번호 해시(bcrypt) 목표 시간 (밀리초) - DB에 공통 비용이 없을 때 처음 시작한 서버가 이 시간에 맞춰 측정해 저장
+PASSWORD_HASH_TARGET_MS = int(os.getenv('PASSWORD_HASH_TARGET_MS', '250'))
+
+# bcrypt 비용 하한/상한 (측정 결과와 관계없이 이 범위로 제한, 하한은 12 미만으로 낮출 수 없음)
+PASSWORD_HASH_MIN_ROUNDS = max(12, int(os.getenv('PASSWORD_HASH_MIN_ROUNDS', '12')))
+PASSWORD_HASH_MAX_ROUNDS = max(PASSWORD_HASH_MIN_ROUNDS, int(os.getenv('PASSWORD_HASH_MAX_ROUNDS', '15')))
+
+# bcrypt 비용 고정 (설정하면 DB에 저장된 공통 비용 대신 사용, 하한보다 낮으면 하한 사용)
+PASSWORD_HASH_ROUNDS = os.getenv('PASSWORD_HASH_ROUNDS', '')
+
 # Gemini API 설정
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
 
@@ -39,162 +97,139 @@ STAMP_IMAGE_PATH = DATA_DIR / 'stamp.png'
 os.makedirs(DATA_DIR, exist_ok=True)
 os.makedirs(PDF_OUTPUT_DIR, exist_ok=True)
 
-def get_auth_header():
-    """인증 헤더 생성"""
-    from PySide6.QtCore import QSettings, QCoreApplication
+# 인증 토큰 저장 위치 (QSettings 조직/애플리케이션 이름과 키)
+AUTH_SETTINGS_ORGANIZATION = "ICS"
+AUTH_SETTINGS_APPLICATION = "InventoryManagement"
+AUTH_TOKEN_SETTINGS_KEY = 'auth/token'
+
+def _normalize_token(token) -> str:
+    """bytes나 따옴표로 감싼 토큰을 문자열로 정리 (유효하지 않으면 빈 문자열)"""
+    if isinstance(token, bytes):
+        try:
+            token = token.decode('utf-8')
+        except UnicodeDecodeError:
+            return ''
+    if not isinstance(token, str):
+        return ''
     
+    token = token.strip()
+    if token.startswith("b'") and token.endswith("'"):
+        token = token[2:-1]
+    elif (token.startswith("'") and token.endswith("'")) or \
+         (token.startswith('"') and token.endswith('"')):
+        token = token[1:-1]
+    
+    # 최소한의 길이 확인
+    return token if len(token) >= 10 else ''
+
+def _token_expiry(token: str):
+    """JWT 만료 시각 (epoch 초, 없으면 None) - 서명은 서버에서 검증하므로 페이로드만 읽음"""
     try:
-        # QSettings 초기화 (애플리케이션 이름과 조직 이름 설정)
-        QCoreApplication.setOrganizationName("ICS")
-        QCoreApplication.setApplicationName("InventoryManagement")
-        
-        # QSettings 인스턴스 생성 (파일 기반 저장소 사용)
-        settings = QSettings("ICS", "InventoryManagement")
-        token = settings.value('auth/token', '')
-        
-        print(f"\n=== 인증 헤더 생성 ===")
-        print(f"초기 토큰 값 타입: {type(token)}")
-        print(f"초기 토큰 값: {token}")
-        
-        if not token:
-            print("❌ 토큰이 없어 인증 헤더를 생성할 수 없습니다.")
-            return {}
-        
-        # 토큰이 bytes 타입인 경우 문자열로 디코딩
-        if isinstance(token, bytes):
-            try:
-                token = token.decode('utf-8')
-                print(f"바이트에서 디코딩된 토큰: {token}")
-            except UnicodeDecodeError:
-                print("❌ 토큰 디코딩 실패")
-                return {}
-        
-        # 토큰이 문자열로 감싸져 있는 경우 제거
-        if isinstance(token, str):
-            token = token.strip()
-            if (token.startswith("b'") and token.endswith("'")) or \
-               (token.startswith('"') and token.endswith('"')):
-                token = token[1:-1]
-                print(f"따옴표 제거 후 토큰: {token}")
-        
-        # 토큰 유효성 검사 (기본적인 형식 확인)
-        if not isinstance(token, str) or len(token) < 10:  # 최소한의 길이 확인
-            print(f"❌ 유효하지 않은 토큰 형식: {token}")
-            return {}
-            
-        print(f"✅ 최종 토큰: {token[:10]}... (총 길이: {len(token)})")
-        
-        headers = {
+        payload = token.split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+class AuthTokenStore:
+    """
+    인증 토큰 저장소
+    
+    토큰, 만료 시각과 인증 헤더를 메모리에 두고 QSettings는 처음 조회할 때 한 번만 읽습니다.
+    저장/삭제는 메모리에 바로 반영하고 QSettings 기록은 백그라운드 스레드에서 순서대로 처리합니다.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._token = ''
+        self._expires_at = None
+        self._headers = {}
+        self._writer = None
+    
+    def _settings(self):
+        from PySide6.QtCore import QSettings
+        return QSettings(AUTH_SETTINGS_ORGANIZATION, AUTH_SETTINGS_APPLICATION)
+    
+    def _set(self, token: str):
+        self._token = token
+        self._expires_at = _token_expiry(token) if token else None
+        self._headers = {
             'Authorization': f'Bearer {token}',
             'Content-Type': 'application/json'
-        }
-        
-        print(f"생성된 헤더: {headers}")
-        return headers
-        
-    except Exception as e:
-        print(f"❌ 인증 헤더 생성 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return {}
-
-def save_auth_token(token: str):
-    """인증 토큰 저장"""
-    from PySide6.QtCore import QSettings, QCoreApplication, QStandardPaths
-    import os
+        } if token else {}
+        self._loaded = True
     
-    print(f"\n=== 토큰 저장 시도 ===")
-    print(f"저장할 토큰: {token}")
-    print(f"저장할 토큰 타입: {type(token)}")
+    def _load(self):
+        with self._lock:
+            if not self._loaded:
+                self._set(_normalize_token(self._settings().value(AUTH_TOKEN_SETTINGS_KEY, '')))
     
-    try:
-        # QSettings 초기화 (애플리케이션 이름과 조직 이름 설정)
-        QCoreApplication.setOrganizationName("ICS")
-        QCoreApplication.setApplicationName("InventoryManagement")
-        
-        # 저장 디렉토리 생성 (필요한 경우)
-        config_dir = os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation), "ICS")
-        os.makedirs(config_dir, exist_ok=True)
-        
-        print(f"설정 파일 경로: {config_dir}")
-        
-        # QSettings 인스턴스 생성 (파일 기반 저장소 사용)
-        settings = QSettings("ICS", "InventoryManagement")
-        
-        # 토큰이 bytes 타입인지 확인하고 문자열로 변환
-        if isinstance(token, bytes):
-            token = token.decode('utf-8')
-            print(f"바이트를 문자열로 변환: {token}")
-        
-        # 토큰이 이미 문자열로 감싸져 있는지 확인하고 제거
-        token = token.strip()
-        if (token.startswith("'") and token.endswith("'")) or \
-           (token.startswith('"') and token.endswith('"')):
-            token = token[1:-1]
-            print(f"따옴표 제거 후 토큰: {token}")
-        
-        # 토큰 유효성 검사
-        if not token or len(token) < 10:
-            print("❌ 유효하지 않은 토큰 형식")
-            return False
-        
-        # 토큰 저장
-        settings.setValue('auth/token', token)
-        settings.sync()  # 설정값을 즉시 저장
-        
-        # 저장된 토큰 확인
-        settings = QSettings("ICS", "InventoryManagement")  # 새 인스턴스로 확인
-        saved_token = settings.value('auth/token', '')
-        
-        print(f"저장된 토큰 확인: {saved_token}")
-        print(f"저장된 토큰 타입: {type(saved_token)}")
-        
-        # 저장 여부 확인
-        if not saved_token or (isinstance(saved_token, str) and not saved_token.strip()):
-            print("❌ 토큰이 비어있습니다.")
-            return False
-            
-        # 토큰 비교 (타입 변환 후 비교)
-        saved_str = str(saved_token).strip()
-        token_str = str(token).strip()
-        
-        if saved_str != token_str:
-            print(f"❌ 토큰 불일치. 저장된: '{saved_str}', 예상: '{token_str}'")
+    @property
+    def token(self) -> str:
+        """현재 토큰 (없거나 만료됐으면 빈 문자열)"""
+        return self._token if self.headers() else ''
+    
+    @property
+    def expires_at(self):
+        if not self._loaded:
+            self._load()
+        return self._expires_at
+    
+    def headers(self) -> dict:
+        """인증 헤더 (토큰이 없거나 만료됐으면 빈 dict)"""
+        if not self._loaded:
+            self._load()
+        if self._expires_at is not None and time.time() >= self._expires_at:
+            return {}
+        return dict(self._headers)
+    
+    def save(self, token) -> bool:
+        """토큰 저장 (형식이 잘못됐으면 False)"""
+        token = _normalize_token(token)
+        if not token:
             return False
-            
-        print("✅ 토큰 저장 성공")
+        with self._lock:
+            self._set(token)
+        self._persist(token)
         return True
-        
-    except Exception as e:
-        print(f"❌ 토큰 저장 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+    
+    def clear(self):
+        with self._lock:
+            self._set('')
+        self._persist(None)
+    
+    def flush(self):
+        """대기 중인 QSettings 기록이 끝날 때까지 대기"""
+        if self._writer is not None:
+            self._writer.submit(lambda: None).result()
+    
+    def _persist(self, token):
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='auth-token')
+        self._writer.submit(self._write, token)
+    
+    def _write(self, token):
+        try:
+            settings = self._settings()
+            if token:
+                settings.setValue(AUTH_TOKEN_SETTINGS_KEY, token)
+            else:
+                settings.remove(AUTH_TOKEN_SETTINGS_KEY)
+            settings.sync()
+        except Exception as e:
+            print(f"❌ 토큰 기록 중 오류 발생: {str(e)}")
+
+auth_token_store = AuthTokenStore()
+
+def get_auth_header():
+    """인증 헤더 생성"""
+    return auth_token_store.headers()
+
+def save_auth_token(token: str):
+    """인증 토큰 저장"""
+    return auth_token_store.save(token)
 
 def clear_auth_token():
     """인증 토큰 삭제"""
-    from PySide6.QtCore import QSettings, QCoreApplication
-    
-    try:
-        # QSettings 초기화 (애플리케이션 이름과 조직 이름 설정)
-        QCoreApplication.setOrganizationName("ICS")
-        QCoreApplication.setApplicationName("InventoryManagement")
-        
-        # QSettings 인스턴스 생성 (파일 기반 저장소 사용)
-        settings = QSettings("ICS", "InventoryManagement")
-        
-        # 토큰 삭제
-        settings.remove('auth/token')
-        settings.sync()  # 변경사항 즉시 적용
-        
-        # 삭제 확인
-        token = settings.value('auth/token', '')
-        if not token:
-            print("✅ 토큰 삭제 성공")
-        else:
-            print("❌ 토큰 삭제 실패")
-            
-    except Exception as e:
-        print(f"❌ 토큰 삭제 중 오류 발생: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    auth_token_store.clear()
@@ -1,6 +1,5 @@
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
-import bcrypt
 
 from ..models import User
 from .. import SessionLocal
@@ -47,7 +46,6 @@ class AuthController:
                 return False, "사용자명 또는 비밀번호가 일치하지 않습니다."
             
             print(f"✅ 사용자 찾음: {user.username}")
-            print(f"저장된 해시: {user.password_hash}")
             
             # 비밀번호 검증
             from app import verify_password
@@ -78,34 +76,19 @@ class AuthController:
                 "company_id": user.company_id  # 회사 ID도 토큰에 포함
             }
             
-            print(f"시크릿 키: {SECRET_KEY}")
-            print(f"알고리즘: {ALGORITHM}")
-            print(f"페이로드: {to_encode}")
-            
             try:
                 # JWT 토큰 생성
                 access_token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-                print(f"생성된 토큰 타입: {type(access_token)}")
-                print(f"생성된 토큰: {access_token}")
                 
                 # 토큰 저장 (문자열로 변환하여 저장)
                 if isinstance(access_token, bytes):
                     token_str = access_token.decode('utf-8')
-                    print(f"바이트를 문자열로 디코딩: {token_str}")
                 else:
                     token_str = access_token
                 
-                print(f"저장할 토큰 문자열: {token_str}")
-                
-                # 토큰 저장 시도
+                # 토큰 저장 시도 (메모리에 바로 반영되고 디스크 기록은 백그라운드에서 처리)
                 token_saved = save_auth_token(token_str)
                 
-                # 저장 후 토큰 확인
-                from PySide6.QtCore import QSettings
-                settings = QSettings()
-                saved_token = settings.value('auth/token', '')
-                print(f"저장 후 확인된 토큰: {saved_token}")
-                
                 if not token_saved:
                     print("❌ 토큰 저장에 실패했습니다.")
                     return False, "토큰 저장에 실패했습니다. 관리자에게 문의해주세요."
@@ -169,8 +152,8 @@ class AuthController:
                 db.refresh(company)
             
             # 비밀번호 해시 생성
-            salt = bcrypt.gensalt()
-            hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+            from app import create_password_hash
+            hashed_password = create_password_hash(password)
             
             # 사용자 생성
             user = User(
@@ -2,6 +2,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
 
+from app.models.inventory_movement import MovementType
+from app.utils.stock import record_movement, set_stock
+
 class ProductController:
     def __init__(self, db_session: Session):
         self.db = db_session
@@ -43,6 +46,9 @@ class ProductController:
             self.db.add(product)
             self.db.flush()  # ID를 얻기 위해 flush
             
+            # 초기 재고 원장 기록
+            record_movement(self.db, product.id, product_data['stock'], MovementType.INITIAL)
+            
             # 입고 정보 생성
             if product_data['supplier']['name']:
                 purchase = PurchaseInfo(
@@ -100,7 +106,7 @@ class ProductController:
             product.category = product_data['category']
             product.brand = product_data['brand']
             product.model = product_data['model']
-            product.current_stock = product_data['stock']
+            set_stock(self.db, product.id, product_data['stock'], MovementType.ADJUSTMENT)
             product.minimum_stock = product_data['min_stock']
             product.price = product_data['selling_price']
             
@@ -2,8 +2,14 @@ from .base import Base, BaseModel
 from .user import User, USER_ROLES
 from .company import Company
 from .product import Product
+from .product_search import ProductSearchKey
 from .purchase_info import PurchaseInfo
 from .sale_record import SaleRecord, SaleStatus
+from .inventory_movement import InventoryMovement, InventorySnapshot, MovementType
+from .sales_daily import SalesDaily
+from .sales_monthly import SalesMonthly
+from .sync_change import SyncChange
+from .system_setting import SystemSetting
 
 __all__ = [
     'Base',
@@ -12,7 +18,15 @@ __all__ = [
     'USER_ROLES',
     'Company',
     'Product',
+    'ProductSearchKey',
     'PurchaseInfo',
     'SaleRecord',
-    'SaleStatus'
+    'SaleStatus',
+    'InventoryMovement',
+    'InventorySnapshot',
+    'MovementType',
+    'SalesDaily',
+    'SalesMonthly',
+    'SyncChange',
+    'SystemSetting'
 ]
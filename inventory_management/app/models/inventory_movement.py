@@ -0,0 +1,57 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
+from sqlalchemy.orm import relationship
+from datetime import datetime
+from .base import Base
+
+class MovementType:
+    INITIAL = 'initial'  # 초기 재고 / 기초 재고
+    PURCHASE = 'purchase'  # 구매 입고
+    PURCHASE_UPDATE = 'purchase_update'  # 구매 수량 수정
+    PURCHASE_CANCEL = 'purchase_cancel'  # 구매 삭제
+    SALE = 'sale'  # 판매 출고
+    SALE_UPDATE = 'sale_update'  # 판매 수량 수정
+    SALE_CANCEL = 'sale_cancel'  # 판매 삭제
+    ADJUSTMENT = 'adjustment'  # 재고 수동 조정
+
+class InventoryMovement(Base):
+    """재고 변동 원장 (추가 전용, 수정/삭제하지 않음)"""
+    __tablename__ = 'inventory_movements'
+    
+    id = Column(Integer, primary_key=True)
+    product_id = Column(Integer, ForeignKey('products.id', ondelete='CASCADE'), nullable=False, comment='제품 ID')
+    company_id = Column(Integer, ForeignKey('companies.id'), nullable=False, comment='회사 ID')
+    quantity = Column(Integer, nullable=False, comment='변동 수량 (입고 +, 출고 -)')
+    movement_type = Column(String(20), nullable=False, comment='변동 유형')
+    reference_id = Column(Integer, comment='관련 판매/구매 ID')
+    created_by = Column(Integer, ForeignKey('users.id'), comment='처리자')
+    created_at = Column(DateTime, default=datetime.now, nullable=False, comment='변동일시')
+    
+    # 제품별 원장 범위 조회용 인덱스 (스냅샷 이후 변동분 합산)
+    __table_args__ = (
+        Index('idx_inventory_movements_product_id', 'product_id', 'id'),
+    )
+    
+    # Relationships
+    product = relationship("Product")
+    
+    def __repr__(self):
+        return f"<InventoryMovement(id={self.id}, product_id={self.product_id}, quantity={self.quantity}, type='{self.movement_type}')>"
+
+class InventorySnapshot(Base):
+    """제품별 재고 스냅샷 (특정 시점의 재고와 마지막 반영된 원장 ID)"""
+    __tablename__ = 'inventory_snapshots'
+    
+    id = Column(Integer, primary_key=True)
+    product_id = Column(Integer, ForeignKey('products.id', ondelete='CASCADE'), nullable=False, comment='제품 ID')
+    company_id = Column(Integer, ForeignKey('companies.id'), nullable=False, comment='회사 ID')
+    stock = Column(Integer, nullable=False, comment='스냅샷 시점 재고')
+    last_movement_id = Column(Integer, comment='스냅샷에 반영된 마지막 원장 ID')
+    snapshot_at = Column(DateTime, default=datetime.now, nullable=False, comment='스냅샷 일시')
+    
+    # 제품별 최근 스냅샷 조회용 인덱스
+    __table_args__ = (
+        Index('idx_inventory_snapshots_product_at', 'product_id', 'snapshot_at'),
+    )
+    
+    def __repr__(self):
+        return f"<InventorySnapshot(product_id={self.product_id}, stock={self.stock}, at={self.snapshot_at})>"
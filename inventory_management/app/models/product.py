@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .base import Base
@@ -22,6 +22,11 @@ class Product(Base):
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, comment='수정일시')
     company_id = Column(Integer, ForeignKey('companies.id'), nullable=False, comment='회사 ID')
     
+    # 회사별 제품 목록 조회용 인덱스 (company_id 단독 조건도 이 인덱스의 앞부분으로 처리)
+    __table_args__ = (
+        Index('idx_products_company_created', 'company_id', 'created_at'),
+    )
+    
     # Relationships
     company = relationship("Company", back_populates="products")
     purchases = relationship("PurchaseInfo", back_populates="product", 
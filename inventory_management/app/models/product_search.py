@@ -0,0 +1,318 @@
+from sqlalchemy import (
+    DDL, event, text, Integer, Float, Column, String, ForeignKey, Index,
+    select, insert, delete, func, inspect, literal
+)
+from sqlalchemy.orm import aliased
+
+from .base import Base
+from .product import Product
+
+# 제품 전문 검색(FTS5) 테이블
+# products 테이블을 외부 콘텐츠로 사용하며 트리거로 동기화합니다.
+# 재고 수량 변경처럼 검색 컬럼과 무관한 UPDATE는 트리거를 실행하지 않습니다.
+# trigram 토크나이저로 단어 중간의 부분 문자열도 찾음 (예: '김치' -> '배추김치', SQLite 3.34 이상)
+PRODUCT_FTS_TABLE = 'products_fts'
+PRODUCT_FTS_TOKENIZER = 'trigram'
+
+# trigram 색인으로 찾을 수 있는 최소 검색어 길이 (짧은 단어는 검색 키의 1~2글자 조각으로 검색)
+FTS_MIN_TERM_LENGTH = 3
+
+PRODUCT_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS products_fts USING fts5(
+        name, code, brand, model, description,
+        content='products', content_rowid='id',
+        tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_ai AFTER INSERT ON products BEGIN
+        INSERT INTO products_fts(rowid, name, code, brand, model, description)
+        VALUES (new.id, new.name, new.code, new.brand, new.model, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_ad AFTER DELETE ON products BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, code, brand, model, description)
+        VALUES ('delete', old.id, old.name, old.code, old.brand, old.model, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS products_fts_au AFTER UPDATE OF name, code, brand, model, description ON products BEGIN
+        INSERT INTO products_fts(products_fts, rowid, name, code, brand, model, description)
+        VALUES ('delete', old.id, old.name, old.code, old.brand, old.model, old.description);
+        INSERT INTO products_fts(rowid, name, code, brand, model, description)
+        VALUES (new.id, new.name, new.code, new.brand, new.model, new.description);
+    END
+    """,
+]
+
+# 기존 제품 데이터로 검색 색인 재구성
+PRODUCT_FTS_REBUILD = "INSERT INTO products_fts(products_fts) VALUES ('rebuild')"
+
+# bm25 컬럼 가중치 (상품명 > 상품코드 > 브랜드/모델 > 설명)
+PRODUCT_FTS_RANK = f"bm25({PRODUCT_FTS_TABLE}, 10.0, 5.0, 3.0, 3.0, 1.0)"
+
+# products 테이블 생성 직후 검색 테이블과 트리거 생성 (SQLite 전용)
+for _statement in PRODUCT_FTS_DDL:
+    event.listen(Product.__table__, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+
+def ensure_product_search_index(connection):
+    """검색 테이블과 트리거가 없거나 토크나이저가 다르면 생성하고 색인을 재구성"""
+    if connection.dialect.name == 'sqlite':
+        row = connection.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (PRODUCT_FTS_TABLE,)
+        ).first()
+        if row is not None and PRODUCT_FTS_TOKENIZER not in row[0]:
+            # 이전 토크나이저(unicode61)로 만든 색인은 삭제 후 다시 생성
+            connection.exec_driver_sql(f"DROP TABLE {PRODUCT_FTS_TABLE}")
+            row = None
+        for statement in PRODUCT_FTS_DDL:
+            connection.exec_driver_sql(statement)
+        if row is None:
+            connection.exec_driver_sql(PRODUCT_FTS_REBUILD)
+    
+    # 부분 문자열 검색 키가 없으면 (이전 버전 DB 포함) 기존 제품으로 전체 검색 키 생성
+    gram_key = select(ProductSearchKey.id).where(ProductSearchKey.kind == SEARCH_KEY_GRAM).limit(1)
+    if connection.execute(gram_key).first() is None:
+        rebuild_product_search_keys(connection)
+
+def build_fts_query(search: str):
+    """사용자 검색어를 FTS5 MATCH 구문으로 변환 (3글자 이상 단어를 부분 문자열 검색, AND 조건)"""
+    terms = [term.replace('"', '""') for term in search.split() if len(term) >= FTS_MIN_TERM_LENGTH]
+    if not terms:
+        return None
+    return ' '.join(f'"{term}"' for term in terms)
+
+def fts_match_subquery(fts_query: str, name: str = 'matches'):
+    """검색어와 일치하는 제품 ID와 bm25 점수(낮을수록 관련도 높음) 서브쿼리"""
+    return text(
+        f"SELECT rowid AS id, {PRODUCT_FTS_RANK} AS rank "
+        f"FROM {PRODUCT_FTS_TABLE} WHERE {PRODUCT_FTS_TABLE} MATCH :fts_query"
+    ).bindparams(fts_query=fts_query).columns(id=Integer, rank=Float).subquery(name)
+
+def _gram_match(term: str, company_id=None):
+    """짧은 검색어(1~2글자)를 포함하는 제품 ID 조회 (부분 문자열 검색 키 접두어 범위)"""
+    keys = aliased(ProductSearchKey)
+    query = select(keys.product_id).where(
+        keys.kind == SEARCH_KEY_GRAM,
+        keys.key >= term,
+        keys.key < term + '\uffff'
+    )
+    if company_id is not None:
+        query = query.where(keys.company_id == company_id)
+    return query
+
+def product_match_subquery(search: str, company_id=None):
+    """
+    검색어와 일치하는 제품 ID와 순위 서브쿼리 (일치하는 제품이 없으면 빈 결과, 검색어가 비었으면 None)
+    
+    3글자 이상 단어는 trigram 색인으로 찾고, 색인으로 찾을 수 없는 1~2글자 단어(예: '김치')는
+    부분 문자열 검색 키(단어별 1~2글자 조각) 색인으로 찾습니다. 짧은 단어만 있으면 순위는 모두 같습니다.
+    """
+    short_terms = [term.lower() for term in search.split() if len(term) < FTS_MIN_TERM_LENGTH]
+    fts_query = build_fts_query(search)
+    if fts_query and not short_terms:
+        return fts_match_subquery(fts_query)
+    
+    if fts_query:
+        fts_matches = fts_match_subquery(fts_query, 'fts_matches')
+        query = select(fts_matches.c.id, fts_matches.c.rank)
+        id_column = fts_matches.c.id
+    elif short_terms:
+        first = _gram_match(short_terms.pop(0), company_id).subquery('gram_matches')
+        query = select(first.c.product_id.label('id'), literal(0.0, Float).label('rank')) \
+            .group_by(first.c.product_id)
+        id_column = first.c.product_id
+    else:
+        return None
+    
+    for term in short_terms:
+        query = query.where(id_column.in_(_gram_match(term, company_id)))
+    return query.subquery('matches')
+
+
+# ---------------------------------------------------------------------------
+# 한글 초성 / 자모 분해 검색
+# ---------------------------------------------------------------------------
+
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+
+CHOSUNG = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ',
+           'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+JUNGSUNG = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ', 'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ',
+            'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ']
+JONGSUNG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ',
+            'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 겹모음/겹받침은 입력 중인 글자와 접두어가 맞도록 기본 자모로 분해
+COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+
+# 한글 호환 자모 범위 (ㄱ ~ ㅣ)
+JAMO_START = 0x3131
+JAMO_END = 0x3163
+
+# 검색 키 종류
+SEARCH_KEY_CHOSUNG = 'c'
+SEARCH_KEY_JAMO = 'j'
+SEARCH_KEY_GRAM = 'g'
+
+# 부분 문자열 검색 키 길이 (trigram 색인으로 찾을 수 없는 짧은 검색어용)
+SEARCH_GRAM_LENGTH = FTS_MIN_TERM_LENGTH - 1
+
+# 검색 키 최대 길이
+SEARCH_KEY_MAX_LENGTH = 100
+
+def _is_hangul_syllable(char: str) -> bool:
+    return HANGUL_BASE <= ord(char) <= HANGUL_END
+
+def _is_jamo(char: str) -> bool:
+    return JAMO_START <= ord(char) <= JAMO_END
+
+def _normalize(value: str) -> str:
+    """공백/기호 제거 및 소문자 변환"""
+    return ''.join(char.lower() for char in value if char.isalnum())
+
+def get_chosung(value: str) -> str:
+    """초성 문자열 추출 (예: '김치' -> 'ㄱㅊ'), 한글 이외 문자는 소문자로 유지"""
+    result = []
+    for char in _normalize(value):
+        if _is_hangul_syllable(char):
+            result.append(CHOSUNG[(ord(char) - HANGUL_BASE) // 588])
+        else:
+            result.append(char)
+    return ''.join(result)
+
+def decompose_jamo(value: str) -> str:
+    """자모 분해 문자열 생성 (예: '김치' -> 'ㄱㅣㅁㅊㅣ')"""
+    result = []
+    for char in _normalize(value):
+        if _is_hangul_syllable(char):
+            offset = ord(char) - HANGUL_BASE
+            parts = (CHOSUNG[offset // 588], JUNGSUNG[(offset % 588) // 28], JONGSUNG[offset % 28])
+            result.extend(COMPOUND_JAMO.get(part, part) for part in parts)
+        else:
+            result.append(COMPOUND_JAMO.get(char, char))
+    return ''.join(result)
+
+def is_jamo_query(search: str) -> bool:
+    """초성/자모가 포함된 검색어인지 확인 (예: 'ㄱㅊ', '김ㅊ')"""
+    return any(_is_jamo(char) for char in search)
+
+def build_search_keys(*values) -> set:
+    """제품명/브랜드의 단어 시작 위치별 초성 키와 자모 키 생성"""
+    keys = set()
+    for value in values:
+        if not value:
+            continue
+        words = value.split()
+        for i in range(len(words)):
+            suffix = ''.join(words[i:])
+            for kind, key in ((SEARCH_KEY_CHOSUNG, get_chosung(suffix)),
+                              (SEARCH_KEY_JAMO, decompose_jamo(suffix))):
+                if key:
+                    keys.add((kind, key[:SEARCH_KEY_MAX_LENGTH]))
+    return keys
+
+def build_gram_keys(*values) -> set:
+    """단어별 1~2글자 조각 생성 (예: '배추김치' -> 배추, 추김, 김치, 치), 짧은 검색어는 조각의 접두어와 일치"""
+    keys = set()
+    for value in values:
+        if not value:
+            continue
+        for word in value.lower().split():
+            keys.update(word[i:i + SEARCH_GRAM_LENGTH] for i in range(len(word)))
+    return keys
+
+class ProductSearchKey(Base):
+    """제품 초성/자모/부분 문자열 검색 키 (접두어 범위 검색용 보조 색인)"""
+    __tablename__ = 'product_search_keys'
+    
+    id = Column(Integer, primary_key=True)
+    product_id = Column(Integer, ForeignKey('products.id', ondelete='CASCADE'), nullable=False, comment='제품 ID')
+    company_id = Column(Integer, nullable=False, comment='회사 ID')
+    kind = Column(String(1), nullable=False, comment='키 종류 (c: 초성, j: 자모, g: 부분 문자열 조각)')
+    key = Column(String(SEARCH_KEY_MAX_LENGTH), nullable=False, comment='검색 키')
+    
+    __table_args__ = (
+        # 종류 + 키 접두어 범위 검색 후 회사/제품 ID까지 색인에서 바로 읽음
+        Index('idx_product_search_keys_lookup', 'kind', 'key', 'company_id', 'product_id'),
+        Index('idx_product_search_keys_product', 'product_id'),
+    )
+
+# 검색 키를 만드는 제품 컬럼 (초성/자모는 상품명/브랜드, 부분 문자열 조각은 FTS 색인 컬럼 전체)
+SEARCH_KEY_COLUMNS = ('name', 'code', 'brand', 'model', 'description')
+
+def _search_key_rows(product_id: int, company_id: int, name: str, code: str, brand: str,
+                     model: str, description: str) -> list:
+    keys = build_search_keys(name, brand)
+    keys.update((SEARCH_KEY_GRAM, key) for key in build_gram_keys(name, code, brand, model, description))
+    return [
+        {'product_id': product_id, 'company_id': company_id, 'kind': kind, 'key': key}
+        for kind, key in keys
+    ]
+
+def rebuild_product_search_keys(connection, product_ids=None, chunk_size: int = 10000):
+    """제품 초성/자모/부분 문자열 검색 키 재생성 (대량 등록 후 또는 마이그레이션 시 사용)"""
+    query = select(Product.id, Product.company_id, *(getattr(Product, column) for column in SEARCH_KEY_COLUMNS))
+    if product_ids is not None:
+        product_ids = list(product_ids)
+        if not product_ids:
+            return
+        connection.execute(delete(ProductSearchKey).where(ProductSearchKey.product_id.in_(product_ids)))
+        query = query.where(Product.id.in_(product_ids))
+    else:
+        connection.execute(delete(ProductSearchKey))
+    
+    rows = []
+    for product_id, company_id, *values in connection.execute(query):
+        rows.extend(_search_key_rows(product_id, company_id, *values))
+        if len(rows) >= chunk_size:
+            connection.execute(insert(ProductSearchKey), rows)
+            rows = []
+    if rows:
+        connection.execute(insert(ProductSearchKey), rows)
+
+@event.listens_for(Product, 'after_insert')
+def _insert_search_keys(mapper, connection, target):
+    rows = _search_key_rows(target.id, target.company_id,
+                            *(getattr(target, column) for column in SEARCH_KEY_COLUMNS))
+    if rows:
+        connection.execute(insert(ProductSearchKey), rows)
+
+@event.listens_for(Product, 'after_update')
+def _update_search_keys(mapper, connection, target):
+    state = inspect(target)
+    if not any(state.attrs[attr].history.has_changes() for attr in (*SEARCH_KEY_COLUMNS, 'company_id')):
+        return
+    connection.execute(delete(ProductSearchKey).where(ProductSearchKey.product_id == target.id))
+    _insert_search_keys(mapper, connection, target)
+
+@event.listens_for(Product, 'after_delete')
+def _delete_search_keys(mapper, connection, target):
+    connection.execute(delete(ProductSearchKey).where(ProductSearchKey.product_id == target.id))
+
+def jamo_match_subquery(search: str, company_id=None):
+    """초성/자모 접두어와 일치하는 제품 ID와 순위(남은 글자 수가 적을수록 우선) 서브쿼리"""
+    prefix = search.replace(' ', '')
+    if all(char in CHOSUNG for char in prefix):
+        kind = SEARCH_KEY_CHOSUNG
+    else:
+        kind, prefix = SEARCH_KEY_JAMO, decompose_jamo(prefix)
+    
+    query = select(
+        ProductSearchKey.product_id.label('id'),
+        func.min(func.length(ProductSearchKey.key)).label('rank')
+    ).where(
+        ProductSearchKey.kind == kind,
+        ProductSearchKey.key >= prefix,
+        ProductSearchKey.key < prefix + '\uffff'
+    )
+    if company_id is not None:
+        query = query.where(ProductSearchKey.company_id == company_id)
+    return query.group_by(ProductSearchKey.product_id).subquery('matches')
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, Text, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .base import Base
@@ -51,6 +51,12 @@ class PurchaseInfo(Base):
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, comment='수정일시')
     created_by = Column(Integer, ForeignKey('users.id'), comment='생성자')
     
+    # 구매 목록 (구매일, ID) 정렬 및 제품별 구매 조회용 인덱스
+    __table_args__ = (
+        Index('idx_purchase_infos_purchase_date', 'purchase_date'),
+        Index('idx_purchase_infos_product_date', 'product_id', 'purchase_date'),
+    )
+    
     # Relationships
     product = relationship("Product", back_populates="purchases")
     creator = relationship("User")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Text, Enum
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from .base import Base
 from datetime import datetime
@@ -40,6 +40,12 @@ class SaleRecord(Base):
     payment_status = Column(String(20), default='unpaid')  # 'paid', 'unpaid', 'partial'
     notes = Column(Text)
     
+    # 판매 목록 (판매일, ID) 정렬 및 제품별 판매 조회용 인덱스
+    __table_args__ = (
+        Index('idx_sale_records_sale_date', 'sale_date'),
+        Index('idx_sale_records_product_date', 'product_id', 'sale_date'),
+    )
+    
     # Relationships
     product = relationship("Product", back_populates="sale_records")
     
@@ -53,14 +59,14 @@ class SaleRecord(Base):
             self.total_price = self.quantity * self.unit_price
     
     def update_inventory(self, session):
-        """판매 시 재고 업데이트"""
-        if self.product:
-            if self.product.current_stock >= self.quantity:
-                self.product.current_stock -= self.quantity
-                session.add(self.product)
-                return True
+        """판매 시 재고 업데이트 (재고 원장 기록 포함)"""
+        from app.models.inventory_movement import MovementType
+        from app.utils.stock import decrease_stock
+        
+        if self.product_id is None:
             return False
-        return False
+        return decrease_stock(session, self.product_id, self.quantity, MovementType.SALE,
+                              reference_id=self.id)
     
     def __repr__(self):
         return f"<SaleRecord(id={self.id}, product_id={self.product_id}, quantity={self.quantity}, total={self.total_price})>"
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey, Date, Index, UniqueConstraint
+from .base import Base
+
+class SalesDaily(Base):
+    """일별 판매 집계 (회사/제품/일 단위, 판매 등록/수정/삭제 시 증분 갱신)"""
+    __tablename__ = 'sales_daily'
+    
+    id = Column(Integer, primary_key=True)
+    company_id = Column(Integer, ForeignKey('companies.id'), nullable=False, comment='회사 ID')
+    product_id = Column(Integer, ForeignKey('products.id', ondelete='CASCADE'), nullable=False, comment='제품 ID')
+    sale_date = Column(Date, nullable=False, comment='판매일')
+    quantity = Column(Integer, default=0, nullable=False, comment='판매 수량 합계')
+    revenue = Column(Float, default=0.0, nullable=False, comment='매출 합계')
+    sale_count = Column(Integer, default=0, nullable=False, comment='판매 건수')
+    
+    __table_args__ = (
+        UniqueConstraint('company_id', 'product_id', 'sale_date', name='uq_sales_daily_key'),
+        # 회사별 기간 통계를 테이블 조회 없이 처리하는 커버링 인덱스
+        Index('idx_sales_daily_company_date', 'company_id', 'sale_date', 'product_id',
+              'quantity', 'revenue', 'sale_count'),
+    )
+    
+    def __repr__(self):
+        return f"<SalesDaily(company_id={self.company_id}, product_id={self.product_id}, date={self.sale_date}, revenue={self.revenue})>"
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, Integer, Float, ForeignKey, Date, Index, UniqueConstraint
+from .base import Base
+
+class SalesMonthly(Base):
+    """월별 판매 집계 (회사/제품/월 단위, 일별 집계와 함께 증분 갱신되며 월/연 통계에 사용)"""
+    __tablename__ = 'sales_monthly'
+    
+    id = Column(Integer, primary_key=True)
+    company_id = Column(Integer, ForeignKey('companies.id'), nullable=False, comment='회사 ID')
+    product_id = Column(Integer, ForeignKey('products.id', ondelete='CASCADE'), nullable=False, comment='제품 ID')
+    sale_month = Column(Date, nullable=False, comment='판매월 (매월 1일)')
+    quantity = Column(Integer, default=0, nullable=False, comment='판매 수량 합계')
+    revenue = Column(Float, default=0.0, nullable=False, comment='매출 합계')
+    sale_count = Column(Integer, default=0, nullable=False, comment='판매 건수')
+    
+    __table_args__ = (
+        UniqueConstraint('company_id', 'product_id', 'sale_month', name='uq_sales_monthly_key'),
+        # 회사별 기간 통계를 테이블 조회 없이 처리하는 커버링 인덱스
+        Index('idx_sales_monthly_company_month', 'company_id', 'sale_month', 'product_id',
+              'quantity', 'revenue', 'sale_count'),
+    )
+    
+    def __repr__(self):
+        return f"<SalesMonthly(company_id={self.company_id}, product_id={self.product_id}, month={self.sale_month}, revenue={self.revenue})>"
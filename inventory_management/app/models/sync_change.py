@@ -0,0 +1,132 @@
+from sqlalchemy import DDL, event, Column, Integer, String, Boolean, DateTime, Index, func
+
+from .base import Base
+
+# 변경 로그 (증분 동기화용)
+# 대상 테이블의 INSERT/UPDATE/DELETE 트리거가 (테이블, 행 ID, 회사 ID)마다 한 건을 새 순번으로 교체하므로
+# 테이블 크기는 대상 행 수(삭제된 행과 다른 회사로 옮겨진 행의 툼스톤 포함)에 비례합니다.
+# 행의 회사가 바뀌면 이전 회사 키에는 툼스톤을 남겨 이전 회사 클라이언트에서도 행이 사라지게 합니다.
+# Core INSERT/UPDATE(대량 등록, 재고 차감 등)도 트리거로 기록되며,
+# SQLite는 쓰기를 직렬화하므로 커밋된 순번 사이에 나중에 채워지는 빈 번호가 생기지 않습니다.
+SYNC_CHANGE_TABLE = 'sync_changes'
+
+# 대상 테이블 -> 행의 회사 ID 식 (new/old는 트리거에서 치환)
+SYNC_TABLES = {
+    'products': "{row}.company_id",
+    'sale_records': "(SELECT company_id FROM products WHERE id = {row}.product_id)",
+    'purchase_infos': "(SELECT company_id FROM products WHERE id = {row}.product_id)",
+    'users': "{row}.company_id",
+    'companies': "{row}.id",
+}
+
+# 회사를 상위 행에서 가져오는 테이블 (상위 테이블 -> (하위 테이블, 상위 행 ID 컬럼))
+# 상위 행의 회사가 바뀌면 하위 행도 이전 회사 툼스톤 + 새 회사 변경으로 기록
+SYNC_DEPENDENTS = {
+    'products': (('sale_records', 'product_id'), ('purchase_infos', 'product_id')),
+}
+
+# (테이블, 행 ID, 회사 ID) 고유 인덱스 이름 (회사가 없는 행은 0으로 취급)
+SYNC_ROW_INDEX = 'uq_sync_changes_row_company'
+
+class SyncChange(Base):
+    """행 변경 로그 (순번이 동기화 토큰, deleted=True는 툼스톤)"""
+    __tablename__ = SYNC_CHANGE_TABLE
+    
+    seq = Column(Integer, primary_key=True, comment='변경 순번')
+    entity = Column(String(30), nullable=False, comment='대상 테이블')
+    row_id = Column(Integer, nullable=False, comment='대상 행 ID')
+    company_id = Column(Integer, comment='회사 ID')
+    deleted = Column(Boolean, default=False, nullable=False, comment='삭제 여부')
+    changed_at = Column(DateTime, default=func.now(), nullable=False, comment='변경일시')
+    
+    __table_args__ = (
+        Index(SYNC_ROW_INDEX, 'entity', 'row_id', func.ifnull(company_id, 0), unique=True),
+        # (대상, 회사) / 대상별 순번 범위 조회 (SQLite 인덱스에는 rowid(seq)가 포함되어 순번 정렬도 처리)
+        Index('idx_sync_changes_entity_company', 'entity', 'company_id'),
+        Index('idx_sync_changes_entity', 'entity'),
+        {'sqlite_autoincrement': True},  # 삭제된 순번을 재사용하지 않도록 함
+    )
+    
+    def __repr__(self):
+        return f"<SyncChange(seq={self.seq}, entity='{self.entity}', row_id={self.row_id}, deleted={self.deleted})>"
+
+_RECORD = (
+    "INSERT OR REPLACE INTO sync_changes(entity, row_id, company_id, deleted, changed_at) "
+    "SELECT '{table}', {row_id}, {company}, {deleted}, CURRENT_TIMESTAMP{source};"
+)
+
+def _trigger_ddl(table: str, company_expr: str) -> list:
+    new_company, old_company = company_expr.format(row='new'), company_expr.format(row='old')
+    moved = f" WHERE {old_company} IS NOT {new_company}"
+    
+    # UPDATE: 회사가 바뀌었으면 이전 회사에 툼스톤을 남긴 뒤 새 회사에 변경 기록
+    update = _RECORD.format(table=table, row_id='old.id', company=old_company, deleted=1, source=moved)
+    update += _RECORD.format(table=table, row_id='new.id', company=new_company, deleted=0, source='')
+    for dependent, parent_column in SYNC_DEPENDENTS.get(table, ()):
+        source = f" FROM {dependent} WHERE {parent_column} = new.id AND old.company_id IS NOT new.company_id"
+        update += _RECORD.format(table=dependent, row_id='id', company='old.company_id', deleted=1, source=source)
+        update += _RECORD.format(table=dependent, row_id='id', company='new.company_id', deleted=0, source=source)
+    
+    statements = []
+    for suffix, timing, body in (
+        ('ai', 'INSERT', _RECORD.format(table=table, row_id='new.id', company=new_company, deleted=0, source='')),
+        ('au', 'UPDATE', update),
+        ('ad', 'DELETE', _RECORD.format(table=table, row_id='old.id', company=old_company, deleted=1, source='')),
+    ):
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_sync_{suffix} AFTER {timing} ON {table} BEGIN {body} END"
+        )
+    return statements
+
+SYNC_TRIGGER_DDL = [
+    statement for table, company_expr in SYNC_TABLES.items() for statement in _trigger_ddl(table, company_expr)
+]
+
+# 기존 행을 변경 로그에 등록 (변경 로그 도입 전 데이터)
+SYNC_BACKFILL = [
+    f"INSERT OR IGNORE INTO sync_changes(entity, row_id, company_id, deleted, changed_at) "
+    f"SELECT '{table}', id, {company_expr.format(row=table)}, 0, CURRENT_TIMESTAMP FROM {table} ORDER BY id"
+    for table, company_expr in SYNC_TABLES.items()
+]
+
+# 모든 테이블 생성 후 변경 기록 트리거 생성 (SQLite 전용)
+for _statement in SYNC_TRIGGER_DDL:
+    event.listen(Base.metadata, 'after_create', DDL(_statement).execute_if(dialect='sqlite'))
+
+def upgrade_sync_log(connection):
+    """
+    행마다 한 건이던 이전 변경 로그를 (테이블, 행 ID, 회사 ID) 키로 변환하고 트리거를 다시 생성
+    
+    기존 순번은 그대로 유지하므로 클라이언트의 동기화 토큰은 계속 사용할 수 있습니다.
+    """
+    if connection.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (SYNC_ROW_INDEX,)
+    ).first():
+        return
+    for table in SYNC_TABLES:
+        for suffix in ('ai', 'au', 'ad'):
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {table}_sync_{suffix}")
+    
+    # 인라인 UNIQUE 제약은 삭제할 수 없으므로 테이블을 새로 만들어 복사
+    connection.exec_driver_sql("DROP INDEX IF EXISTS idx_sync_changes_entity_company")
+    connection.exec_driver_sql("DROP INDEX IF EXISTS idx_sync_changes_entity")
+    connection.exec_driver_sql(f"ALTER TABLE {SYNC_CHANGE_TABLE} RENAME TO {SYNC_CHANGE_TABLE}_old")
+    SyncChange.__table__.create(connection)
+    connection.exec_driver_sql(
+        f"INSERT INTO {SYNC_CHANGE_TABLE}(seq, entity, row_id, company_id, deleted, changed_at) "
+        f"SELECT seq, entity, row_id, company_id, deleted, changed_at FROM {SYNC_CHANGE_TABLE}_old ORDER BY seq"
+    )
+    connection.exec_driver_sql(f"DROP TABLE {SYNC_CHANGE_TABLE}_old")
+    for statement in SYNC_TRIGGER_DDL:
+        connection.exec_driver_sql(statement)
+
+def ensure_sync_log(connection):
+    """변경 기록 트리거가 없으면 생성하고, 변경 로그가 비어 있으면 기존 행으로 채움"""
+    if connection.dialect.name != 'sqlite':
+        return
+    upgrade_sync_log(connection)
+    for statement in SYNC_TRIGGER_DDL:
+        connection.exec_driver_sql(statement)
+    if connection.exec_driver_sql("SELECT 1 FROM sync_changes LIMIT 1").first() is None:
+        for statement in SYNC_BACKFILL:
+            connection.exec_driver_sql(statement)
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, DateTime, func
+from .base import Base
+
+class SystemSetting(Base):
+    """서버 공통 설정 (같은 DB를 쓰는 모든 서버가 같은 값을 사용)"""
+    __tablename__ = 'system_settings'
+    
+    key = Column(String(50), primary_key=True, comment='설정 이름')
+    value = Column(String(200), nullable=False, comment='설정 값')
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False, comment='수정일시')
+    
+    def __repr__(self):
+        return f"<SystemSetting(key={self.key}, value={self.value})>"
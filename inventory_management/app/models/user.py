@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 
@@ -18,6 +18,11 @@ class User(BaseModel):
     company_id = Column(Integer, ForeignKey('companies.id'), nullable=True)
     is_active = Column(Boolean, default=True, nullable=False)
     
+    # 회사별 활성 사용자 목록 (생성일자 최신순) 조회용 인덱스
+    __table_args__ = (
+        Index('idx_users_company_active_created', 'company_id', 'is_active', 'created_at'),
+    )
+    
     # Relationships
     company = relationship("Company", back_populates="users")
     
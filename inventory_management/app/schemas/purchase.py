@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime, date
 
 class PurchaseBase(BaseModel):
@@ -39,6 +39,39 @@ class PurchaseCreate(PurchaseBase):
     """구매 생성 스키마"""
     pass
 
+class PurchaseReceiptLine(BaseModel):
+    """입고 품목 스키마"""
+    product_id: int
+    quantity: int = Field(..., gt=0)
+    unit_price: float = Field(..., gt=0)
+    tax_rate: float = Field(10.0, ge=0, le=100)
+    tax_included: bool = Field(True, description="부가세 포함 여부")
+    discount: float = Field(0.0, ge=0)
+    notes: Optional[str] = None
+
+class PurchaseReceipt(BaseModel):
+    """일괄 입고 스키마 (공급업체/송장 정보는 모든 품목에 공통 적용)"""
+    supplier_name: str = Field(..., max_length=100)
+    business_number: Optional[str] = Field(None, max_length=20)
+    supplier_contact: Optional[str] = Field(None, max_length=100)
+    supplier_address: Optional[str] = None
+    supplier_phone: Optional[str] = Field(None, max_length=20)
+    supplier_email: Optional[str] = Field(None, max_length=100)
+    invoice_number: Optional[str] = Field(None, max_length=50)
+    purchase_date: datetime = Field(default_factory=datetime.now)
+    expected_delivery_date: Optional[date] = None
+    actual_delivery_date: Optional[date] = None
+    payment_terms: Optional[str] = Field(None, max_length=50)
+    payment_due_date: Optional[date] = None
+    payment_status: str = Field("unpaid", max_length=20)
+    payment_method: Optional[str] = Field(None, max_length=50)
+    notes: Optional[str] = None
+    lines: List[PurchaseReceiptLine] = Field(..., min_length=1, max_length=5000)
+
+    @field_validator('payment_status')
+    def validate_payment_status(cls, v):
+        return PurchaseBase.validate_payment_status(v)
+
 class PurchaseUpdate(BaseModel):
     """구매 업데이트 스키마"""
     supplier_name: Optional[str] = Field(None, max_length=100)
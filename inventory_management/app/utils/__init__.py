@@ -5,11 +5,121 @@
 from .auth import (
     verify_password,
     get_password_hash,
+    verify_password_and_rehash,
+    hash_password,
     authenticate_user,
+    authenticate_user_async,
     create_access_token,
+    access_token_claims,
     get_current_user,
     get_current_active_user,
+    get_current_user_async,
+    get_current_active_user_async,
     check_admin,
     check_super_admin,
     oauth2_scheme
 )
+
+# 비밀번호 해시 스레드풀 임포트
+from .password_pool import (
+    PasswordPool,
+    password_pool
+)
+
+# 비밀번호 해시 비용 유틸리티 임포트
+from .password_cost import (
+    calibrate_bcrypt_rounds,
+    bcrypt_rounds,
+    shared_bcrypt_rounds,
+    hash_rounds,
+    needs_rehash
+)
+
+# 인증 사용자 캐시 임포트
+from .principal_cache import (
+    Principal,
+    principal_cache,
+    mark_user_changed
+)
+
+# 재고 관련 유틸리티 임포트
+from .stock import (
+    decrease_stock,
+    increase_stock,
+    adjust_stock,
+    set_stock,
+    record_movement,
+    decrease_stock_many,
+    increase_stock_many,
+    record_movements,
+    create_stock_snapshots,
+    get_stock_as_of
+)
+
+# 페이지네이션 유틸리티 임포트
+from .pagination import (
+    encode_cursor,
+    decode_cursor,
+    paginate,
+    split_page
+)
+
+# SQL 계측 유틸리티 임포트
+from .sql_metrics import (
+    install_sql_metrics,
+    sql_metrics_middleware,
+    get_sql_metrics,
+    reset_sql_metrics
+)
+
+# 판매 집계 유틸리티 임포트
+from .sales_rollup import (
+    add_sale_to_rollup,
+    remove_sale_from_rollup,
+    remove_product_from_rollup,
+    update_sale_in_rollup,
+    rebuild_sales_daily,
+    sales_summary_query
+)
+
+# 판매 통계 캐시 임포트
+from .stats_cache import (
+    sales_stats_cache,
+    mark_sales_changed,
+    mark_product_stats_changed
+)
+
+# 제품 대량 등록 유틸리티 임포트
+from .product_import import (
+    ProductImporter,
+    read_import_rows
+)
+
+# 판매 일괄 등록 유틸리티 임포트
+from .sale_batch import (
+    create_sales_batch,
+    validate_sale_batch
+)
+
+# 일괄 입고 유틸리티 임포트
+from .purchase_receipt import (
+    calculate_purchase_amounts,
+    receive_purchases
+)
+
+# 내보내기 유틸리티 임포트
+from .export import (
+    export_query,
+    export_response
+)
+
+# 증분 동기화 유틸리티 임포트
+from .sync import (
+    fetch_changes
+)
+
+# 재고 변경 이벤트 유틸리티 임포트
+from .stock_events import (
+    stock_event_hub,
+    mark_stock_changed
+)
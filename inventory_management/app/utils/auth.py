@@ -1,21 +1,29 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 import bcrypt
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app import get_db
+from app import get_db, get_async_db
 from app.models.user import User, USER_ROLES
 from app.schemas.token import TokenData
+from app.utils.password_cost import bcrypt_rounds, needs_rehash
+from app.utils.password_pool import password_pool
+from app.utils.principal_cache import Principal, principal_cache
 
 # 비밀 키 (실제 환경에서는 .env 파일에서 가져와야 함)
 SECRET_KEY = "your-secret-key-here"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# 인증 사용자 조회 시 읽는 컬럼 (권한 확인에 필요한 값만)
+_PRINCIPAL_COLUMNS = (User.id, User.username, User.role, User.company_id, User.is_active)
+
 # 비밀번호 해싱 설정
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
@@ -26,16 +34,54 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password)
 
 def get_password_hash(password: str) -> str:
-    """비밀번호 해시 생성"""
-    salt = bcrypt.gensalt()
+    """비밀번호 해시 생성 (모든 서버가 공유하는 비용 사용, 비용은 해시 문자열에 함께 저장됨)"""
+    salt = bcrypt.gensalt(rounds=bcrypt_rounds())
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
+def verify_password_and_rehash(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 후 (일치 여부, 새 해시) 반환
+    
+    일치하고 저장된 해시의 비용이 현재 비용보다 낮으면 현재 비용으로 다시 만든 해시를 함께 반환합니다.
+    """
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if needs_rehash(hashed_password):
+        return True, get_password_hash(plain_password)
+    return True, None
+
+def hash_password(password: str) -> str:
+    """비밀번호 해시 생성 (비밀번호 전용 스레드풀에서 실행, 동기 엔드포인트용)"""
+    return password_pool.call(get_password_hash, password)
+
 def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
     """사용자 인증"""
     user = db.query(User).filter(User.username == username).first()
-    if not user or not verify_password(password, user.password_hash):
+    if not user:
+        return None
+    verified, new_hash = password_pool.call(verify_password_and_rehash, password, user.password_hash)
+    if not verified:
+        return None
+    if new_hash:
+        # 비용이 낮은 해시는 로그인 성공 시 현재 비용으로 교체
+        user.password_hash = new_hash
+        db.commit()
+    return user
+
+async def authenticate_user_async(db: AsyncSession, username: str, password: str) -> Optional[User]:
+    """사용자 인증 (비동기 세션 사용, 비밀번호 검증 중 이벤트 루프를 막지 않음)"""
+    result = await db.execute(select(User).where(User.username == username))
+    user = result.scalars().first()
+    if not user:
         return None
+    verified, new_hash = await password_pool.run(verify_password_and_rehash, password, user.password_hash)
+    if not verified:
+        return None
+    if new_hash:
+        # 비용이 낮은 해시는 로그인 성공 시 현재 비용으로 교체
+        user.password_hash = new_hash
+        await db.commit()
     return user
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -45,42 +91,107 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    """현재 인증된 사용자 가져오기"""
-    credentials_exception = HTTPException(
+def access_token_claims(user: User) -> dict:
+    """로그인 토큰 클레임 (사용자명 + 권한 확인용 사용자 ID/역할/회사/활성 여부)"""
+    return {"sub": user.username, **Principal.from_row(user).claims()}
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def _decode_payload(token: str) -> dict:
+    """액세스 토큰 검증 후 페이로드 반환"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-        token_data = TokenData(username=username)
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+    if payload.get("sub") is None:
+        raise _credentials_exception()
+    return payload
+
+def decode_access_token(token: str) -> TokenData:
+    """액세스 토큰 검증 및 페이로드 추출"""
+    return TokenData(username=_decode_payload(token)["sub"])
+
+def _principal_from_claims(payload: dict) -> Optional[Principal]:
+    """
+    토큰 클레임으로 만든 사용자 정보
     
-    user = db.query(User).filter(User.username == token_data.username).first()
-    if user is None:
-        raise credentials_exception
-    return user
+    클레임이 없는 이전 토큰이거나, 토큰 발급 이후 사용자가 수정/삭제됐으면 None (DB 조회 필요)
+    """
+    username = payload["sub"]
+    if principal_cache.changed_since(username, payload.get("iat", 0)):
+        return None
+    return Principal.from_claims(username, payload)
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Principal:
+    """
+    현재 인증된 사용자 가져오기 (쓰기 요청용)
+    
+    토큰 클레임은 쓰지 않고 캐시 또는 DB의 현재 값으로 권한을 확인합니다.
+    전체 사용자 정보가 필요하면 반환된 id로 다시 조회해야 합니다.
+    """
+    username = decode_access_token(token).username
+    
+    principal, version = principal_cache.get(username)
+    if principal is None:
+        row = db.execute(select(*_PRINCIPAL_COLUMNS).where(User.username == username)).first()
+        if row is None:
+            raise _credentials_exception()
+        principal = Principal.from_row(row)
+        principal_cache.store(principal, version)
+    return principal
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """
+    현재 인증된 사용자 가져오기 (비동기 세션 사용, 조회 요청용)
+    
+    토큰에 권한 클레임이 있으면 DB를 조회하지 않고, 없거나 발급 후 사용자가 변경됐으면 캐시/DB에서 가져옵니다.
+    """
+    payload = _decode_payload(token)
+    principal = _principal_from_claims(payload)
+    if principal is not None:
+        return principal
+    
+    username = payload["sub"]
+    principal, version = principal_cache.get(username)
+    if principal is None:
+        row = (await db.execute(select(*_PRINCIPAL_COLUMNS).where(User.username == username))).first()
+        if row is None:
+            raise _credentials_exception()
+        principal = Principal.from_row(row)
+        principal_cache.store(principal, version)
+    return principal
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """활성화된 사용자 확인"""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
+async def get_current_active_user_async(
+    current_user: Principal = Depends(get_current_user_async)
+) -> Principal:
+    """활성화된 사용자 확인 (비동기 세션 사용)"""
+    if not current_user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return current_user
+
 def check_admin(user: User):
     """관리자 권한 확인"""
     if user.role not in ["admin", "super_admin"]:
@@ -0,0 +1,189 @@
+import csv
+import io
+import tempfile
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select, DateTime
+
+from app.models.product import Product
+from app.models.sale_record import SaleRecord
+from app.models.purchase_info import PurchaseInfo
+
+# DB에서 한 번에 가져올 행 수 (메모리에는 이 크기만큼만 유지)
+EXPORT_BATCH_SIZE = 2000
+
+# 응답 본문으로 내보낼 XLSX 파일 조각 크기
+XLSX_CHUNK_SIZE = 64 * 1024
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+
+# 대상별 내보낼 컬럼 (헤더, 컬럼) - 필요한 컬럼만 조회
+EXPORT_COLUMNS = {
+    'products': [
+        ('ID', Product.id),
+        ('상품코드', Product.code),
+        ('상품명', Product.name),
+        ('분류', Product.category),
+        ('브랜드', Product.brand),
+        ('모델명', Product.model),
+        ('현재 재고', Product.current_stock),
+        ('최소 재고', Product.minimum_stock),
+        ('판매가격', Product.price),
+        ('원가', Product.cost_price),
+        ('등록일시', Product.created_at),
+    ],
+    'sales': [
+        ('ID', SaleRecord.id),
+        ('판매일', SaleRecord.sale_date),
+        ('상품코드', Product.code),
+        ('상품명', Product.name),
+        ('고객명', SaleRecord.customer_name),
+        ('수량', SaleRecord.quantity),
+        ('단가', SaleRecord.unit_price),
+        ('총금액', SaleRecord.total_price),
+        ('상태', SaleRecord.status),
+        ('결제상태', SaleRecord.payment_status),
+        ('결제방법', SaleRecord.payment_method),
+    ],
+    'purchases': [
+        ('ID', PurchaseInfo.id),
+        ('구매일', PurchaseInfo.purchase_date),
+        ('상품코드', Product.code),
+        ('상품명', Product.name),
+        ('공급업체명', PurchaseInfo.supplier_name),
+        ('송장번호', PurchaseInfo.invoice_number),
+        ('수량', PurchaseInfo.quantity),
+        ('단가', PurchaseInfo.unit_price),
+        ('세액', PurchaseInfo.tax_amount),
+        ('총금액', PurchaseInfo.total_price),
+        ('결제상태', PurchaseInfo.payment_status),
+    ],
+}
+
+def export_headers(resource: str) -> List[str]:
+    return [header for header, _ in EXPORT_COLUMNS[resource]]
+
+def datetime_positions(resource: str) -> List[int]:
+    """일시 컬럼 위치 (초 단위로 변환해서 내보냄)"""
+    return [i for i, (_, column) in enumerate(EXPORT_COLUMNS[resource]) if isinstance(column.type, DateTime)]
+
+def export_query(resource: str, company_id: Optional[int] = None,
+                 start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                 product_id: Optional[int] = None):
+    """내보내기 쿼리 (회사/기간/제품 필터, 날짜 -> ID 순)"""
+    query = select(*[column for _, column in EXPORT_COLUMNS[resource]])
+    if resource == 'products':
+        if company_id is not None:
+            query = query.where(Product.company_id == company_id)
+        return query.order_by(Product.id)
+    
+    model, date_column = (SaleRecord, SaleRecord.sale_date) if resource == 'sales' else \
+        (PurchaseInfo, PurchaseInfo.purchase_date)
+    query = query.join(Product, Product.id == model.product_id)
+    if company_id is not None:
+        query = query.where(Product.company_id == company_id)
+    if start_date:
+        query = query.where(date_column >= start_date)
+    if end_date:
+        query = query.where(date_column <= end_date)
+    if product_id:
+        query = query.where(model.product_id == product_id)
+    return query.order_by(date_column, model.id)
+
+def iter_partitions(query, batch_size: int = EXPORT_BATCH_SIZE, session_factory=None) -> Iterator[Sequence]:
+    """
+    yield_per로 batch_size 행씩 조회
+    
+    응답을 보내는 동안 요청 의존성의 세션이 닫힐 수 있으므로 별도 세션을 열고 다 읽으면 닫음.
+    """
+    if session_factory is None:
+        from app import get_db_session as session_factory
+    
+    db = session_factory()
+    try:
+        result = db.execute(query, execution_options={'yield_per': batch_size})
+        yield from result.partitions()
+    finally:
+        db.close()
+
+def _format_rows(rows: Sequence, datetime_positions: Sequence[int]):
+    """일시 컬럼만 초 단위 문자열로 변환 (나머지 값은 그대로)"""
+    if not datetime_positions:
+        return rows
+    formatted = []
+    for row in rows:
+        row = list(row)
+        for position in datetime_positions:
+            if row[position] is not None:
+                row[position] = row[position].isoformat(sep=' ', timespec='seconds')
+        formatted.append(row)
+    return formatted
+
+def stream_csv(headers: List[str], partitions: Iterator[Sequence],
+               datetime_positions: Sequence[int] = ()) -> Iterator[bytes]:
+    """CSV 스트리밍 (엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    yield ('\ufeff' + buffer.getvalue()).encode('utf-8')
+    
+    for rows in partitions:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_format_rows(rows, datetime_positions))
+        yield buffer.getvalue().encode('utf-8')
+
+def stream_xlsx(headers: List[str], partitions: Iterator[Sequence], title: str = 'Sheet',
+                datetime_positions: Sequence[int] = ()) -> Iterator[bytes]:
+    """
+    XLSX 스트리밍 (openpyxl 쓰기 전용 통합 문서)
+    
+    쓰기 전용 모드는 행을 임시 파일에 기록하므로 메모리 사용량이 행 수와 무관하며,
+    ZIP 형식 특성상 완성된 파일을 임시 파일에서 조각 단위로 전송함.
+    """
+    from openpyxl import Workbook
+    
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title)
+    sheet.append(headers)
+    for rows in partitions:
+        for row in _format_rows(rows, datetime_positions):
+            sheet.append(row)
+    
+    with tempfile.TemporaryFile() as output:
+        workbook.save(output)
+        output.seek(0)
+        while True:
+            chunk = output.read(XLSX_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+def export_response(resource: str, export_format: str, **filters) -> StreamingResponse:
+    """대상(products/sales/purchases)을 CSV/XLSX 스트리밍 응답으로 반환"""
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="지원하지 않는 파일 형식입니다. (csv, xlsx)")
+    if export_format == 'xlsx':
+        try:
+            import openpyxl  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=400, detail="XLSX 내보내기에는 openpyxl 패키지가 필요합니다.")
+    
+    headers = export_headers(resource)
+    positions = datetime_positions(resource)
+    partitions = iter_partitions(export_query(resource, **filters))
+    body = stream_csv(headers, partitions, positions) if export_format == 'csv' else \
+        stream_xlsx(headers, partitions, title=resource, datetime_positions=positions)
+    
+    filename = f"{resource}_{datetime.now():%Y%m%d_%H%M%S}.{export_format}"
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_FORMATS[export_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,68 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import Select, literal, tuple_
+
+# 목록 API는 응답 본문(리스트) 호환을 위해 다음 페이지 커서를 헤더로 전달
+# (skip/offset 파라미터는 하위 호환용으로만 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"커서에 사용할 수 없는 값입니다: {value!r}")
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 + ID 값을 불투명한 커서 문자열로 변환"""
+    raw = json.dumps(list(values), default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def _restore_value(value, column):
+    """JSON으로 직렬화된 값을 컬럼 타입에 맞게 복원"""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is datetime and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
+def decode_cursor(cursor: str, columns: Sequence) -> List[Any]:
+    """커서 문자열을 정렬 컬럼 값 목록으로 복원"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return [_restore_value(value, column) for value, column in zip(values, columns)]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+def paginate(query: Select, columns: Sequence, cursor: Optional[str], limit: int,
+             descending: bool = False) -> Select:
+    """
+    키셋(커서) 페이지네이션 적용
+
+    정렬 컬럼 값이 커서보다 뒤인 행만 조회하므로 페이지가 깊어져도 OFFSET처럼 느려지지 않음.
+    다음 페이지 존재 여부 확인을 위해 limit + 1개를 조회함.
+    """
+    if cursor:
+        values = decode_cursor(cursor, columns)
+        bounds = tuple_(*[literal(value, column.type) for value, column in zip(values, columns)])
+        keys = tuple_(*columns)
+        query = query.where(keys < bounds if descending else keys > bounds)
+
+    order_by = [column.desc() if descending else column.asc() for column in columns]
+    return query.order_by(None).order_by(*order_by).limit(limit + 1)
+
+def split_page(rows: Sequence, limit: int, key: Callable[[Any], Sequence[Any]]) -> Tuple[list, Optional[str]]:
+    """limit + 1개 조회 결과를 현재 페이지와 다음 페이지 커서로 분리"""
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(key(page[-1]))
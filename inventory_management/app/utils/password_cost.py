@@ -0,0 +1,101 @@
+import re
+import threading
+import time
+from typing import Optional
+
+import bcrypt
+from sqlalchemy import select
+from sqlalchemy.dialects.sqlite import insert
+
+from app.config import (
+    PASSWORD_HASH_TARGET_MS, PASSWORD_HASH_MIN_ROUNDS, PASSWORD_HASH_MAX_ROUNDS, PASSWORD_HASH_ROUNDS
+)
+
+# bcrypt 해시의 알고리즘/비용 부분 ($2b$12$...)
+_BCRYPT_HASH = re.compile(r'^\$(2[abxy])\$(\d{2})\$')
+
+# 새 해시에 사용하는 알고리즘 식별자
+_BCRYPT_PREFIX = '2b'
+
+# 같은 DB를 쓰는 서버들이 공유하는 bcrypt 비용의 설정 이름 (system_settings)
+PASSWORD_ROUNDS_SETTING = 'password_hash_rounds'
+
+# 비용 측정 반복 횟수 (가장 빠른 값을 사용해 일시적인 부하의 영향을 줄임)
+_CALIBRATION_SAMPLES = 3
+
+_rounds = None
+_lock = threading.Lock()
+
+def calibrate_bcrypt_rounds(target_ms: float = PASSWORD_HASH_TARGET_MS,
+                            min_rounds: int = PASSWORD_HASH_MIN_ROUNDS,
+                            max_rounds: int = PASSWORD_HASH_MAX_ROUNDS) -> int:
+    """
+    이 서버에서 target_ms 안에 해시가 끝나는 가장 큰 bcrypt 비용 측정
+
+    min_rounds로 해시 시간을 재고 비용이 1 늘 때마다 시간이 두 배가 되는 것으로 추정합니다.
+    하한 비용에서도 목표 시간을 넘으면 하한 비용을 사용합니다 (보안 최소치 우선).
+    """
+    salt = bcrypt.gensalt(rounds=min_rounds)
+    elapsed = float('inf')
+    for _ in range(_CALIBRATION_SAMPLES):
+        begin = time.perf_counter()
+        bcrypt.hashpw(b'calibration', salt)
+        elapsed = min(elapsed, time.perf_counter() - begin)
+
+    rounds = min_rounds
+    while rounds < max_rounds and elapsed * 2 * 1000 <= target_ms:
+        rounds += 1
+        elapsed *= 2
+    return rounds
+
+def shared_bcrypt_rounds(connection) -> int:
+    """
+    같은 DB를 쓰는 모든 서버가 사용하는 bcrypt 비용
+    
+    DB에 저장된 값이 없으면 이 서버에서 측정해 저장합니다. 여러 서버가 동시에 저장하면 먼저 저장한 값을 사용하므로
+    서버마다 비용이 달라 로그인할 때마다 해시가 바뀌는 일이 없습니다.
+    """
+    from app.models.system_setting import SystemSetting
+    
+    query = select(SystemSetting.value).where(SystemSetting.key == PASSWORD_ROUNDS_SETTING)
+    stored = connection.execute(query).scalar()
+    if stored is None:
+        connection.execute(
+            insert(SystemSetting)
+            .values(key=PASSWORD_ROUNDS_SETTING, value=str(calibrate_bcrypt_rounds()))
+            .on_conflict_do_nothing(index_elements=['key'])
+        )
+        stored = connection.execute(query).scalar()
+    return max(int(stored), PASSWORD_HASH_MIN_ROUNDS)
+
+def bcrypt_rounds() -> int:
+    """새 비밀번호 해시에 사용할 bcrypt 비용 (PASSWORD_HASH_ROUNDS가 없으면 DB에 저장된 공통 비용)"""
+    global _rounds
+    if _rounds is None:
+        with _lock:
+            if _rounds is None:
+                if PASSWORD_HASH_ROUNDS:
+                    _rounds = max(int(PASSWORD_HASH_ROUNDS), PASSWORD_HASH_MIN_ROUNDS)
+                else:
+                    from app import engine
+                    with engine.begin() as connection:
+                        _rounds = shared_bcrypt_rounds(connection)
+    return _rounds
+
+def hash_rounds(hashed_password) -> Optional[int]:
+    """저장된 해시의 bcrypt 비용 (bcrypt 해시가 아니면 None)"""
+    if isinstance(hashed_password, bytes):
+        hashed_password = hashed_password.decode('utf-8')
+    match = _BCRYPT_HASH.match(hashed_password or '')
+    return int(match.group(2)) if match else None
+
+def needs_rehash(hashed_password) -> bool:
+    """
+    저장된 해시를 현재 비용으로 다시 만들어야 하는지 여부 (로그인 성공 시 다시 해시)
+    
+    알고리즘이 다르거나 비용이 현재 비용보다 낮을 때만 다시 해시합니다 (더 높은 비용의 해시는 낮추지 않음).
+    """
+    if isinstance(hashed_password, bytes):
+        hashed_password = hashed_password.decode('utf-8')
+    match = _BCRYPT_HASH.match(hashed_password or '')
+    return match is None or match.group(1) != _BCRYPT_PREFIX or int(match.group(2)) < bcrypt_rounds()
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from fastapi import HTTPException, status
+
+# 비밀번호 해시/검증 스레드 수 (bcrypt는 CPU 작업이므로 코어 수 이하로 제한)
+PASSWORD_POOL_WORKERS = min(4, os.cpu_count() or 1)
+
+# 실행 중 + 대기 중 작업 최대 수 (초과하면 503 응답 - 로그인 폭주 시 대기 시간 상한)
+PASSWORD_POOL_QUEUE_LIMIT = 32
+
+# 풀이 가득 찼을 때 클라이언트에 안내할 재시도 대기 시간 (초)
+PASSWORD_POOL_RETRY_AFTER = 1
+
+class PasswordPool:
+    """
+    비밀번호 해시/검증 전용 스레드풀
+
+    bcrypt는 한 번에 수백 ms가 걸리므로 이벤트 루프나 DB 작업용 스레드풀에서 실행하지 않고
+    크기가 정해진 별도 풀에서 실행합니다 (bcrypt는 계산 중 GIL을 해제하므로 스레드로 충분).
+    대기열이 가득 차면 바로 503을 반환해 로그인 폭주가 다른 요청을 밀어내지 않도록 합니다.
+    """
+
+    def __init__(self, workers: int = PASSWORD_POOL_WORKERS, queue_limit: int = PASSWORD_POOL_QUEUE_LIMIT):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self._executor = None
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """실행 중이거나 대기 중인 작업 수"""
+        return self._pending
+
+    def submit(self, fn, *args) -> Future:
+        """fn(*args)를 풀에 넣고 Future 반환 (대기열이 가득 차면 503)"""
+        with self._lock:
+            if self._pending >= self.queue_limit:
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="인증 요청이 많습니다. 잠시 후 다시 시도해 주세요.",
+                    headers={"Retry-After": str(PASSWORD_POOL_RETRY_AFTER)},
+                )
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='password')
+            self._pending += 1
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: Future):
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, fn, *args):
+        """비동기 엔드포인트용 - 이벤트 루프를 막지 않고 결과 대기"""
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def call(self, fn, *args):
+        """동기 엔드포인트용 - 결과가 나올 때까지 현재 스레드에서 대기"""
+        return self.submit(fn, *args).result()
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+password_pool = PasswordPool()
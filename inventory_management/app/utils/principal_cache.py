@@ -0,0 +1,119 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# 캐시에 보관할 최대 사용자 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+PRINCIPAL_CACHE_MAX_ENTRIES = 10000
+
+# 캐시 유효 시간 (초) - 무효화는 같은 프로세스의 변경만 감지하므로 워커가 여러 개일 때의 상한
+PRINCIPAL_CACHE_TTL = 60
+
+# 변경 시각을 기억할 기간 (초) - 이보다 오래된 토큰은 만료되므로 액세스 토큰 유효 시간 이상이어야 함
+PRINCIPAL_CHANGE_RETENTION = 24 * 60 * 60
+
+# 커밋 전까지 세션에 모아 두는 변경된 사용자명 키
+_PENDING_KEY = 'changed_usernames'
+
+class Principal:
+    """인증된 사용자의 권한 확인용 정보 (users 행 전체 대신 사용)"""
+
+    __slots__ = ('id', 'username', 'role', 'company_id', 'is_active')
+
+    def __init__(self, id: int, username: str, role: str, company_id: Optional[int], is_active: bool):
+        self.id = id
+        self.username = username
+        self.role = role
+        self.company_id = company_id
+        self.is_active = is_active
+
+    def __repr__(self):
+        return f"<Principal(id={self.id}, username='{self.username}', role='{self.role}', company_id={self.company_id})>"
+
+    @classmethod
+    def from_row(cls, row) -> "Principal":
+        return cls(row.id, row.username, row.role, row.company_id, bool(row.is_active))
+
+    def claims(self) -> dict:
+        """토큰에 넣을 권한 클레임"""
+        return {'uid': self.id, 'role': self.role, 'cid': self.company_id, 'active': self.is_active}
+
+    @classmethod
+    def from_claims(cls, username: str, payload: dict) -> Optional["Principal"]:
+        """토큰 클레임으로 생성 (클레임이 없는 토큰이면 None)"""
+        if 'uid' not in payload or 'role' not in payload or 'cid' not in payload:
+            return None
+        return cls(payload['uid'], username, payload['role'], payload['cid'], bool(payload.get('active', True)))
+
+class PrincipalCache:
+    """
+    사용자명 -> Principal 캐시
+
+    사용자가 수정/삭제되면 해당 사용자명 항목을 지우고 변경 시각을 기록하며,
+    변경 시각 이전에 발급된 토큰의 클레임은 신뢰하지 않도록 changed_since()로 알려줌.
+    """
+
+    def __init__(self, max_entries: int = PRINCIPAL_CACHE_MAX_ENTRIES, ttl: float = PRINCIPAL_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # 사용자명 -> (Principal, 만료 시각)
+        self._changed_at = {}  # 사용자명 -> 마지막 변경 시각 (epoch 초)
+        self._lock = threading.Lock()
+        self._version = 0  # 무효화될 때마다 증가 (조회 중 변경된 결과 저장 방지)
+
+    def get(self, username: str):
+        """(Principal 또는 None, 버전) - 버전은 조회 후 store()에 전달"""
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is not None and entry[1] > time.monotonic():
+                self._entries.move_to_end(username)
+                return entry[0], self._version
+            return None, self._version
+
+    def store(self, principal: Principal, version: int):
+        with self._lock:
+            if version == self._version:
+                self._entries[principal.username] = (principal, time.monotonic() + self.ttl)
+                self._entries.move_to_end(principal.username)
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def changed_since(self, username: str, issued_at: float) -> bool:
+        """issued_at(토큰 발급 시각) 이후에 사용자가 변경됐는지 여부"""
+        changed_at = self._changed_at.get(username)
+        return changed_at is not None and changed_at >= issued_at
+
+    def invalidate(self, usernames: Iterable[str]):
+        now = time.time()
+        with self._lock:
+            self._version += 1
+            for username in usernames:
+                self._entries.pop(username, None)
+                self._changed_at[username] = now
+            if len(self._changed_at) > self.max_entries:
+                cutoff = now - PRINCIPAL_CHANGE_RETENTION
+                self._changed_at = {name: at for name, at in self._changed_at.items() if at > cutoff}
+
+    def clear(self):
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+principal_cache = PrincipalCache()
+
+def mark_user_changed(db: Session, *usernames: str):
+    """사용자 변경 기록 - 트랜잭션이 커밋되면 캐시에서 제거"""
+    db.info.setdefault(_PENDING_KEY, set()).update(name for name in usernames if name)
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_after_commit(session):
+    usernames = session.info.pop(_PENDING_KEY, None)
+    if usernames:
+        principal_cache.invalidate(usernames)
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
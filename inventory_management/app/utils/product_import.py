@@ -0,0 +1,210 @@
+import csv
+import io
+import logging
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.product import Product
+from app.models.inventory_movement import InventoryMovement, MovementType
+from app.models.product_search import rebuild_product_search_keys
+from app.schemas.product import ProductCreate
+
+logger = logging.getLogger(__name__)
+
+# 한 트랜잭션에서 검증/등록할 기본 행 수
+IMPORT_CHUNK_SIZE = 1000
+
+# 보고서에 포함할 최대 오류 행 수 (실패 건수는 모두 집계)
+MAX_REPORTED_ERRORS = 1000
+
+# 파일 헤더 -> 제품 필드 (필드명 그대로 사용해도 됨)
+IMPORT_COLUMNS = {
+    '상품명': 'name',
+    '상품코드': 'code',
+    '분류': 'category',
+    '브랜드': 'brand',
+    '모델명': 'model',
+    '상세설명': 'description',
+    '현재 재고': 'current_stock',
+    '최소 재고': 'minimum_stock',
+    '판매가격': 'price',
+    '원가': 'cost_price',
+    '부가세 포함': 'tax_included',
+}
+
+_STRING_FIELDS = ('name', 'code', 'category', 'brand', 'model', 'description')
+
+def _field_name(header) -> Optional[str]:
+    header = str(header or '').strip()
+    if header in ProductCreate.model_fields:
+        return header
+    return IMPORT_COLUMNS.get(header)
+
+def _rows_from_header(header: List[Any], values: Iterable[Iterable[Any]]) -> Iterator[Dict[str, Any]]:
+    fields = [_field_name(column) for column in header]
+    for row in values:
+        yield {field: value for field, value in zip(fields, row) if field}
+
+def read_csv_rows(stream) -> Iterator[Dict[str, Any]]:
+    """CSV 스트림에서 제품 행을 하나씩 읽음 (바이너리 스트림은 UTF-8로 해석, BOM 허용)"""
+    if not isinstance(stream, io.TextIOBase):
+        stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+    yield from _rows_from_header(header, reader)
+
+def read_xlsx_rows(stream) -> Iterator[Dict[str, Any]]:
+    """XLSX 첫 번째 시트에서 제품 행을 하나씩 읽음 (openpyxl 읽기 전용 모드)"""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("XLSX 파일을 읽으려면 openpyxl 패키지가 필요합니다.")
+    
+    workbook = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        yield from _rows_from_header(list(header), rows)
+    finally:
+        workbook.close()
+
+def read_import_rows(stream, filename: str) -> Iterator[Dict[str, Any]]:
+    """확장자에 따라 CSV/XLSX 행 읽기"""
+    extension = os.path.splitext(filename or '')[1].lower()
+    if extension == '.csv':
+        return read_csv_rows(stream)
+    if extension == '.xlsx':
+        return read_xlsx_rows(stream)
+    raise ValueError("지원하지 않는 파일 형식입니다. (csv, xlsx)")
+
+def _normalize(row: Dict[str, Any]) -> Dict[str, Any]:
+    """빈 값은 기본값을 쓰도록 제거하고, 엑셀 숫자 셀의 코드/이름은 문자열로 변환"""
+    normalized = {}
+    for field, value in row.items():
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        elif value is None:
+            continue
+        elif field in _STRING_FIELDS:
+            value = str(int(value)) if isinstance(value, float) and value.is_integer() else str(value)
+        normalized[field] = value
+    return normalized
+
+class ProductImporter:
+    """
+    제품 대량 등록
+    
+    chunk_size 행 단위로 ProductCreate 검증 -> 코드 중복 일괄 조회 -> executemany INSERT 후 커밋하며,
+    실패한 행은 건너뛰고 (행 번호, 상품코드, 오류)를 보고서에 기록함.
+    """
+    
+    def __init__(self, db: Session, company_id: int, created_by: Optional[int] = None,
+                 chunk_size: int = IMPORT_CHUNK_SIZE,
+                 progress: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.db = db
+        self.company_id = company_id
+        self.created_by = created_by
+        self.chunk_size = max(1, chunk_size)
+        self.progress = progress
+        self.report = {'total': 0, 'imported': 0, 'failed': 0, 'errors': []}
+        self._seen_codes = set()  # 파일 안의 중복 코드 확인용
+    
+    def _fail(self, row_number: int, code, message: str):
+        self.report['failed'] += 1
+        if len(self.report['errors']) < MAX_REPORTED_ERRORS:
+            self.report['errors'].append({'row': row_number, 'code': code, 'error': message})
+    
+    def _validate(self, chunk: List[tuple]) -> List[tuple]:
+        valid = []
+        for row_number, row in chunk:
+            try:
+                product = ProductCreate(**_normalize(row))
+            except ValidationError as e:
+                message = '; '.join(
+                    f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+                )
+                self._fail(row_number, row.get('code'), message)
+                continue
+            if product.code in self._seen_codes:
+                self._fail(row_number, product.code, "파일 안에 중복된 상품코드입니다.")
+                continue
+            self._seen_codes.add(product.code)
+            valid.append((row_number, product))
+        
+        # 상품코드 중복은 청크 단위로 한 번에 조회
+        codes = [product.code for _, product in valid]
+        existing = set(self.db.scalars(select(Product.code).where(Product.code.in_(codes)))) if codes else set()
+        if not existing:
+            return valid
+        
+        result = []
+        for row_number, product in valid:
+            if product.code in existing:
+                self._fail(row_number, product.code, "이미 존재하는 상품코드입니다.")
+            else:
+                result.append((row_number, product))
+        return result
+    
+    def _insert(self, products: List[tuple]):
+        now = datetime.now()
+        rows = [
+            dict(product.model_dump(), company_id=self.company_id, created_at=now, updated_at=now)
+            for _, product in products
+        ]
+        inserted = self.db.execute(insert(Product).returning(Product.id, Product.current_stock), rows).all()
+        
+        # 초기 재고 원장 기록
+        movements = [
+            {
+                'product_id': product_id, 'company_id': self.company_id, 'quantity': stock,
+                'movement_type': MovementType.INITIAL, 'created_by': self.created_by, 'created_at': now,
+            }
+            for product_id, stock in inserted if stock
+        ]
+        if movements:
+            self.db.execute(insert(InventoryMovement), movements)
+        
+        # Core INSERT는 ORM 이벤트를 거치지 않으므로 초성/자모 검색 키를 직접 생성 (FTS는 트리거로 갱신)
+        rebuild_product_search_keys(self.db.connection(), [product_id for product_id, _ in inserted])
+        return len(inserted)
+    
+    def _process(self, chunk: List[tuple]):
+        try:
+            products = self._validate(chunk)
+            if products:
+                self.report['imported'] += self._insert(products)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        
+        if self.progress:
+            self.progress(self.report)
+        logger.info(
+            f"[제품 가져오기] 회사 {self.company_id}: {self.report['total']}행 처리, "
+            f"{self.report['imported']}건 등록, {self.report['failed']}건 실패"
+        )
+    
+    def run(self, rows: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """행(필드명 -> 값)을 순서대로 등록하고 보고서 반환 (행 번호는 헤더 다음 행이 2)"""
+        chunk = []
+        for row_number, row in enumerate(rows, start=2):
+            self.report['total'] += 1
+            chunk.append((row_number, row))
+            if len(chunk) >= self.chunk_size:
+                self._process(chunk)
+                chunk = []
+        if chunk:
+            self._process(chunk)
+        return self.report
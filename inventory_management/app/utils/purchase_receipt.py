@@ -0,0 +1,95 @@
+from typing import Any, Dict, List, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.product import Product
+from app.models.purchase_info import PurchaseInfo
+from app.models.inventory_movement import MovementType
+from app.schemas.purchase import PurchaseReceipt
+from app.utils.stock import increase_stock_many, record_movements
+
+def calculate_purchase_amounts(lines) -> List[Tuple[float, float]]:
+    """
+    품목별 (세액, 총금액) 일괄 계산
+    
+    단건 구매 등록과 같은 규칙: 총금액 = 수량 x 단가, 부가세 포함이면 세액을 더함
+    """
+    subtotals = [line.quantity * line.unit_price for line in lines]
+    taxes = [subtotal * (line.tax_rate / 100) for subtotal, line in zip(subtotals, lines)]
+    return [
+        (tax, subtotal + tax if line.tax_included else subtotal)
+        for subtotal, tax, line in zip(subtotals, taxes, lines)
+    ]
+
+def receive_purchases(db: Session, receipt: PurchaseReceipt, user) -> Dict[str, Any]:
+    """
+    일괄 입고 (컨테이너 단위 구매 등록)
+    
+    제품 일괄 조회/권한 확인 -> 구매 정보 executemany INSERT ->
+    제품별 합산 수량을 UPDATE 한 번으로 재고 증가 -> 구매별 재고 원장 기록 후 한 번만 커밋합니다.
+    """
+    lines = receipt.lines
+    
+    # 대상 제품 일괄 조회 및 권한 확인
+    product_ids = {line.product_id for line in lines}
+    companies = dict(db.execute(
+        select(Product.id, Product.company_id).where(Product.id.in_(product_ids))
+    ).all())
+    
+    missing = [index for index, line in enumerate(lines) if line.product_id not in companies]
+    if missing:
+        raise HTTPException(status_code=404, detail={"message": "제품을 찾을 수 없습니다.", "lines": missing})
+    if user.role not in ["admin", "super_admin"]:
+        forbidden = [index for index, line in enumerate(lines) if companies[line.product_id] != user.company_id]
+        if forbidden:
+            raise HTTPException(status_code=403, detail={"message": "구매 정보를 생성할 권한이 없습니다.", "lines": forbidden})
+    
+    # 공통 정보 + 품목별 정보로 구매 정보 일괄 INSERT (요청 순서대로 ID 반환)
+    common = receipt.model_dump(exclude={'lines', 'notes'})
+    amounts = calculate_purchase_amounts(lines)
+    rows = [
+        dict(
+            common,
+            product_id=line.product_id,
+            quantity=line.quantity,
+            unit_price=line.unit_price,
+            tax_rate=line.tax_rate,
+            tax_amount=tax_amount,
+            discount=line.discount,
+            total_price=total_price,
+            notes=line.notes or receipt.notes,
+            created_by=user.id,
+        )
+        for line, (tax_amount, total_price) in zip(lines, amounts)
+    ]
+    purchase_ids = db.execute(
+        insert(PurchaseInfo).returning(PurchaseInfo.id, sort_by_parameter_order=True), rows
+    ).scalars().all()
+    
+    # 제품별 합산 수량으로 재고 증가 (UPDATE 1회)
+    quantities = {}
+    for line in lines:
+        quantities[line.product_id] = quantities.get(line.product_id, 0) + line.quantity
+    increase_stock_many(db, quantities)
+    
+    # 구매별 재고 원장 기록
+    record_movements(db, [
+        {
+            'product_id': line.product_id, 'company_id': companies[line.product_id],
+            'quantity': line.quantity, 'movement_type': MovementType.PURCHASE,
+            'reference_id': purchase_id, 'created_by': user.id,
+        }
+        for line, purchase_id in zip(lines, purchase_ids)
+    ])
+    
+    db.commit()
+    
+    return {
+        'received': len(purchase_ids),
+        'purchase_ids': purchase_ids,
+        'products': len(quantities),
+        'total_quantity': sum(quantities.values()),
+        'total_price': sum(total_price for _, total_price in amounts),
+    }
@@ -0,0 +1,143 @@
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import event
+
+# 커버링 인덱스 제안 시 포함할 최대 컬럼 수 (넘으면 조회 컬럼은 제외)
+MAX_COVERING_COLUMNS = 6
+
+_SCAN_PATTERN = re.compile(r'^SCAN (\w+)(?: AS \w+)?$')
+_TEMP_BTREE_PATTERN = re.compile(r'USE TEMP B-TREE FOR (ORDER BY|GROUP BY|DISTINCT|RIGHT PART OF ORDER BY)')
+_COMPARISON_PATTERN = re.compile(
+    r'\b(\w+)\.(\w+)\s*(=|!=|<>|>=|<=|>|<|IN\b|LIKE\b|BETWEEN\b|IS\b)\s*(\w+\.\w+)?', re.IGNORECASE
+)
+_COLUMN_PATTERN = re.compile(r'\b(\w+)\.(\w+)\b')
+_CLAUSE_PATTERN = re.compile(r'\b(SELECT|FROM|WHERE|GROUP BY|ORDER BY|LIMIT|HAVING)\b', re.IGNORECASE)
+
+class StatementRecorder:
+    """엔진 이벤트로 실행되는 SQL 문을 캡처 (동일 SQL은 한 번만 저장)"""
+
+    def __init__(self):
+        self.source = None  # 현재 실행 중인 요청 (예: 'GET /sales/')
+        self.statements: Dict[str, Dict[str, Any]] = {}
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if executemany or not statement.lstrip().upper().startswith('SELECT'):
+            return
+        captured = self.statements.setdefault(
+            statement, {'statement': statement, 'parameters': parameters, 'sources': [], 'count': 0}
+        )
+        captured['count'] += 1
+        if self.source and self.source not in captured['sources']:
+            captured['sources'].append(self.source)
+
+    def attach(self, *engines):
+        for engine in engines:
+            event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+
+    def detach(self, *engines):
+        for engine in engines:
+            event.remove(engine, 'before_cursor_execute', self._before_cursor_execute)
+
+def explain_query_plan(connection, statement: str, parameters=None) -> List[str]:
+    """EXPLAIN QUERY PLAN 실행 후 detail 컬럼 목록 반환"""
+    cursor = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+    return [row[3] for row in cursor]
+
+def _split_clauses(statement: str) -> Dict[str, str]:
+    """최상위 SQL 절(SELECT/WHERE/ORDER BY 등)을 분리 (서브쿼리 괄호 내부는 무시)"""
+    depth = 0
+    masked = []
+    for char in statement:
+        if char == '(':
+            depth += 1
+        masked.append(char if depth == 0 else ' ')
+        if char == ')':
+            depth -= 1
+    masked = ''.join(masked)
+
+    clauses = {}
+    matches = list(_CLAUSE_PATTERN.finditer(masked))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(statement)
+        clauses.setdefault(match.group(1).upper(), statement[match.end():end])
+    return clauses
+
+def suggest_index(statement: str, table: str) -> Optional[str]:
+    """
+    WHERE 동등 조건 -> 정렬/범위 조건 -> 조회 컬럼 순서로 커버링 인덱스 제안
+
+    SQLAlchemy가 생성하는 '테이블.컬럼' 형식의 SQL을 기준으로 한 경험적 분석임.
+    """
+    clauses = _split_clauses(statement)
+    from_clause = clauses.get('FROM', '')
+    driving = re.match(r'\s*(\w+)', from_clause)
+    # 첫 번째 FROM 테이블이 아니면 조인 조건 컬럼도 탐색 조건이 됨
+    where = clauses.get('WHERE', '')
+    if not driving or driving.group(1) != table:
+        where += ' ' + from_clause
+
+    equality, ranges = [], []
+    for owner, column, operator, other in _COMPARISON_PATTERN.findall(where):
+        if owner != table:
+            # 조인 조건의 반대편 컬럼 (예: products.id = sale_records.product_id)
+            if other and other.split('.')[0] == table and operator == '=':
+                equality.append(other.split('.')[1])
+            continue
+        if operator.upper() in ('=', 'IN', 'IS'):
+            equality.append(column)
+        else:
+            ranges.append(column)
+
+    order_by = [column for owner, column in _COLUMN_PATTERN.findall(clauses.get('ORDER BY', '')) if owner == table]
+    group_by = [column for owner, column in _COLUMN_PATTERN.findall(clauses.get('GROUP BY', '')) if owner == table]
+
+    columns = []
+    for column in equality + (group_by or order_by or ranges[:1]):
+        if column not in columns and column != 'id':
+            columns.append(column)
+    if not columns:
+        return None
+
+    selected = [column for owner, column in _COLUMN_PATTERN.findall(clauses.get('SELECT', '')) if owner == table]
+    covering = columns + [column for column in dict.fromkeys(selected) if column not in columns and column != 'id']
+    if len(covering) <= MAX_COVERING_COLUMNS:
+        columns = covering
+
+    return f"CREATE INDEX idx_{table}_{'_'.join(columns)} ON {table} ({', '.join(columns)});"
+
+def _issue(table: str, kind: str, detail: str, suggestion: Optional[str] = None) -> Dict[str, Any]:
+    return {'table': table, 'kind': kind, 'detail': detail, 'suggestion': suggestion}
+
+def analyze_plan(statement: str, plan: Sequence[str], tables=None) -> List[Dict[str, Any]]:
+    """
+    전체 테이블 스캔(full_scan)과 임시 B-트리 정렬(temp_btree)을 찾아 인덱스 제안과 함께 반환
+
+    tables를 지정하면 그 외의 이름(서브쿼리/CTE 등)은 인덱스 대상에서 제외함.
+    반환 항목: {'table', 'kind', 'detail', 'suggestion'}
+    """
+    issues = []
+    scanned_tables = []
+    for detail in plan:
+        scan = _SCAN_PATTERN.match(detail.strip())
+        if scan:
+            table = scan.group(1)
+            if tables is not None and table not in tables:
+                continue
+            scanned_tables.append(table)
+            issues.append(_issue(table, 'full_scan', detail, suggest_index(statement, table)))
+            continue
+
+        temp_btree = _TEMP_BTREE_PATTERN.search(detail)
+        if temp_btree:
+            # 정렬 대상은 ORDER BY/GROUP BY 첫 컬럼의 테이블
+            clause = 'GROUP BY' if temp_btree.group(1) == 'GROUP BY' else 'ORDER BY'
+            columns = _COLUMN_PATTERN.findall(_split_clauses(statement).get(clause, ''))
+            table = columns[0][0] if columns else (scanned_tables[0] if scanned_tables else '')
+            if any(issue['table'] == table and issue['kind'] == 'full_scan' for issue in issues):
+                # 이미 같은 테이블 스캔에 대한 제안이 정렬까지 포함
+                issues.append(_issue(table, 'temp_btree', detail))
+            else:
+                indexable = table and (tables is None or table in tables)
+                issues.append(_issue(table, 'temp_btree', detail, suggest_index(statement, table) if indexable else None))
+    return issues
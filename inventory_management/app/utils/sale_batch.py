@@ -0,0 +1,163 @@
+from typing import Any, Dict, List
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from app.models.product import Product
+from app.models.sale_record import SaleRecord
+from app.models.inventory_movement import MovementType
+from app.schemas.sale import SaleCreate
+from app.utils.stock import decrease_stock_many, record_movements
+from app.utils.sales_rollup import EXCLUDED_SALE_STATUSES, add_contributions_to_rollup
+
+# 한 번에 등록할 수 있는 최대 판매 수
+MAX_SALE_BATCH_SIZE = 1000
+
+SALE_BATCH_ADAPTER = TypeAdapter(List[SaleCreate])
+
+# 판매 기록 테이블에 저장하는 필드
+_SALE_COLUMNS = [column for column in SaleRecord.__table__.columns.keys() if column not in ('id', 'total_price')]
+
+def _format_errors(errors) -> str:
+    return '; '.join(f"{'.'.join(str(part) for part in loc) or '판매'}: {message}" for loc, message in errors)
+
+def validate_sale_batch(items: List[Any]):
+    """
+    목록 단위 검증 (TypeAdapter), 실패한 항목은 제외하고 나머지만 다시 검증
+    
+    Returns:
+        (유효 항목 [(인덱스, SaleCreate)], 오류 {인덱스: 메시지})
+    """
+    try:
+        return list(enumerate(SALE_BATCH_ADAPTER.validate_python(items))), {}
+    except ValidationError as e:
+        failed = {}
+        for error in e.errors():
+            index, *loc = error['loc']
+            failed.setdefault(index, []).append((loc, error['msg']))
+    
+    indexes = [index for index in range(len(items)) if index not in failed]
+    sales = SALE_BATCH_ADAPTER.validate_python([items[index] for index in indexes])
+    return list(zip(indexes, sales)), {index: _format_errors(errors) for index, errors in failed.items()}
+
+def _allocate(sales, stocks: Dict[int, int], results: Dict[int, dict]):
+    """요청 순서대로 재고를 배정하고, 재고가 부족한 항목은 실패 처리 (배정된 항목과 제품별 수량 반환)"""
+    accepted, quantities = [], {}
+    for index, sale in sales:
+        remaining = stocks.get(sale.product_id, 0) - quantities.get(sale.product_id, 0)
+        if sale.quantity > remaining:
+            results[index] = {'index': index, 'status': 'failed', 'error': "재고가 부족합니다."}
+            continue
+        quantities[sale.product_id] = quantities.get(sale.product_id, 0) + sale.quantity
+        accepted.append((index, sale))
+    return accepted, quantities
+
+def create_sales_batch(db: Session, items: List[Any], user, atomic: bool = True) -> Dict[str, Any]:
+    """
+    판매 일괄 등록 (POS 업로드용)
+    
+    검증 -> 제품 일괄 조회/권한 확인 -> 제품별 합산 수량을 조건부 UPDATE 한 번으로 차감 ->
+    판매 기록/재고 원장 executemany INSERT -> 집계 반영 순서로 하나의 트랜잭션에서 처리합니다.
+    
+    - atomic=True: 하나라도 실패하면 아무것도 등록하지 않음
+    - atomic=False: 실패한 항목만 제외하고 등록 (재고는 요청 순서대로 배정)
+    
+    반환: {'atomic', 'total', 'created', 'failed', 'results': [{'index', 'status', 'sale_id' | 'error'}]}
+    """
+    valid, errors = validate_sale_batch(items)
+    results = {index: {'index': index, 'status': 'failed', 'error': error} for index, error in errors.items()}
+    
+    # 대상 제품 일괄 조회 및 권한 확인
+    product_ids = {sale.product_id for _, sale in valid}
+    products = {
+        row.id: row for row in db.execute(
+            select(Product.id, Product.company_id, Product.current_stock).where(Product.id.in_(product_ids))
+        )
+    } if product_ids else {}
+    
+    sales = []
+    for index, sale in valid:
+        product = products.get(sale.product_id)
+        if product is None:
+            results[index] = {'index': index, 'status': 'failed', 'error': "제품을 찾을 수 없습니다."}
+        elif user.role not in ["admin", "super_admin"] and product.company_id != user.company_id:
+            results[index] = {'index': index, 'status': 'failed', 'error': "판매 정보를 생성할 권한이 없습니다."}
+        else:
+            sales.append((index, sale))
+    
+    accepted, quantities = _allocate(sales, {pid: row.current_stock for pid, row in products.items()}, results)
+    
+    def report():
+        created = sum(1 for result in results.values() if result['status'] == 'created')
+        return {
+            'atomic': atomic,
+            'total': len(items),
+            'created': created,
+            'failed': len(items) - created,
+            'results': [results[index] for index in sorted(results)],
+        }
+    
+    if atomic and results:
+        db.rollback()
+        for index, _ in accepted:
+            results[index] = {'index': index, 'status': 'failed', 'error': "다른 항목의 오류로 등록되지 않았습니다."}
+        return report()
+    
+    # 제품별 합산 수량을 조건부 UPDATE 한 번으로 차감
+    updated = decrease_stock_many(db, quantities)
+    missing = set(quantities) - updated
+    if missing:
+        # 조회 이후 다른 요청이 재고를 차감한 경우
+        if atomic:
+            db.rollback()
+            for index, sale in accepted:
+                results[index] = {'index': index, 'status': 'failed',
+                                  'error': "재고가 부족합니다." if sale.product_id in missing else "다른 항목의 오류로 등록되지 않았습니다."}
+            return report()
+        
+        # 위 UPDATE로 쓰기 잠금을 얻었으므로 다시 조회한 재고는 트랜잭션이 끝날 때까지 유지됨
+        stocks = dict(db.execute(
+            select(Product.id, Product.current_stock).where(Product.id.in_(missing))
+        ).all())
+        retry = [(index, sale) for index, sale in accepted if sale.product_id in missing]
+        accepted = [(index, sale) for index, sale in accepted if sale.product_id not in missing]
+        retried, retry_quantities = _allocate(retry, stocks, results)
+        decrease_stock_many(db, retry_quantities)
+        accepted = sorted(accepted + retried, key=lambda item: item[0])
+    
+    if not accepted:
+        db.rollback()
+        return report()
+    
+    # 판매 기록 일괄 INSERT (요청 순서대로 ID 반환)
+    rows = []
+    for _, sale in accepted:
+        data = sale.model_dump()
+        rows.append(dict({column: data[column] for column in _SALE_COLUMNS if column in data},
+                         total_price=sale.quantity * sale.unit_price))
+    sale_ids = db.execute(
+        insert(SaleRecord).returning(SaleRecord.id, sort_by_parameter_order=True), rows
+    ).scalars().all()
+    
+    # 판매별 재고 원장 기록 및 집계 반영
+    record_movements(db, [
+        {
+            'product_id': sale.product_id, 'company_id': products[sale.product_id].company_id,
+            'quantity': -sale.quantity, 'movement_type': MovementType.SALE,
+            'reference_id': sale_id, 'created_by': user.id,
+        }
+        for (_, sale), sale_id in zip(accepted, sale_ids)
+    ])
+    add_contributions_to_rollup(db, [
+        None if sale.status in EXCLUDED_SALE_STATUSES else
+        (products[sale.product_id].company_id, sale.product_id, sale.sale_date.date(),
+         sale.quantity, sale.quantity * sale.unit_price)
+        for _, sale in accepted
+    ])
+    
+    db.commit()
+    
+    for (index, _), sale_id in zip(accepted, sale_ids):
+        results[index] = {'index': index, 'status': 'created', 'sale_id': sale_id}
+    return report()
@@ -0,0 +1,245 @@
+from datetime import date, timedelta
+from typing import Optional, Tuple
+
+from sqlalchemy import select, delete, func, bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.product import Product
+from app.models.sale_record import SaleRecord, SaleStatus
+from app.models.sales_daily import SalesDaily
+from app.models.sales_monthly import SalesMonthly
+from app.utils.stats_cache import mark_sales_changed, sales_stats_cache
+
+# 집계에서 제외하는 판매 상태
+EXCLUDED_SALE_STATUSES = (SaleStatus.CANCELLED, SaleStatus.RETURNED)
+
+# 통계 기간별 그룹 키
+PERIOD_FORMATS = {
+    'day': '%Y-%m-%d',
+    'week': '%Y-%m-%d',  # 주 시작일(월요일) - 연도가 바뀌는 주도 한 행으로 집계
+    'month': '%Y-%m',
+    'year': '%Y',
+}
+
+# 그룹 키 계산 전 날짜에 적용하는 SQLite 날짜 수정자 (주: 해당 주의 월요일로 이동)
+PERIOD_MODIFIERS = {
+    'week': ('-6 days', 'weekday 1'),
+}
+
+# 집계 테이블과 날짜 키 (일별, 월별)
+ROLLUP_TABLES = (
+    (SalesDaily, 'sale_date', lambda day: day),
+    (SalesMonthly, 'sale_month', lambda day: day.replace(day=1)),
+)
+
+# 통계 그룹 기준 (None: 전체 합계)
+GROUP_COLUMNS = {
+    'product': Product.id,
+    'category': Product.category,
+    'brand': Product.brand,
+}
+
+def sale_contribution(sale: SaleRecord) -> Optional[Tuple[int, int, date, int, float]]:
+    """판매 1건이 일별 집계에 반영되는 값 (회사 ID, 제품 ID, 판매일, 수량, 매출), 제외 대상이면 None"""
+    if sale.status in EXCLUDED_SALE_STATUSES or sale.sale_date is None:
+        return None
+    return (sale.product.company_id, sale.product_id, sale.sale_date.date(),
+            sale.quantity, sale.total_price or 0.0)
+
+def _apply_many(db: Session, contributions, sign: int):
+    """
+    반영분 목록을 일별/월별 집계에 UPSERT (테이블별 executemany 1회)
+    
+    contributions: (회사 ID, 제품 ID, 판매일, 수량, 매출, 판매 건수) 목록.
+    커밋 시 해당 기간 통계 캐시가 무효화되도록 변경일을 기록함.
+    """
+    if not contributions:
+        return
+    
+    for model, date_column, to_key in ROLLUP_TABLES:
+        # 같은 집계 행(회사, 제품, 날짜 키)에 대한 반영분은 합쳐서 한 번만 UPSERT
+        merged = {}
+        for company_id, product_id, sale_day, quantity, revenue, count in contributions:
+            total = merged.setdefault((company_id, product_id, to_key(sale_day)), [0, 0.0, 0])
+            total[0] += quantity
+            total[1] += revenue
+            total[2] += count
+        rows = [
+            {'company_id': company_id, 'product_id': product_id, date_column: key_date,
+             'quantity': sign * quantity, 'revenue': sign * revenue, 'sale_count': sign * count}
+            for (company_id, product_id, key_date), (quantity, revenue, count) in merged.items()
+        ]
+        
+        table = model.__table__
+        stmt = sqlite_insert(table)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=['company_id', 'product_id', date_column],
+            set_={
+                'quantity': table.c.quantity + stmt.excluded.quantity,
+                'revenue': table.c.revenue + stmt.excluded.revenue,
+                'sale_count': table.c.sale_count + stmt.excluded.sale_count,
+            }
+        ), rows)
+        
+        # 판매가 모두 빠진 날/월은 행 삭제
+        if sign < 0:
+            db.execute(delete(table).where(
+                table.c.company_id == bindparam('b_company_id'),
+                table.c.product_id == bindparam('b_product_id'),
+                table.c[date_column] == bindparam('b_key_date'),
+                table.c.sale_count <= 0
+            ), [
+                {'b_company_id': row['company_id'], 'b_product_id': row['product_id'], 'b_key_date': row[date_column]}
+                for row in rows
+            ])
+    
+    for company_id, _, sale_day, _, _, _ in contributions:
+        mark_sales_changed(db, company_id, sale_day)
+
+def _apply(db: Session, contribution, sign: int):
+    """판매 1건의 반영분을 집계에 더하거나(sign=1) 뺌(sign=-1)"""
+    if contribution is not None:
+        _apply_many(db, [contribution + (1,)], sign)
+
+def add_sale_to_rollup(db: Session, sale: SaleRecord):
+    """판매 등록 시 일별 집계에 반영"""
+    _apply(db, sale_contribution(sale), 1)
+
+def add_contributions_to_rollup(db: Session, contributions):
+    """여러 판매의 반영분(sale_contribution 형식, 제외 대상은 None)을 한 번에 집계에 반영 (일괄 등록용)"""
+    _apply_many(db, [contribution + (1,) for contribution in contributions if contribution is not None], 1)
+
+def remove_sale_from_rollup(db: Session, sale: SaleRecord):
+    """판매 삭제 시 일별 집계에서 제외"""
+    _apply(db, sale_contribution(sale), -1)
+
+def update_sale_in_rollup(db: Session, before, sale: SaleRecord):
+    """판매 수정 시 이전 반영분(before = sale_contribution 결과)을 빼고 새 값을 반영"""
+    after = sale_contribution(sale)
+    if before == after:
+        return
+    _apply(db, before, -1)
+    _apply(db, after, 1)
+
+def remove_product_from_rollup(db: Session, product_id: int):
+    """
+    제품 삭제 시 해당 제품의 일별/월별 집계 행 삭제
+    
+    제품의 판매 기록은 ORM cascade로 함께 삭제되지만 집계 테이블은 갱신되지 않으므로
+    (SQLite는 foreign_keys PRAGMA 없이는 ondelete=CASCADE를 적용하지 않음) 제품 삭제 전에 호출해야 함.
+    """
+    days = db.execute(
+        select(SalesDaily.company_id, SalesDaily.sale_date).where(SalesDaily.product_id == product_id)
+    ).all()
+    for model, _, _ in ROLLUP_TABLES:
+        db.execute(delete(model).where(model.product_id == product_id))
+    for company_id, sale_day in days:
+        mark_sales_changed(db, company_id, sale_day)
+
+def rebuild_sales_daily(db: Session, company_id: Optional[int] = None) -> int:
+    """판매 기록으로 일별/월별 집계 재생성 (백필/정합성 복구용), 생성된 일별 집계 행 수 반환"""
+    for model in (SalesDaily, SalesMonthly):
+        delete_query = delete(model)
+        if company_id is not None:
+            delete_query = delete_query.where(model.company_id == company_id)
+        db.execute(delete_query)
+    
+    query = (
+        select(
+            Product.company_id,
+            SaleRecord.product_id,
+            func.date(SaleRecord.sale_date),
+            func.sum(SaleRecord.quantity),
+            func.coalesce(func.sum(SaleRecord.total_price), 0.0),
+            func.count(SaleRecord.id),
+        )
+        .join(Product, Product.id == SaleRecord.product_id)
+        .where(SaleRecord.status.notin_(EXCLUDED_SALE_STATUSES))
+        .group_by(Product.company_id, SaleRecord.product_id, func.date(SaleRecord.sale_date))
+    )
+    if company_id is not None:
+        query = query.where(Product.company_id == company_id)
+    
+    result = db.execute(
+        SalesDaily.__table__.insert().from_select(
+            ['company_id', 'product_id', 'sale_date', 'quantity', 'revenue', 'sale_count'], query
+        )
+    )
+    
+    # 월별 집계는 일별 집계에서 생성
+    sale_month = func.date(SalesDaily.sale_date, 'start of month')
+    monthly_query = (
+        select(
+            SalesDaily.company_id,
+            SalesDaily.product_id,
+            sale_month,
+            func.sum(SalesDaily.quantity),
+            func.sum(SalesDaily.revenue),
+            func.sum(SalesDaily.sale_count),
+        )
+        .group_by(SalesDaily.company_id, SalesDaily.product_id, sale_month)
+    )
+    if company_id is not None:
+        monthly_query = monthly_query.where(SalesDaily.company_id == company_id)
+    db.execute(
+        SalesMonthly.__table__.insert().from_select(
+            ['company_id', 'product_id', 'sale_month', 'quantity', 'revenue', 'sale_count'], monthly_query
+        )
+    )
+    
+    sales_stats_cache.clear()
+    return result.rowcount
+
+def _is_month_aligned(start_date: Optional[date], end_date: Optional[date]) -> bool:
+    """조회 기간이 월 단위 경계(1일 ~ 말일)에 맞는지 확인"""
+    return (start_date is None or start_date.day == 1) and \
+        (end_date is None or (end_date + timedelta(days=1)).day == 1)
+
+def sales_summary_query(period: str = 'day', company_id: Optional[int] = None,
+                        start_date: Optional[date] = None, end_date: Optional[date] = None,
+                        product_id: Optional[int] = None, group_by: Optional[str] = None):
+    """
+    일/주/월/연 단위 판매 통계 쿼리 (제품/분류/브랜드별 그룹 가능)
+    
+    월/연 통계는 기간이 월 경계에 맞으면 월별 집계를, 그 외에는 일별 집계를 사용함.
+    """
+    if period not in PERIOD_FORMATS:
+        raise ValueError(f"알 수 없는 통계 기간입니다: {period}")
+    if group_by is not None and group_by not in GROUP_COLUMNS:
+        raise ValueError(f"알 수 없는 그룹 기준입니다: {group_by}")
+    
+    if period in ('month', 'year') and _is_month_aligned(start_date, end_date):
+        model, date_key, native_period = SalesMonthly, SalesMonthly.sale_month, 'month'
+    else:
+        model, date_key, native_period = SalesDaily, SalesDaily.sale_date, 'day'
+    
+    period_key = func.strftime(PERIOD_FORMATS[period], date_key, *PERIOD_MODIFIERS.get(period, ())).label('period')
+    # 기간 단위가 집계 테이블 날짜 키와 같으면 날짜 키로 그룹화해 인덱스 순서를 그대로 사용 (임시 정렬 없음)
+    group_keys = [date_key if period == native_period else period_key]
+    columns = [period_key]
+    if group_by is not None:
+        # 제품명은 결과 행마다 조인하지 않고 호출 측에서 제품 ID로 한 번에 조회
+        group_key = (model.product_id if group_by == 'product' else GROUP_COLUMNS[group_by]).label('group')
+        group_keys.append(group_key)
+        columns.append(group_key)
+    
+    query = select(
+        *columns,
+        func.sum(model.quantity).label('quantity'),
+        func.sum(model.revenue).label('revenue'),
+        func.sum(model.sale_count).label('sale_count'),
+    )
+    if group_by in ('category', 'brand'):
+        query = query.join(Product, Product.id == model.product_id)
+    
+    if company_id is not None:
+        query = query.where(model.company_id == company_id)
+    if start_date:
+        query = query.where(date_key >= start_date)
+    if end_date:
+        query = query.where(date_key <= end_date)
+    if product_id:
+        query = query.where(model.product_id == product_id)
+    
+    return query.group_by(*group_keys).order_by(*group_keys)
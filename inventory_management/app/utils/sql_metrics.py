@@ -0,0 +1,146 @@
+import logging
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from app.config import SQL_N_PLUS_ONE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# 로그/헤더에 표시할 SQL 최대 길이
+MAX_STATEMENT_LENGTH = 200
+
+# 요청별 SQL 통계 응답 헤더 (브라우저 클라이언트가 읽을 수 있도록 CORS로 노출)
+QUERY_COUNT_HEADER = 'X-DB-Query-Count'
+DB_TIME_HEADER = 'X-DB-Time-Ms'
+N_PLUS_ONE_HEADER = 'X-DB-N-Plus-One'
+SERVER_TIMING_HEADER = 'Server-Timing'
+SQL_METRICS_HEADERS = [QUERY_COUNT_HEADER, DB_TIME_HEADER, N_PLUS_ONE_HEADER, SERVER_TIMING_HEADER]
+
+# 일치하는 라우트가 없는 요청의 집계 키 (스캐너/오타 경로마다 항목이 늘지 않도록 한 곳에 모음)
+UNMATCHED_ROUTE = '<unmatched>'
+
+# 집계 키에 그대로 쓰는 HTTP 메서드 (그 외 임의의 메서드는 OTHER로 모음)
+KNOWN_METHODS = {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'}
+
+class RequestSQLMetrics:
+    """HTTP 요청 1건 동안 실행된 SQL 통계"""
+
+    def __init__(self):
+        self.query_count = 0
+        self.total_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_statement: Optional[str] = None
+        self.statements = Counter()
+
+    def record(self, statement: str, elapsed: float):
+        self.query_count += 1
+        self.total_time += elapsed
+        self.statements[statement] += 1
+        if elapsed > self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = statement
+
+    def n_plus_one_suspects(self, threshold: int = SQL_N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        """같은 SQL이 threshold회 이상 반복된 경우 (예: 반복문 안의 지연 로딩)"""
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+# 현재 요청의 SQL 통계 (요청 밖에서 실행된 SQL은 집계하지 않음)
+_current_metrics: ContextVar[Optional[RequestSQLMetrics]] = ContextVar('sql_request_metrics', default=None)
+
+# 라우트별 누적 통계
+_route_totals: Dict[str, Dict[str, Any]] = {}
+_route_totals_lock = threading.Lock()
+
+def _shorten(statement: Optional[str]) -> str:
+    statement = ' '.join((statement or '').split())
+    return statement if len(statement) <= MAX_STATEMENT_LENGTH else statement[:MAX_STATEMENT_LENGTH] + '...'
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_metrics.get() is not None:
+        conn.info.setdefault('sql_metrics_start', []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    metrics = _current_metrics.get()
+    starts = conn.info.get('sql_metrics_start')
+    if metrics is None or not starts:
+        return
+    metrics.record(statement, time.perf_counter() - starts.pop())
+
+def install_sql_metrics(*engines):
+    """엔진에 SQL 계측 이벤트 등록 (비동기 엔진은 sync_engine 전달)"""
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+
+def _aggregate(route: str, metrics: RequestSQLMetrics, suspects: List[Tuple[str, int]]):
+    with _route_totals_lock:
+        totals = _route_totals.setdefault(route, {
+            'requests': 0, 'queries': 0, 'db_time_ms': 0.0, 'max_queries': 0,
+            'n_plus_one_requests': 0, 'slowest_ms': 0.0, 'slowest_statement': None,
+        })
+        totals['requests'] += 1
+        totals['queries'] += metrics.query_count
+        totals['db_time_ms'] += metrics.total_time * 1000
+        totals['max_queries'] = max(totals['max_queries'], metrics.query_count)
+        if suspects:
+            totals['n_plus_one_requests'] += 1
+        if metrics.slowest_time * 1000 > totals['slowest_ms']:
+            totals['slowest_ms'] = metrics.slowest_time * 1000
+            totals['slowest_statement'] = _shorten(metrics.slowest_statement)
+
+def get_sql_metrics() -> Dict[str, Dict[str, Any]]:
+    """라우트별 누적 SQL 통계 (요청당 평균 포함)"""
+    with _route_totals_lock:
+        result = {}
+        for route, totals in _route_totals.items():
+            result[route] = dict(
+                totals,
+                db_time_ms=round(totals['db_time_ms'], 3),
+                slowest_ms=round(totals['slowest_ms'], 3),
+                avg_queries=round(totals['queries'] / totals['requests'], 2),
+                avg_db_time_ms=round(totals['db_time_ms'] / totals['requests'], 3),
+            )
+        return result
+
+def reset_sql_metrics():
+    """누적 통계 초기화"""
+    with _route_totals_lock:
+        _route_totals.clear()
+
+async def sql_metrics_middleware(request, call_next):
+    """요청별 쿼리 수, DB 시간, 가장 느린 SQL을 응답 헤더와 로그로 기록하고 N+1 의심 SQL 경고"""
+    metrics = RequestSQLMetrics()
+    token = _current_metrics.set(metrics)
+    try:
+        response = await call_next(request)
+    finally:
+        _current_metrics.reset(token)
+
+    route = request.scope.get('route')
+    method = request.method if request.method in KNOWN_METHODS else 'OTHER'
+    route_name = f"{method} {route.path if route else UNMATCHED_ROUTE}"
+    db_time_ms = metrics.total_time * 1000
+    suspects = metrics.n_plus_one_suspects()
+
+    response.headers[QUERY_COUNT_HEADER] = str(metrics.query_count)
+    response.headers[DB_TIME_HEADER] = f"{db_time_ms:.2f}"
+    response.headers[SERVER_TIMING_HEADER] = f"db;dur={db_time_ms:.2f}"
+    if suspects:
+        response.headers[N_PLUS_ONE_HEADER] = str(len(suspects))
+
+    _aggregate(route_name, metrics, suspects)
+
+    logger.info(
+        f"[SQL] {route_name} path={request.url.path} status={response.status_code} queries={metrics.query_count} "
+        f"db_time_ms={db_time_ms:.2f} slowest_ms={metrics.slowest_time * 1000:.2f} "
+        f"slowest_sql={_shorten(metrics.slowest_statement)!r}"
+    )
+    for statement, count in suspects:
+        logger.warning(f"[N+1 의심] {route_name} 동일 SQL {count}회 실행: {_shorten(statement)}")
+
+    return response
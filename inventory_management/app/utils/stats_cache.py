@@ -0,0 +1,110 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Awaitable, Callable, Iterable, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# 캐시에 보관할 최대 통계 결과 수 (초과 시 가장 오래 사용하지 않은 항목부터 제거)
+STATS_CACHE_MAX_ENTRIES = 1024
+
+# 캐시 유효 시간 (초) - 무효화는 같은 프로세스의 변경만 감지하므로 워커가 여러 개일 때의 상한
+STATS_CACHE_TTL = 300
+
+# 통계 그룹(분류/브랜드)과 제품 라벨(이름)에 쓰이는 제품 필드 - 변경되면 회사의 전체 기간 통계 무효화
+STATS_PRODUCT_FIELDS = ('name', 'category', 'brand')
+
+class StatsCache:
+    """
+    판매 통계 결과 캐시
+    
+    키는 (회사 ID, 시작일, 종료일, 기타 조건...) 형식이며,
+    판매가 변경되면 해당 회사(또는 전체 회사 조회)이면서 변경일이 기간에 포함된 항목만 무효화함.
+    """
+    
+    def __init__(self, max_entries: int = STATS_CACHE_MAX_ENTRIES, ttl: float = STATS_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # 키 -> (결과, 만료 시각)
+        self._lock = threading.Lock()
+        self._version = 0  # 무효화될 때마다 증가 (조회 중 변경된 결과 저장 방지)
+    
+    def _lookup(self, key: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self._entries.move_to_end(key)
+                return True, entry[0], self._version
+            return False, None, self._version
+    
+    def _store(self, key: tuple, value: Any, version: int):
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = (value, time.monotonic() + self.ttl)
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+    
+    def get_or_compute(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        hit, value, version = self._lookup(key)
+        if not hit:
+            value = compute()
+            self._store(key, value, version)
+        return value
+    
+    async def get_or_compute_async(self, key: tuple, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """비동기 조회 함수용 get_or_compute"""
+        hit, value, version = self._lookup(key)
+        if not hit:
+            value = await compute()
+            self._store(key, value, version)
+        return value
+    
+    def invalidate(self, changes: Iterable[Tuple[int, Optional[date]]]):
+        """(회사 ID, 판매일) 변경분이 포함된 항목 무효화 (판매일이 None이면 회사의 모든 기간)"""
+        changes = list(changes)
+        if not changes:
+            return
+        with self._lock:
+            self._version += 1
+            for key in list(self._entries):
+                company_id, start_date, end_date = key[:3]
+                for changed_company, changed_day in changes:
+                    if company_id is not None and company_id != changed_company:
+                        continue
+                    if changed_day is None or (start_date is None or start_date <= changed_day) and \
+                            (end_date is None or changed_day <= end_date):
+                        del self._entries[key]
+                        break
+    
+    def clear(self):
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+
+# 판매 통계 캐시 (프로세스 단위)
+sales_stats_cache = StatsCache()
+
+# 커밋 전까지 세션에 모아 두는 변경분 키
+_PENDING_KEY = 'sales_stats_changes'
+
+def mark_sales_changed(db: Session, company_id: int, sale_day: date):
+    """판매 변경 기록 (트랜잭션이 커밋되면 캐시 무효화)"""
+    db.info.setdefault(_PENDING_KEY, set()).add((company_id, sale_day))
+
+def mark_product_stats_changed(db: Session, product, changes: dict):
+    """제품의 통계 그룹/라벨 필드가 바뀌면 회사의 전체 기간 통계 변경 기록 (트랜잭션이 커밋되면 캐시 무효화)"""
+    if any(field in changes and changes[field] != getattr(product, field) for field in STATS_PRODUCT_FIELDS):
+        db.info.setdefault(_PENDING_KEY, set()).add((product.company_id, None))
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_after_commit(session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    if changes:
+        sales_stats_cache.invalidate(changes)
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
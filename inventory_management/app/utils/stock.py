@@ -0,0 +1,218 @@
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import update, insert, select, literal, func, or_, case, Integer, String, DateTime
+from sqlalchemy.orm import Session
+
+from app.models.product import Product
+from app.models.inventory_movement import InventoryMovement, InventorySnapshot, MovementType
+from app.utils.stock_events import mark_stock_changed
+
+# 변경 후 재고를 바로 받아 커밋 시 재고 변경 이벤트로 전달
+_STOCK_RETURNING = (Product.id, Product.company_id, Product.current_stock)
+
+def _insert_movement(db: Session, product_id: int, quantity, movement_type: str,
+                     reference_id: Optional[int], created_by: Optional[int], *criteria):
+    """재고 변동 원장 INSERT (제품의 회사 ID는 같은 문장에서 조회)"""
+    if isinstance(quantity, int):
+        quantity = literal(quantity, Integer)
+    
+    db.execute(
+        insert(InventoryMovement.__table__).from_select(
+            ['product_id', 'company_id', 'quantity', 'movement_type',
+             'reference_id', 'created_by', 'created_at'],
+            select(
+                Product.id,
+                Product.company_id,
+                quantity,
+                literal(movement_type, String),
+                literal(reference_id, Integer),
+                literal(created_by, Integer),
+                literal(datetime.now(), DateTime),
+            ).where(Product.id == product_id, *criteria)
+        )
+    )
+
+def record_movement(db: Session, product_id: int, quantity: int, movement_type: str,
+                    reference_id: Optional[int] = None, created_by: Optional[int] = None):
+    """재고 변동 원장 기록"""
+    if quantity:
+        _insert_movement(db, product_id, quantity, movement_type, reference_id, created_by)
+
+def decrease_stock(db: Session, product_id: int, quantity: int, movement_type: str = MovementType.SALE,
+                   reference_id: Optional[int] = None, created_by: Optional[int] = None) -> bool:
+    """재고 차감
+    
+    재고 확인과 차감을 하나의 조건부 UPDATE 문으로 처리하므로
+    동시에 여러 판매가 들어와도 재고가 음수가 되지 않습니다.
+    차감된 경우 같은 트랜잭션에서 재고 변동 원장에 기록합니다.
+    
+    Returns:
+        bool: 재고가 충분하여 차감된 경우 True
+    """
+    row = db.execute(
+        update(Product)
+        .where(Product.id == product_id, Product.current_stock >= quantity)
+        .values(current_stock=Product.current_stock - quantity)
+        .returning(*_STOCK_RETURNING)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is None:
+        return False
+    mark_stock_changed(db, [row])
+    record_movement(db, product_id, -quantity, movement_type, reference_id, created_by)
+    return True
+
+def increase_stock(db: Session, product_id: int, quantity: int, movement_type: str = MovementType.PURCHASE,
+                   reference_id: Optional[int] = None, created_by: Optional[int] = None) -> bool:
+    """재고 증가
+    
+    Returns:
+        bool: 제품이 존재하여 재고가 증가된 경우 True
+    """
+    row = db.execute(
+        update(Product)
+        .where(Product.id == product_id)
+        .values(current_stock=Product.current_stock + quantity)
+        .returning(*_STOCK_RETURNING)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is None:
+        return False
+    mark_stock_changed(db, [row])
+    record_movement(db, product_id, quantity, movement_type, reference_id, created_by)
+    return True
+
+def adjust_stock(db: Session, product_id: int, delta: int, movement_type: str = MovementType.ADJUSTMENT,
+                 reference_id: Optional[int] = None, created_by: Optional[int] = None) -> bool:
+    """재고 증감 (음수이면 차감, 양수이면 증가)"""
+    if delta < 0:
+        return decrease_stock(db, product_id, -delta, movement_type, reference_id, created_by)
+    if delta > 0:
+        return increase_stock(db, product_id, delta, movement_type, reference_id, created_by)
+    return True
+
+def set_stock(db: Session, product_id: int, new_stock: int, movement_type: str = MovementType.ADJUSTMENT,
+              reference_id: Optional[int] = None, created_by: Optional[int] = None) -> bool:
+    """재고를 지정한 수량으로 변경하고 기존 재고와의 차이를 원장에 기록"""
+    # 원장 기록을 먼저 실행하여 변경 전 재고 기준으로 차이를 계산
+    _insert_movement(
+        db, product_id, literal(new_stock, Integer) - Product.current_stock,
+        movement_type, reference_id, created_by,
+        Product.current_stock != new_stock
+    )
+    row = db.execute(
+        update(Product)
+        .where(Product.id == product_id)
+        .values(current_stock=new_stock)
+        .returning(*_STOCK_RETURNING)
+        .execution_options(synchronize_session=False)
+    ).first()
+    if row is None:
+        return False
+    mark_stock_changed(db, [row])
+    return True
+
+def decrease_stock_many(db: Session, quantities: Dict[int, int]) -> Set[int]:
+    """여러 제품의 재고를 하나의 조건부 UPDATE 문으로 차감
+    
+    제품별 차감 수량(제품 ID -> 수량)을 CASE 식으로 묶어 재고가 충분한 제품만 차감합니다.
+    원장은 판매/구매 ID별로 기록해야 하므로 호출 측에서 record_movements로 기록합니다.
+    
+    Returns:
+        Set[int]: 재고가 충분하여 차감된 제품 ID
+    """
+    if not quantities:
+        return set()
+    amount = case(quantities, value=Product.id)
+    rows = db.execute(
+        update(Product)
+        .where(Product.id.in_(list(quantities)), Product.current_stock >= amount)
+        .values(current_stock=Product.current_stock - amount)
+        .returning(*_STOCK_RETURNING)
+        .execution_options(synchronize_session=False)
+    ).all()
+    mark_stock_changed(db, rows)
+    return {row.id for row in rows}
+
+def increase_stock_many(db: Session, quantities: Dict[int, int]) -> Set[int]:
+    """여러 제품의 재고를 하나의 UPDATE 문으로 증가 (원장은 호출 측에서 record_movements로 기록)
+    
+    Returns:
+        Set[int]: 재고가 증가된 제품 ID
+    """
+    if not quantities:
+        return set()
+    rows = db.execute(
+        update(Product)
+        .where(Product.id.in_(list(quantities)))
+        .values(current_stock=Product.current_stock + case(quantities, value=Product.id))
+        .returning(*_STOCK_RETURNING)
+        .execution_options(synchronize_session=False)
+    ).all()
+    mark_stock_changed(db, rows)
+    return {row.id for row in rows}
+
+def record_movements(db: Session, movements: List[dict]):
+    """재고 변동 원장 일괄 기록 (product_id, company_id, quantity, movement_type, reference_id, created_by)"""
+    now = datetime.now()
+    rows = [dict(movement, created_at=movement.get('created_at', now)) for movement in movements if movement['quantity']]
+    if rows:
+        db.execute(insert(InventoryMovement), rows)
+
+def create_stock_snapshots(db: Session, company_id: Optional[int] = None) -> int:
+    """마지막 스냅샷 이후 변동이 있었던 제품의 재고 스냅샷 생성
+    
+    Returns:
+        int: 생성된 스냅샷 수
+    """
+    last_movement_id = (
+        select(func.max(InventoryMovement.id))
+        .where(InventoryMovement.product_id == Product.id)
+        .scalar_subquery()
+    )
+    last_snapshot_movement_id = (
+        select(func.max(InventorySnapshot.last_movement_id))
+        .where(InventorySnapshot.product_id == Product.id)
+        .scalar_subquery()
+    )
+    
+    query = select(
+        Product.id,
+        Product.company_id,
+        Product.current_stock,
+        last_movement_id,
+        literal(datetime.now(), DateTime),
+    ).where(
+        last_movement_id.is_not(None),
+        or_(last_snapshot_movement_id.is_(None), last_movement_id > last_snapshot_movement_id)
+    )
+    if company_id is not None:
+        query = query.where(Product.company_id == company_id)
+    
+    result = db.execute(
+        insert(InventorySnapshot.__table__).from_select(
+            ['product_id', 'company_id', 'stock', 'last_movement_id', 'snapshot_at'],
+            query
+        )
+    )
+    return result.rowcount
+
+def get_stock_as_of(db: Session, product_id: int, as_of: datetime) -> int:
+    """특정 시점의 재고 조회 (가장 가까운 이전 스냅샷 + 이후 변동분)"""
+    snapshot = db.query(InventorySnapshot).filter(
+        InventorySnapshot.product_id == product_id,
+        InventorySnapshot.snapshot_at <= as_of
+    ).order_by(InventorySnapshot.snapshot_at.desc()).first()
+    
+    query = db.query(func.coalesce(func.sum(InventoryMovement.quantity), 0)).filter(
+        InventoryMovement.product_id == product_id,
+        InventoryMovement.created_at <= as_of
+    )
+    
+    base_stock = 0
+    if snapshot:
+        base_stock = snapshot.stock
+        query = query.filter(InventoryMovement.id > snapshot.last_movement_id)
+    
+    return base_stock + query.scalar()
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# 연결별로 쌓아 둘 최대 이벤트 수 (초과하면 쌓인 이벤트를 버리고 다시 동기화하도록 알림)
+STOCK_EVENT_QUEUE_SIZE = 100
+
+# 커밋 전까지 세션에 모아 두는 재고 변경분 키 (제품 ID -> (회사 ID, 재고))
+_PENDING_KEY = 'stock_changes'
+
+RESYNC_EVENT = {'type': 'resync'}
+
+def _deliver(deliveries: list):
+    for queue, message in deliveries:
+        if queue.full():
+            # 클라이언트가 이벤트를 따라오지 못하면 증분 동기화로 따라잡도록 함
+            while not queue.empty():
+                queue.get_nowait()
+            message = RESYNC_EVENT
+        queue.put_nowait(message)
+
+class StockEventHub:
+    """
+    재고 변경 이벤트 브로드캐스트 (프로세스 단위)
+    
+    구독은 회사 단위이며 company_id=None 구독자는 모든 회사의 이벤트를 받음.
+    발행은 커밋한 스레드(동기 엔드포인트의 스레드풀 포함)에서 호출되므로
+    구독자의 이벤트 루프별로 한 번에 넘겨서 큐에 넣음.
+    """
+    
+    def __init__(self, queue_size: int = STOCK_EVENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._subscribers: Dict[Optional[int], Dict[asyncio.Queue, asyncio.AbstractEventLoop]] = {}
+        self._lock = threading.Lock()
+    
+    def subscribe(self, company_id: Optional[int]) -> asyncio.Queue:
+        """구독 등록 (이벤트 루프 안에서 호출)"""
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(company_id, {})[queue] = asyncio.get_running_loop()
+        return queue
+    
+    def unsubscribe(self, company_id: Optional[int], queue: asyncio.Queue):
+        with self._lock:
+            subscribers = self._subscribers.get(company_id)
+            if subscribers is not None:
+                subscribers.pop(queue, None)
+                if not subscribers:
+                    del self._subscribers[company_id]
+    
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+    
+    def publish(self, changes: Dict[int, tuple]):
+        """
+        커밋된 재고 변경 {제품 ID: (회사 ID, 재고)}를 회사별 이벤트로 묶어 전달
+        
+        이벤트: {'type': 'stock', 'company_id': 1, 'products': [[제품 ID, 재고], ...]}
+        """
+        by_company = {}
+        for product_id, (company_id, stock) in changes.items():
+            by_company.setdefault(company_id, []).append([product_id, stock])
+        
+        deliveries = {}  # 이벤트 루프 -> [(큐, 이벤트)]
+        with self._lock:
+            everyone = list(self._subscribers.get(None, {}).items())
+            for company_id, products in by_company.items():
+                message = {'type': 'stock', 'company_id': company_id, 'products': products}
+                for queue, loop in list(self._subscribers.get(company_id, {}).items()) + everyone:
+                    deliveries.setdefault(loop, []).append((queue, message))
+        
+        for loop, items in deliveries.items():
+            try:
+                loop.call_soon_threadsafe(_deliver, items)
+            except RuntimeError:
+                pass  # 구독자의 이벤트 루프가 이미 종료됨
+
+stock_event_hub = StockEventHub()
+
+def mark_stock_changed(db: Session, rows: Iterable[tuple]):
+    """재고 변경 기록 (제품 ID, 회사 ID, 변경 후 재고) - 트랜잭션이 커밋되면 구독자에게 전달"""
+    pending = db.info.setdefault(_PENDING_KEY, {})
+    for product_id, company_id, stock in rows:
+        pending[product_id] = (company_id, stock)
+
+@event.listens_for(Session, 'after_commit')
+def _publish_after_commit(session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    if changes and stock_event_hub.has_subscribers():
+        stock_event_hub.publish(changes)
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,84 @@
+from typing import Any, Dict, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import select, func, exists, or_
+from sqlalchemy.orm import Session, aliased
+
+from app.models.product import Product
+from app.models.sale_record import SaleRecord
+from app.models.purchase_info import PurchaseInfo
+from app.models.user import User
+from app.models.company import Company
+from app.models.sync_change import SyncChange
+
+# 한 번에 반환할 기본/최대 변경 건수
+SYNC_PAGE_SIZE = 1000
+MAX_SYNC_PAGE_SIZE = 5000
+
+# 동기화 대상 (변경 로그의 테이블명 -> 모델)
+SYNC_MODELS = {
+    'products': Product,
+    'sale_records': SaleRecord,
+    'purchase_infos': PurchaseInfo,
+    'users': User,
+    'companies': Company,
+}
+
+# 응답에서 제외할 컬럼
+_EXCLUDED_COLUMNS = {'users': {'password_hash'}}
+
+def sync_columns(entity: str) -> list:
+    model = SYNC_MODELS[entity]
+    excluded = _EXCLUDED_COLUMNS.get(entity, set())
+    return [column for column in model.__table__.columns if column.name not in excluded]
+
+def fetch_changes(db: Session, entity: str, since: int = 0, company_id: Optional[int] = None,
+                  limit: int = SYNC_PAGE_SIZE, filters: Sequence = ()) -> Dict[str, Any]:
+    """
+    동기화 토큰(since) 이후 변경된 행과 삭제된 행 ID 조회
+    
+    since=0이면 전체 행을 순번 순으로 반환하므로 처음 동기화에도 같은 방식으로 사용합니다.
+    filters는 조회 권한 조건으로, 변경됐지만 조건에 맞지 않게 된 행(비활성 사용자 등)은 삭제로 보고합니다.
+    다른 회사로 옮겨진 행은 이전 회사 조회에서 삭제로 보고합니다.
+    
+    반환: {'sync_token', 'changed': [행], 'deleted': [ID], 'has_more'}
+    has_more가 True면 반환된 sync_token으로 다시 요청합니다.
+    """
+    if since < 0:
+        raise HTTPException(status_code=400, detail="잘못된 동기화 토큰입니다.")
+    
+    query = select(SyncChange.seq, SyncChange.row_id, SyncChange.deleted).where(
+        SyncChange.entity == entity, SyncChange.seq > since
+    )
+    if company_id is not None:
+        query = query.where(SyncChange.company_id == company_id)
+    else:
+        # 회사 구분 없는 조회에서는 회사 이동으로 남은 이전 회사 툼스톤 제외 (행은 다른 회사 키로 남아 있음)
+        live = aliased(SyncChange)
+        query = query.where(or_(
+            SyncChange.deleted == False,
+            ~exists().where(live.entity == SyncChange.entity, live.row_id == SyncChange.row_id, live.deleted == False)
+        ))
+    changes = db.execute(query.order_by(SyncChange.seq).limit(limit + 1)).all()
+    
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    if not changes:
+        # DB 초기화 등으로 토큰이 현재 순번보다 크면 전체 동기화가 필요함
+        if since and since > (db.scalar(select(func.max(SyncChange.seq))) or 0):
+            raise HTTPException(status_code=410, detail="동기화 토큰이 만료되었습니다. 전체 목록을 다시 받아야 합니다.")
+        return {'sync_token': since, 'changed': [], 'deleted': [], 'has_more': False}
+    
+    changed_ids = [row_id for _, row_id, deleted in changes if not deleted]
+    model = SYNC_MODELS[entity]
+    rows = db.execute(
+        select(*sync_columns(entity)).where(model.id.in_(changed_ids), *filters).order_by(model.id)
+    ).mappings().all() if changed_ids else []
+    
+    visible = {row['id'] for row in rows}
+    return {
+        'sync_token': changes[-1].seq,
+        'changed': [dict(row) for row in rows],
+        'deleted': list(dict.fromkeys(row_id for _, row_id, _ in changes if row_id not in visible)),
+        'has_more': has_more,
+    }
@@ -7,6 +7,7 @@ from . import auth, products, purchases, sales
 # API 라우터 임포트
 from app.api import user as user_api
 from app.api import company as company_api
+from app.api import metrics as metrics_api
 
 # 뷰 컴포넌트 임포트
 from .user_management_dialog import UserManagementDialog
@@ -21,6 +22,7 @@ def get_routers():
         sales.router,
         user_api.router,      # 사용자 관리 API
         company_api.router,   # 회사 관리 API
+        metrics_api.router,   # SQL 계측 통계 API
     ]
 
 # 공개할 모듈 목록
@@ -0,0 +1,80 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from app.config import API_BASE_URL, get_auth_header
+from app.views.workers import WORKER_THREADS
+
+# 요청 제한 시간 (연결, 응답 대기) 초
+API_CONNECT_TIMEOUT = 3.05
+API_READ_TIMEOUT = 15
+
+# 연결 실패/일시적 서버 오류 재시도 횟수와 백오프 (0.5초, 1초, 2초 간격)
+API_RETRIES = 3
+API_RETRY_BACKOFF = 0.5
+
+# 재시도할 응답 상태 코드 (프록시/서버 일시 장애)
+_RETRY_STATUSES = (502, 503, 504)
+
+# 재전송해도 결과가 같은 메서드 (POST는 연결 자체가 실패한 경우에만 재시도)
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'})
+
+_client = None
+
+class ApiClient:
+    """
+    데스크톱 앱의 서버 API 클라이언트
+
+    requests.Session 하나를 공유해 연결을 재사용(keep-alive)하며, 작업 스레드 수만큼 연결 풀을 둡니다.
+    요청마다 제한 시간을 적용하고 연결 실패와 502/503/504 응답은 지수 백오프로 재시도합니다.
+    인증 헤더는 요청할 때마다 토큰 저장소(메모리)에서 가져오므로 로그인/로그아웃이 바로 반영됩니다.
+    """
+
+    def __init__(self, base_url=API_BASE_URL, timeout=(API_CONNECT_TIMEOUT, API_READ_TIMEOUT),
+                 retries=API_RETRIES, backoff=API_RETRY_BACKOFF):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=_IDEMPOTENT_METHODS,
+            raise_on_status=False,  # 재시도 후에도 실패하면 마지막 응답을 그대로 반환
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=WORKER_THREADS, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def request(self, method, path, **kwargs):
+        """동기 요청 (작업 스레드에서 실행)"""
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method, f"{self.base_url}{path}", **kwargs)
+
+    def send(self, tasks, method, path, key=None, on_result=None, on_error=None, **kwargs):
+        """
+        tasks(TaskRunner)에서 요청하고 응답(requests.Response)을 on_result로 전달
+
+        key가 같은 이전 요청은 취소되며, 연결 실패/시간 초과는 재시도 후 on_error로 전달됩니다.
+        """
+        kwargs['headers'] = {**get_auth_header(), **kwargs.get('headers', {})}
+        return tasks.run(self.request, method, path, key=key, on_result=on_result, on_error=on_error, **kwargs)
+
+    def get(self, tasks, path, **kwargs):
+        return self.send(tasks, 'GET', path, **kwargs)
+
+    def post(self, tasks, path, **kwargs):
+        return self.send(tasks, 'POST', path, **kwargs)
+
+    def put(self, tasks, path, **kwargs):
+        return self.send(tasks, 'PUT', path, **kwargs)
+
+    def delete(self, tasks, path, **kwargs):
+        return self.send(tasks, 'DELETE', path, **kwargs)
+
+def api_client():
+    """앱 전체에서 공유하는 API 클라이언트"""
+    global _client
+    if _client is None:
+        _client = ApiClient()
+    return _client
@@ -1,17 +1,20 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from datetime import timedelta
 from typing import Annotated
 
-from app import get_db
+from app import get_db, get_async_db
 from app.models.user import User
 # UserRole은 이제 문자열로 처리됨
+from app.utils.principal_cache import Principal
 from app.utils.auth import (
-    authenticate_user,
+    access_token_claims,
+    authenticate_user_async,
     create_access_token,
-    get_current_active_user,
-    get_password_hash
+    get_current_active_user_async,
+    hash_password
 )
 from app.schemas.token import Token
 from app.schemas.user import User as UserSchema, UserCreate
@@ -25,9 +28,9 @@ router = APIRouter(
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user_async(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -36,15 +39,20 @@ async def login_for_access_token(
         )
     access_token_expires = timedelta(minutes=30)
     access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
+        data=access_token_claims(user), expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/users/me/", response_model=UserSchema)
 async def read_users_me(
-    current_user: Annotated[User, Depends(get_current_active_user)]
+    current_user: Annotated[Principal, Depends(get_current_active_user_async)],
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return current_user
+    # 비동기 세션으로 조회해 이벤트 루프를 막지 않음 (응답에 포함되는 회사 정보도 함께 로드)
+    user = await db.get(User, current_user.id, options=[selectinload(User.company)])
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
 
 @router.post("/register", response_model=UserSchema)
 def register_user(user: UserCreate, db: Session = Depends(get_db)):
@@ -59,11 +67,11 @@ def register_user(user: UserCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Email already registered")
     
     # 새 사용자 생성
-    hashed_password = get_password_hash(user.password)    # 기본 역할은 사용자로 설정
+    hashed_password = hash_password(user.password)    # 기본 역할은 사용자로 설정
     db_user = User(
         username=user.username,
         email=user.email,
-        password_hash=get_password_hash(user.password),
+        password_hash=hashed_password,
         company_id=user.company_id,
         role="user"
     )
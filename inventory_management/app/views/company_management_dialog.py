@@ -5,11 +5,12 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineE
 from PySide6.QtCore import Qt, Signal, QSize
 from PySide6.QtGui import QIntValidator, QIcon
 
-import requests
 import json
+import traceback
 from datetime import datetime
 
-from app.config import API_BASE_URL, get_auth_header
+from app.views.api_client import api_client
+from app.views.workers import TaskRunner, BusyIndicator
 
 class CompanyForm(QWidget):
     """회사 등록/수정 폼 위젯"""
@@ -91,6 +92,8 @@ class CompanyManagementDialog(QDialog):
         super().__init__(parent)
         self.is_super_admin = is_super_admin
         self.companies = []
+        # 목록 조회와 저장 요청은 백그라운드에서 실행
+        self.tasks = TaskRunner(self)
         self.init_ui()
         self.load_companies()
     
@@ -129,6 +132,7 @@ class CompanyManagementDialog(QDialog):
         self.refresh_btn = QPushButton("새로고침")
         self.refresh_btn.clicked.connect(self.load_companies)
         button_layout.addWidget(self.refresh_btn)
+        button_layout.addWidget(BusyIndicator(self.tasks))
         
         # 슈퍼 관리자가 아니면 추가/수정/삭제 버튼 비활성화
         if not self.is_super_admin:
@@ -140,52 +144,79 @@ class CompanyManagementDialog(QDialog):
         layout.addWidget(self.table)
         layout.addLayout(button_layout)
     
+    def done(self, result):
+        # 닫은 뒤 도착하는 응답은 무시
+        self.tasks.cancel_all()
+        super().done(result)
+    
     def load_companies(self):
-        """회사 목록 로드"""
+        """회사 목록 로드 (이전 요청이 끝나지 않았으면 그 결과는 버림)"""
+        print("[회사 관리] 회사 목록 로드 시도")
+        
+        # 페이징 파라미터 추가
+        params = {
+            'skip': 0,
+            'limit': 100  # 한 번에 가져올 최대 항목 수
+        }
+        
+        api_client().get(
+            self.tasks, "/api/companies/", params=params,
+            key='companies', on_result=self.on_companies_loaded, on_error=self.on_companies_failed,
+        )
+    
+    def on_companies_loaded(self, response):
+        print(f"[회사 관리] 응답 상태 코드: {response.status_code}")
+        
+        if response.status_code == 200:
+            response_data = response.json()
+            # items 필드에서 회사 목록을 가져옴
+            if isinstance(response_data, dict) and 'items' in response_data:
+                self.companies = response_data['items']
+                print(f"[회사 관리] 불러온 회사 수: {len(self.companies)}")
+                self.update_table()
+            else:
+                print(f"[회사 관리] 잘못된 응답 형식: {response_data}")
+                QMessageBox.warning(self, '오류', '잘못된 응답 형식입니다.')
+        else:
+            error_msg = response.text
+            print(f"[회사 관리] 오류 응답: {error_msg}")
+            QMessageBox.warning(self, '오류', f'회사 목록을 불러오는데 실패했습니다.\n\n상태 코드: {response.status_code}\n\n{error_msg}')
+    
+    def on_companies_failed(self, error):
+        error_detail = f'{str(error)}\n\n{"".join(traceback.format_exception(error))}'
+        print(f"[회사 관리] 예외 발생: {error_detail}")
+        QMessageBox.critical(self, '오류', f'회사 목록을 불러오는 중 오류가 발생했습니다.\n\n{error_detail}')
+    
+    def on_request_finished(self, response, success_status, success_message, action):
+        """회사 추가/수정/삭제 응답 처리"""
+        if response.status_code == success_status:
+            message = success_message
+            if action == '삭제':
+                try:
+                    message = response.json().get('message', success_message)
+                    print(f"[회사 삭제] 성공 - {message}")
+                except:
+                    pass
+            QMessageBox.information(self, '성공', message)
+            self.load_companies()
+            return
+        
         try:
-            print("[회사 관리] 회사 목록 로드 시도")
-            
-            # 인증 헤더 디버깅
-            headers = get_auth_header()
-            print(f"[회사 관리] 인증 헤더: {headers}")
-            
-            # API 요청
-            api_url = f"{API_BASE_URL}/api/companies/"
-            print(f"[회사 관리] API URL: {api_url}")
-            
-            # 페이징 파라미터 추가
-            params = {
-                'skip': 0,
-                'limit': 100  # 한 번에 가져올 최대 항목 수
-            }
-            
-            response = requests.get(
-                api_url,
-                headers=headers,
-                params=params
-            )
-            
-            print(f"[회사 관리] 응답 상태 코드: {response.status_code}")
-            
-            if response.status_code == 200:
-                response_data = response.json()
-                # items 필드에서 회사 목록을 가져옴
-                if isinstance(response_data, dict) and 'items' in response_data:
-                    self.companies = response_data['items']
-                    print(f"[회사 관리] 불러온 회사 수: {len(self.companies)}")
-                    self.update_table()
-                else:
-                    print(f"[회사 관리] 잘못된 응답 형식: {response_data}")
-                    QMessageBox.warning(self, '오류', '잘못된 응답 형식입니다.')
+            error_detail = response.json().get('detail', {})
+            if isinstance(error_detail, dict):
+                error_msg = '\n'.join([f"{k}: {v}" for k, v in error_detail.items()])
             else:
-                error_msg = response.text
-                print(f"[회사 관리] 오류 응답: {error_msg}")
-                QMessageBox.warning(self, '오류', f'회사 목록을 불러오는데 실패했습니다.\n\n상태 코드: {response.status_code}\n\n{error_msg}')
-        except Exception as e:
-            import traceback
-            error_detail = f'{str(e)}\n\n{traceback.format_exc()}'
-            print(f"[회사 관리] 예외 발생: {error_detail}")
-            QMessageBox.critical(self, '오류', f'회사 목록을 불러오는 중 오류가 발생했습니다.\n\n{error_detail}')
+                error_msg = str(error_detail)
+        except:
+            error_msg = response.text or f'회사 {action} 중 오류가 발생했습니다.'
+        
+        print(f"[회사 {action}] 오류 - {error_msg}")
+        QMessageBox.warning(self, '오류', f'회사 {action}에 실패했습니다.\n\n{error_msg}')
+    
+    def on_request_failed(self, error, action):
+        error_detail = f'{str(error)}\n\n{"".join(traceback.format_exception(error))}'
+        print(f"[회사 {action}] 예외 발생 - {error_detail}")
+        QMessageBox.critical(self, '오류', f'회사 {action} 중 오류가 발생했습니다.\n\n{error_detail}')
     
     def update_table(self):
         """테이블 업데이트"""
@@ -241,29 +272,13 @@ class CompanyManagementDialog(QDialog):
                 company_data = form.get_form_data()
                 print(f"[회사 추가] 회사 데이터: {company_data}")
                 
-                try:
-                    print(f"[회사 추가] API 요청: {company_data}")
-                    response = requests.post(
-                        f"{API_BASE_URL}/api/companies/",
-                        json=company_data,
-                        headers=get_auth_header()
-                    )
-                    
-                    if response.status_code == 201:
-                        QMessageBox.information(self, '성공', '회사가 추가되었습니다.')
-                        self.load_companies()
-                    else:
-                        try:
-                            error_detail = response.json().get('detail', {})
-                            if isinstance(error_detail, dict):
-                                error_msg = '\n'.join([f"{k}: {v}" for k, v in error_detail.items()])
-                            else:
-                                error_msg = str(error_detail)
-                        except:
-                            error_msg = response.text or '회사 추가 중 오류가 발생했습니다.'
-                        
-                        QMessageBox.warning(self, '오류', f'회사 추가에 실패했습니다.\n\n{error_msg}')
-                except Exception as e:
+                print(f"[회사 추가] API 요청: {company_data}")
+                api_client().post(
+                    self.tasks, "/api/companies/", json=company_data,
+                    on_result=lambda response: self.on_request_finished(response, 201, '회사가 추가되었습니다.', '추가'),
+                    on_error=lambda error: self.on_request_failed(error, '추가'),
+                )
+        except Exception as e:
                     import traceback
                     error_detail = f'{str(e)}\n\n{traceback.format_exc()}'
                     QMessageBox.critical(self, '오류', f'회사 추가 중 오류가 발생했습니다.\n\n{error_detail}')
@@ -300,29 +315,13 @@ class CompanyManagementDialog(QDialog):
                 company_data = form.get_form_data()
                 print(f"[회사 수정] 회사 데이터: {company_data}")
                 
-                try:
-                    print(f"[회사 수정] API 요청: {company_data}")
-                    response = requests.put(
-                        f"{API_BASE_URL}/api/companies/{company['id']}",
-                        json=company_data,
-                        headers=get_auth_header()
-                    )
-                    
-                    if response.status_code == 200:
-                        QMessageBox.information(self, '성공', '회사 정보가 수정되었습니다.')
-                        self.load_companies()
-                    else:
-                        try:
-                            error_detail = response.json().get('detail', {})
-                            if isinstance(error_detail, dict):
-                                error_msg = '\n'.join([f"{k}: {v}" for k, v in error_detail.items()])
-                            else:
-                                error_msg = str(error_detail)
-                        except:
-                            error_msg = response.text or '회사 수정 중 오류가 발생했습니다.'
-                        
-                        QMessageBox.warning(self, '오류', f'회사 수정에 실패했습니다.\n\n{error_msg}')
-                except Exception as e:
+                print(f"[회사 수정] API 요청: {company_data}")
+                api_client().put(
+                    self.tasks, f"/api/companies/{company['id']}", json=company_data,
+                    on_result=lambda response: self.on_request_finished(response, 200, '회사 정보가 수정되었습니다.', '수정'),
+                    on_error=lambda error: self.on_request_failed(error, '수정'),
+                )
+        except Exception as e:
                     import traceback
                     error_detail = f'{str(e)}\n\n{traceback.format_exc()}'
                     QMessageBox.critical(self, '오류', f'회사 수정 중 오류가 발생했습니다.\n\n{error_detail}')
@@ -348,48 +347,9 @@ class CompanyManagementDialog(QDialog):
         if reply != QMessageBox.Yes:
             return
             
-        try:
-            print(f"[회사 삭제] 삭제 요청 - 회사 ID: {company['id']}, 회사명: {company['name']}")
-            
-            # 인증 헤더 디버깅
-            headers = get_auth_header()
-            print(f"[회사 삭제] 인증 헤더: {headers}")
-            
-            # API 요청
-            api_url = f"{API_BASE_URL}/api/companies/{company['id']}"
-            print(f"[회사 삭제] API URL: {api_url}")
-            
-            response = requests.delete(
-                api_url,
-                headers=headers
-            )
-            
-            print(f"[회사 삭제] 응답 상태 코드: {response.status_code}")
-            
-            if response.status_code == 200:
-                try:
-                    result = response.json()
-                    message = result.get('message', '회사가 삭제되었습니다.')
-                    print(f"[회사 삭제] 성공 - {message}")
-                except:
-                    message = '회사가 삭제되었습니다.'
-                
-                QMessageBox.information(self, '성공', message)
-                self.load_companies()
-            else:
-                try:
-                    error_detail = response.json().get('detail', {})
-                    if isinstance(error_detail, dict):
-                        error_msg = '\n'.join([f"{k}: {v}" for k, v in error_detail.items()])
-                    else:
-                        error_msg = str(error_detail)
-                except:
-                    error_msg = response.text or '회사 삭제 중 오류가 발생했습니다.'
-                
-                print(f"[회사 삭제] 오류 - {error_msg}")
-                QMessageBox.warning(self, '오류', f'회사 삭제에 실패했습니다.\n\n{error_msg}')
-        except Exception as e:
-            import traceback
-            error_detail = f'{str(e)}\n\n{traceback.format_exc()}'
-            print(f"[회사 삭제] 예외 발생 - {error_detail}")
-            QMessageBox.critical(self, '오류', f'회사 삭제 중 오류가 발생했습니다.\n\n{error_detail}')
+        print(f"[회사 삭제] 삭제 요청 - 회사 ID: {company['id']}, 회사명: {company['name']}")
+        api_client().delete(
+            self.tasks, f"/api/companies/{company['id']}",
+            on_result=lambda response: self.on_request_finished(response, 200, '회사가 삭제되었습니다.', '삭제'),
+            on_error=lambda error: self.on_request_failed(error, '삭제'),
+        )
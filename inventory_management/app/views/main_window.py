@@ -1,19 +1,120 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QTabWidget, QLabel, QStatusBar,
-    QMessageBox, QTableWidget, QTableWidgetItem, QHeaderView,
+    QMessageBox, QTableWidget, QTableWidgetItem, QTableView, QHeaderView,
     QAbstractItemView, QDialog, QFormLayout, QLineEdit,
     QComboBox, QSpinBox, QDoubleSpinBox, QCheckBox,
     QDateEdit, QTextEdit, QFileDialog, QDialogButtonBox
 )
-from PySide6.QtCore import Qt, QDate
+from PySide6.QtCore import Qt, QDate, QTimer, QUrl
 from PySide6.QtGui import QAction, QIcon, QPixmap
+from PySide6.QtNetwork import QNetworkRequest
+from PySide6.QtWebSockets import QWebSocket
+from sqlalchemy.orm import sessionmaker
+import json
+import traceback
 
 from ..controllers.product_controller import ProductController
 from .product_dialog import ProductDialog
+from .product_table_model import ProductTableModel, NAME_COLUMN
+from .workers import TaskRunner, BusyIndicator
 from .user_management_dialog import UserManagementDialog
 from .company_management_dialog import CompanyManagementDialog
 from ..models.user import User as UserModel
+from ..models.product import Product
+from ..models.inventory_movement import MovementType
+from ..utils.stock import record_movement, set_stock
+from ..utils.sales_rollup import remove_product_from_rollup
+from ..utils.stats_cache import mark_product_stats_changed
+from ..config import API_BASE_URL, get_auth_header, clear_auth_token
+
+# 재고 변경 알림 연결이 끊겼을 때 다시 연결할 간격 (밀리초)
+STOCK_EVENTS_RECONNECT_MS = 5000
+
+# 제품 저장/조회 작업 (작업 스레드에서 각자의 세션으로 실행)
+def _create_product(session_factory, company_id, product_data):
+    with session_factory() as session:
+        new_product = Product(
+            name=product_data['name'],
+            code=product_data['code'],
+            category=product_data['category'],
+            brand=product_data['brand'],
+            model=product_data['model'],
+            current_stock=product_data['stock'],
+            minimum_stock=product_data['min_stock'],
+            price=product_data['selling_price'],
+            tax_included=product_data['tax_included'],
+            company_id=company_id
+        )
+        
+        # 데이터베이스에 추가
+        session.add(new_product)
+        session.flush()  # 재고 원장에 기록할 제품 ID를 얻기 위해 flush
+        
+        # 초기 재고 원장 기록
+        record_movement(session, new_product.id, product_data['stock'], MovementType.INITIAL)
+        session.commit()
+
+def _load_product_form(session_factory, product_id):
+    """수정 다이얼로그에 채울 제품 정보 (없으면 None)"""
+    with session_factory() as session:
+        product = session.get(Product, product_id)
+        if not product:
+            return None
+        
+        # 제품 정보를 딕셔너리로 변환
+        product_data = product.to_dict()
+        
+        # 구매 정보 조회 (가장 최근 입고 정보)
+        if product.purchases:
+            purchase = product.purchases[0]
+            product_data.update({
+                'cost_price': purchase.unit_price,
+                'supplier': {
+                    'name': purchase.supplier_name,
+                    'business_number': purchase.business_number or '',
+                    'address': purchase.supplier_address or '',
+                    'phone': purchase.supplier_phone or ''
+                }
+            })
+        return product_data
+
+def _update_product(session_factory, product_id, product_data):
+    """제품 수정 (제품이 없으면 False)"""
+    with session_factory() as session:
+        product = session.get(Product, product_id)
+        if not product:
+            return False
+        
+        # 분류/브랜드/이름이 바뀌면 커밋 시 회사의 그룹별 판매 통계 캐시 무효화
+        mark_product_stats_changed(session, product, product_data)
+        
+        # 제품 정보 업데이트
+        product.name = product_data['name']
+        product.code = product_data['code']
+        product.category = product_data['category']
+        product.brand = product_data['brand']
+        product.model = product_data['model']
+        set_stock(session, product.id, product_data['stock'], MovementType.ADJUSTMENT)
+        product.minimum_stock = product_data['min_stock']
+        product.price = product_data['selling_price']
+        product.tax_included = product_data['tax_included']
+        
+        # 변경사항 저장
+        session.commit()
+        return True
+
+def _delete_product(session_factory, product_id):
+    """제품 삭제 (제품이 없으면 False)"""
+    with session_factory() as session:
+        product = session.get(Product, product_id)
+        if not product:
+            return False
+        # 함께 삭제되는 판매 기록의 집계분 제거
+        remove_product_from_rollup(session, product.id)
+        session.delete(product)
+        session.commit()
+        return True
 
 class ProductTableWidget(QWidget):
     def __init__(self, db_session, company_id, parent=None):
@@ -21,6 +122,11 @@ class ProductTableWidget(QWidget):
         self.db_session = db_session
         self.company_id = company_id
         self.product_controller = ProductController(db_session)
+        # DB 작업은 스레드풀에서 실행하므로 GUI 스레드의 세션 대신 작업마다 새 세션 사용
+        self.session_factory = sessionmaker(bind=db_session.get_bind(), autoflush=False)
+        self.tasks = TaskRunner(self)
+        self.model = ProductTableModel(self.session_factory, company_id, self.tasks, parent=self)
+        self.model.load_failed.connect(self.on_load_failed)
         self.init_ui()
     
     def init_ui(self):
@@ -45,20 +151,19 @@ class ProductTableWidget(QWidget):
         button_layout.addWidget(self.edit_btn)
         button_layout.addWidget(self.delete_btn)
         button_layout.addStretch()
+        button_layout.addWidget(BusyIndicator(self.tasks))
         button_layout.addWidget(self.refresh_btn)
         
-        # 테이블 위젯
-        self.table = QTableWidget()
-        self.table.setColumnCount(10)
-        self.table.setHorizontalHeaderLabels([
-            'ID', '상품코드', '상품명', '분류', '브랜드', '모델명', 
-            '현재재고', '최소재고', '판매가', '등록일'
-        ])
+        # 테이블 뷰 (스크롤할 때마다 모델이 다음 페이지를 불러옴)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
         # 테이블 속성 설정
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setVisible(False)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         
         # 레이아웃에 위젯 추가
@@ -67,42 +172,26 @@ class ProductTableWidget(QWidget):
         
         self.setLayout(layout)
         
-        # 데이터 로드
-        self.load_products()
+        # 첫 페이지 로드
+        self.model.reset()
     
     def load_products(self):
-        """제품 목록 로드"""
-        from ..models import Product
-        
-        try:
-            # 테이블 초기화
-            self.table.setRowCount(0)
-            
-            # 제품 조회
-            # 이미 세션 객체를 가지고 있으므로 직접 사용
-            session = self.db_session
-            products = session.query(Product).filter(
-                Product.company_id == self.company_id
-            ).order_by(Product.created_at.desc()).all()
-            
-            for row, product in enumerate(products):
-                self.table.insertRow(row)
-                self.table.setItem(row, 0, QTableWidgetItem(str(product.id)))
-                self.table.setItem(row, 1, QTableWidgetItem(product.code))
-                self.table.setItem(row, 2, QTableWidgetItem(product.name))
-                self.table.setItem(row, 3, QTableWidgetItem(product.category or ''))
-                self.table.setItem(row, 4, QTableWidgetItem(product.brand or ''))
-                self.table.setItem(row, 5, QTableWidgetItem(product.model or ''))
-                self.table.setItem(row, 6, QTableWidgetItem(str(product.current_stock)))
-                self.table.setItem(row, 7, QTableWidgetItem(str(product.minimum_stock)))
-                self.table.setItem(row, 8, QTableWidgetItem(f"{product.price:,.0f}원"))
-                self.table.setItem(row, 9, QTableWidgetItem(product.created_at.strftime('%Y-%m-%d') if product.created_at else ''))
-            
-            # 컬럼 너비 조정
-            self.table.resizeColumnsToContents()
-            
-        except Exception as e:
-            QMessageBox.critical(self, '오류', f'제품 목록을 불러오는 중 오류가 발생했습니다: {str(e)}')
+        """제품 목록 새로고침 (마지막 동기화 이후 변경/삭제된 제품만 반영)"""
+        self.model.refresh()
+    
+    def on_load_failed(self, message):
+        QMessageBox.critical(self, '오류', f'제품 목록을 불러오는 중 오류가 발생했습니다: {message}')
+    
+    def on_task_failed(self, action, error):
+        """저장/삭제 작업 실패 처리 (action: '등록', '수정', '삭제' 등)"""
+        QMessageBox.critical(self, '오류', f'제품 {action} 중 오류가 발생했습니다: {str(error)}')
+        # 오류 로그 출력
+        print(f"\n제품 {action} 오류: {str(error)}")
+        print(''.join(traceback.format_exception(error)))
+    
+    def update_stock(self, stocks):
+        """재고 변경 알림 반영 (제품 ID -> 재고)"""
+        self.model.update_stock(stocks)
     
     def add_product(self):
         """제품 추가"""
@@ -117,41 +206,17 @@ class ProductTableWidget(QWidget):
     
     def on_product_saved(self, product_data):
         """제품 데이터 저장"""
-        try:
-            from ..models import Product
-            
-            # 이미 세션 객체를 가지고 있으므로 직접 사용
-            session = self.db_session
-            
-            # 새 제품 객체 생성
-            new_product = Product(
-                name=product_data['name'],
-                code=product_data['code'],
-                category=product_data['category'],
-                brand=product_data['brand'],
-                model=product_data['model'],
-                current_stock=product_data['stock'],
-                minimum_stock=product_data['min_stock'],
-                price=product_data['selling_price'],
-                tax_included=product_data['tax_included'],
-                company_id=self.company_id
-            )
-            
-            # 데이터베이스에 추가
-            session.add(new_product)
-            session.commit()
-            
-            QMessageBox.information(self, '성공', '제품이 성공적으로 등록되었습니다.')
-            
-            # 제품 목록 새로고침
-            self.load_products()
-            
-        except Exception as e:
-            QMessageBox.critical(self, '오류', f'제품 등록 중 오류가 발생했습니다: {str(e)}')
-            # 오류 로그 출력
-            import traceback
-            print(f"\n제품 등록 오류: {str(e)}")
-            print(traceback.format_exc())
+        self.tasks.run(
+            _create_product, self.session_factory, self.company_id, product_data,
+            on_result=self.on_product_created,
+            on_error=lambda error: self.on_task_failed('등록', error),
+        )
+    
+    def on_product_created(self, result):
+        QMessageBox.information(self, '성공', '제품이 성공적으로 등록되었습니다.')
+        
+        # 제품 목록 새로고침
+        self.load_products()
     
     def edit_product(self):
         """제품 수정"""
@@ -160,39 +225,26 @@ class ProductTableWidget(QWidget):
             QMessageBox.warning(self, '경고', '수정할 제품을 선택해주세요.')
             return
             
-        product_id = int(self.table.item(selected[0].row(), 0).text())
-        
-        # 제품 정보 조회
-        from ..models import Product
-        
-        # 이미 세션 객체를 가지고 있으므로 직접 사용
-        session = self.db_session
-        product = session.query(Product).get(product_id)
-        if not product:
+        product_id = self.model.product_id(selected[0].row())
+        
+        # 제품 정보 조회 후 다이얼로그 열기
+        self.tasks.run(
+            _load_product_form, self.session_factory, product_id,
+            key='edit',
+            on_result=lambda product_data: self.open_edit_dialog(product_id, product_data),
+            on_error=lambda error: self.on_task_failed('조회', error),
+        )
+    
+    def open_edit_dialog(self, product_id, product_data):
+        if not product_data:
             QMessageBox.warning(self, '경고', '선택한 제품을 찾을 수 없습니다.')
             return
-            
-        # 제품 정보를 딕셔너리로 변환
-        product_data = product.to_dict()
-        
-        # 구매 정보 조회 (가장 최근 입고 정보)
-        if product.purchases:
-            purchase = product.purchases[0]
-            product_data.update({
-                'cost_price': purchase.unit_price,
-                'supplier': {
-                    'name': purchase.supplier_name,
-                    'business_number': purchase.business_number or '',
-                    'address': purchase.supplier_address or '',
-                    'phone': purchase.supplier_phone or ''
-                }
-            })
         
         # 다이얼로그 열기
         dialog = ProductDialog(product=product_data)
         
         # 제품 저장 시그널 연결
-        dialog.product_saved.connect(lambda data: self.on_product_updated(product.id, data))
+        dialog.product_saved.connect(lambda data: self.on_product_updated(product_id, data))
         
         if dialog.exec() == QDialog.Accepted:
             # 제품 수정 로직은 on_product_updated에서 처리됨
@@ -200,43 +252,21 @@ class ProductTableWidget(QWidget):
     
     def on_product_updated(self, product_id, product_data):
         """제품 데이터 업데이트"""
-        try:
-            from ..models import Product
-            
-            # 이미 세션 객체를 가지고 있으므로 직접 사용
-            session = self.db_session
-            
-            # 제품 조회
-            product = session.query(Product).get(product_id)
-            if not product:
-                QMessageBox.warning(self, '경고', '선택한 제품을 찾을 수 없습니다.')
-                return
-            
-            # 제품 정보 업데이트
-            product.name = product_data['name']
-            product.code = product_data['code']
-            product.category = product_data['category']
-            product.brand = product_data['brand']
-            product.model = product_data['model']
-            product.current_stock = product_data['stock']
-            product.minimum_stock = product_data['min_stock']
-            product.price = product_data['selling_price']
-            product.tax_included = product_data['tax_included']
-            
-            # 변경사항 저장
-            session.commit()
-            
-            QMessageBox.information(self, '성공', '제품이 성공적으로 수정되었습니다.')
-            
-            # 제품 목록 새로고침
-            self.load_products()
-            
-        except Exception as e:
-            QMessageBox.critical(self, '오류', f'제품 수정 중 오류가 발생했습니다: {str(e)}')
-            # 오류 로그 출력
-            import traceback
-            print(f"\n제품 수정 오류: {str(e)}")
-            print(traceback.format_exc())
+        self.tasks.run(
+            _update_product, self.session_factory, product_id, product_data,
+            on_result=lambda updated: self.on_product_written(updated, '제품이 성공적으로 수정되었습니다.'),
+            on_error=lambda error: self.on_task_failed('수정', error),
+        )
+    
+    def on_product_written(self, found, message):
+        if not found:
+            QMessageBox.warning(self, '경고', '선택한 제품을 찾을 수 없습니다.')
+            return
+        
+        QMessageBox.information(self, '성공', message)
+        
+        # 제품 목록 새로고침
+        self.load_products()
     
     def delete_product(self):
         """제품 삭제"""
@@ -245,8 +275,8 @@ class ProductTableWidget(QWidget):
             QMessageBox.warning(self, '경고', '삭제할 제품을 선택해주세요.')
             return
             
-        product_id = int(self.table.item(selected[0].row(), 0).text())
-        product_name = self.table.item(selected[0].row(), 2).text()
+        product_id = self.model.product_id(selected[0].row())
+        product_name = self.model.index(selected[0].row(), NAME_COLUMN).data()
         
         reply = QMessageBox.question(
             self, '확인', 
@@ -255,30 +285,21 @@ class ProductTableWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                # 제품 삭제 로직
-                from ..models import Product
-                
-                # 이미 세션 객체를 가지고 있으므로 직접 사용
-                session = self.db_session
-                product = session.query(Product).get(product_id)
-                if product:
-                    session.delete(product)
-                    session.commit()
-                    QMessageBox.information(self, '성공', '제품이 삭제되었습니다.')
-                    self.load_products()
-                else:
-                    QMessageBox.warning(self, '경고', '선택한 제품을 찾을 수 없습니다.')
-                        
-            except Exception as e:
-                QMessageBox.critical(self, '오류', f'제품 삭제 중 오류가 발생했습니다: {str(e)}')
+            self.tasks.run(
+                _delete_product, self.session_factory, product_id,
+                on_result=lambda deleted: self.on_product_written(deleted, '제품이 삭제되었습니다.'),
+                on_error=lambda error: self.on_task_failed('삭제', error),
+            )
 
 class MainWindow(QMainWindow):
     def __init__(self, auth_controller):
         super().__init__()
         self.auth_controller = auth_controller
         self.current_user = auth_controller.current_user
+        self.stock_socket = None
+        self.closing = False
         self.init_ui()
+        self.connect_stock_events()
         
     def init_ui(self):
         self.setWindowTitle('재고관리 시스템')
@@ -370,13 +391,13 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout()
         
         # 제품 관리 위젯 추가
-        self.product_table = ProductTableWidget(
+        self.product_widget = ProductTableWidget(
             db_session=self.auth_controller.db,
             company_id=self.current_user.company_id,
             parent=self
         )
         
-        layout.addWidget(self.product_table)
+        layout.addWidget(self.product_widget)
         self.inventory_tab.setLayout(layout)
         layout = QVBoxLayout()
         
@@ -467,6 +488,7 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             self.auth_controller.logout()
+            clear_auth_token()
             self.close()
     
     def show_settings(self):
@@ -481,6 +503,42 @@ class MainWindow(QMainWindow):
             '© 2025 재고관리 시스템. All rights reserved.'
         )
     
+    def connect_stock_events(self):
+        """재고 변경 알림 구독 (판매/구매가 커밋되면 해당 제품 행의 재고만 갱신)"""
+        if self.closing:
+            return
+        if self.stock_socket is None:
+            self.stock_socket = QWebSocket()
+            self.stock_socket.textMessageReceived.connect(self.on_stock_event)
+            self.stock_socket.connected.connect(self.on_stock_events_connected)
+            self.stock_socket.disconnected.connect(self.on_stock_events_disconnected)
+        
+        request = QNetworkRequest(QUrl(API_BASE_URL.replace('http', 'ws', 1) + '/ws/stock'))
+        authorization = get_auth_header().get('Authorization')
+        if authorization:
+            request.setRawHeader(b'Authorization', authorization.encode('utf-8'))
+        self.stock_socket.open(request)
+    
+    def on_stock_events_connected(self):
+        # 연결이 끊긴 동안의 변경분 반영
+        self.product_widget.load_products()
+    
+    def on_stock_events_disconnected(self):
+        # 서버에 연결할 수 없으면 새로고침 버튼으로 갱신하면서 주기적으로 다시 연결
+        if not self.closing:
+            QTimer.singleShot(STOCK_EVENTS_RECONNECT_MS, self.connect_stock_events)
+    
+    def on_stock_event(self, message):
+        event = json.loads(message)
+        if event.get('type') == 'stock':
+            self.product_widget.update_stock({product_id: stock for product_id, stock in event['products']})
+        elif event.get('type') == 'resync':
+            self.product_widget.load_products()
+    
     def closeEvent(self, event):
         # 애플리케이션 종료 전 처리
+        self.closing = True
+        if self.stock_socket is not None:
+            self.stock_socket.close()
+        self.product_widget.tasks.cancel_all()
         event.accept()
@@ -0,0 +1,256 @@
+from bisect import bisect_left
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from fastapi import HTTPException
+from sqlalchemy import select, func
+
+from ..models.product import Product
+from ..models.sync_change import SyncChange
+from ..utils.sync import fetch_changes
+
+# 스크롤이 끝에 닿을 때마다 DB에서 가져올 행 수
+PRODUCT_FETCH_SIZE = 500
+
+# (헤더, 컬럼) - 행은 이 순서의 튜플로 보관
+PRODUCT_TABLE_COLUMNS = [
+    ('ID', Product.id),
+    ('상품코드', Product.code),
+    ('상품명', Product.name),
+    ('분류', Product.category),
+    ('브랜드', Product.brand),
+    ('모델명', Product.model),
+    ('현재재고', Product.current_stock),
+    ('최소재고', Product.minimum_stock),
+    ('판매가', Product.price),
+    ('등록일', Product.created_at),
+]
+
+ID_COLUMN, NAME_COLUMN, STOCK_COLUMN, MIN_STOCK_COLUMN, PRICE_COLUMN, CREATED_COLUMN = 0, 2, 6, 7, 8, 9
+
+# 오른쪽 정렬할 숫자 컬럼
+_NUMBER_COLUMNS = (ID_COLUMN, STOCK_COLUMN, MIN_STOCK_COLUMN, PRICE_COLUMN)
+
+_FIELDS = [column.key for _, column in PRODUCT_TABLE_COLUMNS]
+
+def load_product_page(session_factory, company_id, before_id=None, limit=PRODUCT_FETCH_SIZE, with_token=False):
+    """
+    제품 한 페이지(ID 역순) 조회 - 작업 스레드에서 실행
+
+    반환: (동기화 토큰, 행 튜플 목록). with_token이면 페이지 조회 전의 변경 순번을 함께 반환합니다.
+    """
+    with session_factory() as session:
+        token = session.scalar(select(func.coalesce(func.max(SyncChange.seq), 0))) if with_token else None
+        query = select(*[column for _, column in PRODUCT_TABLE_COLUMNS]).where(Product.company_id == company_id)
+        if before_id is not None:
+            query = query.where(Product.id < before_id)
+        rows = [tuple(row) for row in session.execute(query.order_by(Product.id.desc()).limit(limit))]
+    return token, rows
+
+def load_product_changes(session_factory, company_id, since):
+    """
+    동기화 토큰 이후 변경/삭제된 제품을 모두 모아 조회 - 작업 스레드에서 실행
+
+    반환: (새 동기화 토큰, 제품 ID -> 컬럼 dict, 삭제된 제품 ID 집합), 토큰이 만료됐으면 None
+    """
+    changed, deleted = {}, set()
+    with session_factory() as session:
+        while True:
+            try:
+                page = fetch_changes(session, 'products', since=since, company_id=company_id)
+            except HTTPException as e:
+                if e.status_code != 410:
+                    raise
+                return None
+
+            for product in page['changed']:
+                changed[product['id']] = product
+                deleted.discard(product['id'])
+            for product_id in page['deleted']:
+                changed.pop(product_id, None)
+                deleted.add(product_id)
+            since = page['sync_token']
+            if not page['has_more']:
+                break
+    return since, changed, deleted
+
+class ProductTableModel(QAbstractTableModel):
+    """
+    제품 목록 모델 (QTableView용)
+
+    행은 컬럼 순서의 튜플로만 보관하고 표시 문자열은 그릴 때 만들며,
+    canFetchMore/fetchMore로 스크롤할 때마다 ID 역순(최신 등록순) 키셋 페이지를 가져옵니다.
+    페이지 조회와 증분 동기화는 tasks(TaskRunner)에서 별도 세션으로 실행하므로 GUI 스레드를 막지 않습니다.
+    증분 동기화 결과는 불러온 범위 안의 행에만 반영하고, 아직 불러오지 않은 범위는 나중에 읽을 때 반영됩니다.
+    """
+
+    # 조회 실패 (오류 메시지)
+    load_failed = Signal(str)
+
+    def __init__(self, session_factory, company_id, tasks, fetch_size=PRODUCT_FETCH_SIZE, parent=None):
+        super().__init__(parent)
+        self.session_factory = session_factory
+        self.company_id = company_id
+        self.tasks = tasks
+        self.fetch_size = fetch_size
+        self.rows = []
+        self.has_more = True
+        self.sync_token = None  # 첫 페이지를 불러오기 전에는 None
+        self._sync_pending = False
+        self._page_failed = False
+        self._positions = None  # 제품 ID -> 행 번호 (행이 추가/삭제되면 다시 계산)
+
+    def reset(self):
+        """처음부터 다시 불러오기 (진행 중인 조회 결과는 버림)"""
+        self.tasks.cancel('page')
+        self.tasks.cancel('sync')
+        self.beginResetModel()
+        self.rows = []
+        self.has_more = True
+        self.sync_token = None
+        self._sync_pending = False
+        self._page_failed = False
+        self._positions = None
+        self.endResetModel()
+        self.fetchMore()
+
+    def refresh(self):
+        """새로고침 (마지막 동기화 이후 변경/삭제된 제품만 반영, 조회가 실패했으면 처음부터)"""
+        if self._page_failed:
+            self.reset()
+        elif self.sync_token is None:
+            # 첫 페이지를 불러오는 중이면 끝난 뒤 동기화
+            self._sync_pending = True
+        else:
+            self.tasks.run(
+                load_product_changes, self.session_factory, self.company_id, self.sync_token,
+                key='sync', on_result=self._changes_loaded, on_error=self._load_error,
+            )
+
+    # 모델 인터페이스
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(PRODUCT_TABLE_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return PRODUCT_TABLE_COLUMNS[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            value = self.rows[index.row()][index.column()]
+            if value is None:
+                return ''
+            if index.column() == PRICE_COLUMN:
+                return f"{value:,.0f}원"
+            if index.column() == CREATED_COLUMN:
+                return value.strftime('%Y-%m-%d')
+            return str(value)
+        if role == Qt.TextAlignmentRole and index.column() in _NUMBER_COLUMNS:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.has_more and not self.tasks.is_running('page')
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        before_id = self.rows[-1][ID_COLUMN] if self.rows else None
+        self.tasks.run(
+            load_product_page, self.session_factory, self.company_id, before_id, self.fetch_size + 1,
+            self.sync_token is None, key='page', on_result=self._page_loaded, on_error=self._page_error,
+        )
+
+    def _page_loaded(self, result):
+        token, page = result
+        self.has_more = len(page) > self.fetch_size
+        page = page[:self.fetch_size]
+        if page:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(page) - 1)
+            self.rows.extend(page)
+            self._positions = None
+            self.endInsertRows()
+        if token is not None:
+            self.sync_token = token
+            if self._sync_pending:
+                self._sync_pending = False
+                self.refresh()
+
+    def _page_error(self, error):
+        # 스크롤할 때마다 다시 시도하지 않도록 멈추고 새로고침 시 처음부터 다시 불러옴
+        self.has_more = False
+        self._page_failed = True
+        self._load_error(error)
+
+    def _changes_loaded(self, result):
+        if result is None:
+            # 동기화 토큰이 만료되면 처음부터 다시 불러옴
+            self.reset()
+            return
+        self.sync_token, changed, deleted = result
+        if changed or deleted:
+            self.apply_changes(changed, deleted)
+
+    def _load_error(self, error):
+        self.load_failed.emit(str(error))
+
+    # 조회/갱신
+    def product_id(self, row):
+        return self.rows[row][ID_COLUMN]
+
+    def positions(self):
+        if self._positions is None:
+            self._positions = {row[ID_COLUMN]: position for position, row in enumerate(self.rows)}
+        return self._positions
+
+    def _loaded(self, product_id):
+        """불러온 범위(마지막으로 읽은 ID보다 최신)에 속하는지 여부"""
+        return not self.has_more or not self.rows or product_id > self.rows[-1][ID_COLUMN]
+
+    def apply_changes(self, changed, deleted):
+        """증분 동기화 결과 반영 (changed: 제품 ID -> 컬럼 dict, deleted: 제품 ID 집합)"""
+        positions = self.positions()
+        for position in sorted((positions[product_id] for product_id in deleted if product_id in positions), reverse=True):
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self.rows[position]
+            self.endRemoveRows()
+            self._positions = None
+
+        positions = self.positions()
+        added = []
+        for product_id, product in changed.items():
+            row = tuple(product[field] for field in _FIELDS)
+            position = positions.get(product_id)
+            if position is not None:
+                self.rows[position] = row
+                self.dataChanged.emit(self.index(position, 0), self.index(position, len(_FIELDS) - 1))
+            elif self._loaded(product_id):
+                added.append(row)
+        if not added:
+            return
+
+        # 새 행은 ID 역순 위치에 삽입 (-ID 오름차순으로 이진 탐색)
+        keys = [-row[ID_COLUMN] for row in self.rows]
+        for row in added:
+            position = bisect_left(keys, -row[ID_COLUMN])
+            self.beginInsertRows(QModelIndex(), position, position)
+            self.rows.insert(position, row)
+            keys.insert(position, -row[ID_COLUMN])
+            self.endInsertRows()
+        self._positions = None
+
+    def update_stock(self, stocks):
+        """재고 변경 알림 반영 (제품 ID -> 재고, 불러온 행의 재고 칸만 갱신)"""
+        positions = self.positions()
+        for product_id, stock in stocks.items():
+            position = positions.get(product_id)
+            if position is not None:
+                row = self.rows[position]
+                self.rows[position] = row[:STOCK_COLUMN] + (stock,) + row[STOCK_COLUMN + 1:]
+                index = self.index(position, STOCK_COLUMN)
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
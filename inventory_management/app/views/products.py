@@ -1,12 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, UploadFile, File
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from datetime import datetime
 
-from app import get_db
+from app import get_db, get_async_db
 from app.models.product import Product
 from app.models.user import User
+from app.models.inventory_movement import MovementType
+from app.models.product_search import is_jamo_query, jamo_match_subquery, product_match_subquery
 from app.schemas.product import Product as ProductSchema, ProductCreate, ProductUpdate
-from app.utils.auth import get_current_active_user
+from app.utils.auth import get_current_active_user, get_current_active_user_async
+from app.utils.stock import record_movement, set_stock, get_stock_as_of
+from app.utils.sales_rollup import remove_product_from_rollup
+from app.utils.stats_cache import mark_product_stats_changed
+from app.utils.pagination import NEXT_CURSOR_HEADER, paginate, split_page
+from app.utils.product_import import IMPORT_CHUNK_SIZE, ProductImporter, read_import_rows
+from app.utils.export import export_response
+from app.utils.sync import MAX_SYNC_PAGE_SIZE, SYNC_PAGE_SIZE, fetch_changes
 
 router = APIRouter(
     prefix="/products",
@@ -22,32 +34,47 @@ def check_admin(user: User):
         )
 
 @router.get("/", response_model=List[ProductSchema])
-def list_products(
+async def list_products(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     """제품 목록 조회"""
-    query = db.query(Product)
-    
-    # 검색어가 있는 경우
-    if search:
-        search = f"%{search}%"
-        query = query.filter(
-            (Product.name.ilike(search)) |
-            (Product.code.ilike(search)) |
-            (Product.brand.ilike(search)) |
-            (Product.model.ilike(search)) |
-            (Product.description.ilike(search))
-        )
+    query = select(Product)
+    company_id = current_user.company_id if current_user.role == "user" else None
+    
+    matches = None
+    if search and is_jamo_query(search):
+        # 초성/자모 검색어(예: 'ㄱㅊ', '김ㅊ')는 검색 키 색인에서 접두어 범위로 찾음
+        matches = jamo_match_subquery(search, company_id)
+    elif search:
+        # 검색어가 있는 경우 전문 검색(trigram) 색인으로 찾고 bm25 점수순으로 정렬
+        matches = product_match_subquery(search, company_id)
+    
+    # 검색 결과는 (점수, ID), 전체 목록은 ID 순으로 커서 페이지네이션
+    if matches is not None:
+        query = query.join(matches, Product.id == matches.c.id).add_columns(matches.c.rank)
+        sort_columns = [matches.c.rank, Product.id]
+    else:
+        sort_columns = [Product.id]
     
     # 관리자가 아니면 본인 회사 제품만 조회
-    if current_user.role == "user":
-        query = query.filter(Product.company_id == current_user.company_id)
+    if company_id is not None:
+        query = query.where(Product.company_id == company_id)
+    
+    query = paginate(query, sort_columns, cursor, limit)
+    if not cursor and skip:
+        query = query.offset(skip)
     
-    return query.offset(skip).limit(limit).all()
+    rows = (await db.execute(query)).all()
+    page, next_cursor = split_page(rows, limit, lambda row: [*row[1:], row[0].id])
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return [row[0] for row in page]
 
 @router.post("/", response_model=ProductSchema, status_code=201)
 def create_product(
@@ -71,17 +98,89 @@ def create_product(
     )
     
     db.add(db_product)
+    db.flush()  # 재고 원장에 기록할 제품 ID를 얻기 위해 flush
+    
+    # 초기 재고 원장 기록
+    record_movement(db, db_product.id, db_product.current_stock, MovementType.INITIAL,
+                    created_by=current_user.id)
+    
     db.commit()
     db.refresh(db_product)
     return db_product
 
+@router.post("/import")
+def import_products(
+    file: UploadFile = File(..., description="제품 목록 파일 (csv, xlsx)"),
+    chunk_size: int = Query(IMPORT_CHUNK_SIZE, ge=1, le=10000, description="트랜잭션당 행 수"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    제품 대량 등록 (CSV/XLSX)
+    
+    첫 행은 헤더(필드명 또는 상품명/상품코드/판매가격 등 한글 헤더)이며,
+    chunk_size 행마다 커밋하고 실패한 행은 건너뛴 뒤 행별 오류를 반환합니다.
+    """
+    # 관리자 권한 확인
+    check_admin(current_user)
+    
+    try:
+        rows = read_import_rows(file.file, file.filename)
+        importer = ProductImporter(db, current_user.company_id, created_by=current_user.id,
+                                   chunk_size=chunk_size)
+        return importer.run(rows)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"파일을 읽을 수 없습니다: {e}")
+
+@router.get("/export")
+def export_products(
+    format: str = Query('csv', description="파일 형식 (csv, xlsx)"),
+    company_id: Optional[int] = None,
+    current_user: User = Depends(get_current_active_user)
+):
+    """제품 목록 내보내기 (스트리밍, 일반 사용자는 본인 회사 제품만)"""
+    if current_user.role == "user":
+        company_id = current_user.company_id
+    return export_response('products', format, company_id=company_id)
+
+@router.get("/changes")
+async def list_product_changes(
+    since: int = Query(0, description="마지막 동기화 토큰 (0이면 전체)"),
+    limit: int = Query(SYNC_PAGE_SIZE, ge=1, le=MAX_SYNC_PAGE_SIZE),
+    company_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """마지막 동기화 이후 변경/삭제된 제품 (증분 동기화, 일반 사용자는 본인 회사 제품만)"""
+    if current_user.role == "user":
+        company_id = current_user.company_id
+    return await db.run_sync(fetch_changes, 'products', since, company_id, limit)
+
 @router.get("/{product_id}", response_model=ProductSchema)
-def get_product(
+async def get_product(
+    product_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """제품 상세 조회"""
+    db_product = await db.get(Product, product_id)
+    if db_product is None:
+        raise HTTPException(status_code=404, detail="제품을 찾을 수 없습니다.")
+    
+    # 관리자가 아니면 본인 회사 제품만 조회 가능
+    if current_user.role == "user" and db_product.company_id != current_user.company_id:
+        raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
+    
+    return db_product
+
+@router.get("/{product_id}/stock")
+def get_product_stock_as_of(
     product_id: int,
+    as_of: datetime = Query(..., description="조회 기준 일시"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """제품 상세 조회"""
+    """특정 시점의 제품 재고 조회"""
     db_product = db.query(Product).filter(Product.id == product_id).first()
     if db_product is None:
         raise HTTPException(status_code=404, detail="제품을 찾을 수 없습니다.")
@@ -90,7 +189,11 @@ def get_product(
     if current_user.role == "user" and db_product.company_id != current_user.company_id:
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
     
-    return db_product
+    return {
+        "product_id": product_id,
+        "as_of": as_of,
+        "stock": get_stock_as_of(db, product_id, as_of)
+    }
 
 @router.put("/{product_id}", response_model=ProductSchema)
 def update_product(
@@ -113,6 +216,14 @@ def update_product(
     
     # 제품 정보 업데이트
     update_data = product.dict(exclude_unset=True)
+    
+    # 재고 수량은 변경분을 원장에 기록하며 별도로 반영
+    new_stock = update_data.pop('current_stock', None)
+    if new_stock is not None:
+        set_stock(db, product_id, new_stock, MovementType.ADJUSTMENT, created_by=current_user.id)
+    
+    # 분류/브랜드/이름이 바뀌면 커밋 시 회사의 그룹별 판매 통계 캐시 무효화
+    mark_product_stats_changed(db, db_product, update_data)
     for field, value in update_data.items():
         setattr(db_product, field, value)
     
@@ -138,6 +249,8 @@ def delete_product(
     if current_user.role == "user" and db_product.company_id != current_user.company_id:
         raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
     
+    # 함께 삭제되는 판매 기록의 집계분 제거
+    remove_product_from_rollup(db, db_product.id)
     db.delete(db_product)
     db.commit()
     return {"ok": True}
@@ -1,14 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from datetime import datetime
 
-from app import get_db
+from app import get_db, get_async_db
 from app.models.purchase_info import PurchaseInfo
 from app.models.product import Product
 from app.models.user import User
-from app.schemas.purchase import Purchase as PurchaseSchema, PurchaseCreate, PurchaseUpdate
-from app.utils.auth import get_current_active_user
+from app.models.inventory_movement import MovementType
+from app.schemas.purchase import Purchase as PurchaseSchema, PurchaseCreate, PurchaseUpdate, PurchaseReceipt
+from app.utils.auth import get_current_active_user, get_current_active_user_async
+from app.utils.stock import decrease_stock, increase_stock, adjust_stock
+from app.utils.pagination import NEXT_CURSOR_HEADER, paginate, split_page
+from app.utils.purchase_receipt import receive_purchases
+from app.utils.export import export_response
+from app.utils.sync import MAX_SYNC_PAGE_SIZE, SYNC_PAGE_SIZE, fetch_changes
 
 router = APIRouter(
     prefix="/purchases",
@@ -39,37 +47,48 @@ def check_purchase_permission(user: User, db: Session, purchase: PurchaseInfo =
     return True
 
 @router.get("/", response_model=List[PurchaseSchema])
-def list_purchases(
+async def list_purchases(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     product_id: Optional[int] = None,
     supplier_name: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     payment_status: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
-    """구매 목록 조회"""
-    query = db.query(PurchaseInfo).join(Product)
+    """구매 목록 조회 (구매일 최신순)"""
+    query = select(PurchaseInfo).join(Product)
     
     # 필터링 조건 적용
     if product_id:
-        query = query.filter(PurchaseInfo.product_id == product_id)
+        query = query.where(PurchaseInfo.product_id == product_id)
     if supplier_name:
-        query = query.filter(PurchaseInfo.supplier_name.ilike(f"%{supplier_name}%"))
+        query = query.where(PurchaseInfo.supplier_name.ilike(f"%{supplier_name}%"))
     if start_date:
-        query = query.filter(PurchaseInfo.purchase_date >= start_date)
+        query = query.where(PurchaseInfo.purchase_date >= start_date)
     if end_date:
-        query = query.filter(PurchaseInfo.purchase_date <= end_date)
+        query = query.where(PurchaseInfo.purchase_date <= end_date)
     if payment_status:
-        query = query.filter(PurchaseInfo.payment_status == payment_status)
+        query = query.where(PurchaseInfo.payment_status == payment_status)
     
     # 권한 확인 및 필터링
     if current_user.role == "user":
-        query = query.filter(Product.company_id == current_user.company_id)
+        query = query.where(Product.company_id == current_user.company_id)
     
-    return query.offset(skip).limit(limit).all()
+    # (구매일, ID) 내림차순 커서 페이지네이션
+    query = paginate(query, [PurchaseInfo.purchase_date, PurchaseInfo.id], cursor, limit, descending=True)
+    if not cursor and skip:
+        query = query.offset(skip)
+    
+    result = await db.execute(query)
+    page, next_cursor = split_page(result.scalars().all(), limit, lambda row: [row.purchase_date, row.id])
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return page
 
 @router.post("/", response_model=PurchaseSchema, status_code=201)
 def create_purchase(
@@ -101,27 +120,76 @@ def create_purchase(
         created_by=current_user.id
     )
     
-    # 제품 재고 업데이트
-    product.current_stock += purchase.quantity
-    
     db.add(db_purchase)
+    db.flush()  # 재고 원장에 기록할 구매 ID를 얻기 위해 flush
+    
+    # 제품 재고 업데이트 (단일 UPDATE)
+    increase_stock(db, product.id, purchase.quantity, MovementType.PURCHASE,
+                   reference_id=db_purchase.id, created_by=current_user.id)
+    
     db.commit()
     db.refresh(db_purchase)
     return db_purchase
 
-@router.get("/{purchase_id}", response_model=PurchaseSchema)
-def get_purchase(
-    purchase_id: int,
+@router.get("/export")
+def export_purchases(
+    format: str = Query('csv', description="파일 형식 (csv, xlsx)"),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    product_id: Optional[int] = None,
+    company_id: Optional[int] = None,
+    current_user: User = Depends(get_current_active_user)
+):
+    """구매 내역 내보내기 (스트리밍, 구매일 순, 일반 사용자는 본인 회사 구매만)"""
+    if current_user.role == "user":
+        company_id = current_user.company_id
+    return export_response('purchases', format, company_id=company_id, start_date=start_date,
+                           end_date=end_date, product_id=product_id)
+
+@router.get("/changes")
+async def list_purchase_changes(
+    since: int = Query(0, description="마지막 동기화 토큰 (0이면 전체)"),
+    limit: int = Query(SYNC_PAGE_SIZE, ge=1, le=MAX_SYNC_PAGE_SIZE),
+    company_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """마지막 동기화 이후 변경/삭제된 구매 (증분 동기화, 일반 사용자는 본인 회사 구매만)"""
+    if current_user.role == "user":
+        company_id = current_user.company_id
+    return await db.run_sync(fetch_changes, 'purchase_infos', since, company_id, limit)
+
+@router.post("/receive", status_code=201)
+def receive_purchase_lines(
+    receipt: PurchaseReceipt,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
+):
+    """
+    일괄 입고 (여러 품목을 한 번에 구매 등록)
+    
+    공급업체/송장 정보는 모든 품목에 공통 적용되며, 제품을 찾을 수 없거나 권한이 없는 품목이 있으면
+    해당 품목 인덱스(lines)와 함께 전체 입고를 취소합니다.
+    """
+    return receive_purchases(db, receipt, current_user)
+
+@router.get("/{purchase_id}", response_model=PurchaseSchema)
+async def get_purchase(
+    purchase_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     """구매 정보 상세 조회"""
-    purchase = db.query(PurchaseInfo).filter(PurchaseInfo.id == purchase_id).first()
+    # 권한 확인에 필요한 제품 정보를 함께 로드 (비동기 세션은 지연 로딩 불가)
+    result = await db.execute(
+        select(PurchaseInfo).options(joinedload(PurchaseInfo.product)).where(PurchaseInfo.id == purchase_id)
+    )
+    purchase = result.scalars().first()
     if purchase is None:
         raise HTTPException(status_code=404, detail="구매 정보를 찾을 수 없습니다.")
     
     # 권한 확인
-    if not check_purchase_permission(current_user, db, purchase):
+    if not check_purchase_permission(current_user, None, purchase):
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
     
     return purchase
@@ -145,8 +213,11 @@ def update_purchase(
     
     # 제품 재고 조정 (수량이 변경된 경우)
     if purchase_update.quantity is not None and purchase_update.quantity != db_purchase.quantity:
-        product = db_purchase.product
-        product.current_stock += (purchase_update.quantity - db_purchase.quantity)
+        if not adjust_stock(db, db_purchase.product_id, purchase_update.quantity - db_purchase.quantity,
+                            MovementType.PURCHASE_UPDATE, reference_id=db_purchase.id,
+                            created_by=current_user.id):
+            db.rollback()
+            raise HTTPException(status_code=400, detail="재고가 부족하여 구매 수량을 줄일 수 없습니다.")
     
     # 구매 정보 업데이트
     update_data = purchase_update.dict(exclude_unset=True)
@@ -182,9 +253,11 @@ def delete_purchase(
     if not check_purchase_permission(current_user, db, purchase):
         raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
     
-    # 제품 재고 조정 (삭제 시 재고 감소)
-    product = purchase.product
-    product.current_stock -= purchase.quantity
+    # 제품 재고 조정 (삭제 시 재고 감소, 이미 판매된 수량은 차감 불가)
+    if not decrease_stock(db, purchase.product_id, purchase.quantity, MovementType.PURCHASE_CANCEL,
+                          reference_id=purchase.id, created_by=current_user.id):
+        db.rollback()
+        raise HTTPException(status_code=400, detail="재고가 부족하여 구매 정보를 삭제할 수 없습니다.")
     
     # 구매 정보 삭제
     db.delete(purchase)
@@ -1,14 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from typing import Any, Dict, List, Optional
+from datetime import datetime, date
 
-from app import get_db
+from app import get_db, get_async_db
 from app.models.sale_record import SaleRecord
 from app.models.product import Product
 from app.models.user import User
+from app.models.inventory_movement import MovementType
 from app.schemas.sale import Sale as SaleSchema, SaleCreate, SaleUpdate
-from app.utils.auth import get_current_active_user
+from app.utils.auth import get_current_active_user, get_current_active_user_async
+from app.utils.stock import decrease_stock, increase_stock, adjust_stock
+from app.utils.pagination import NEXT_CURSOR_HEADER, paginate, split_page
+from app.utils.sales_rollup import (
+    add_sale_to_rollup, remove_sale_from_rollup, update_sale_in_rollup, sale_contribution,
+    sales_summary_query, PERIOD_FORMATS, GROUP_COLUMNS
+)
+from app.utils.stats_cache import sales_stats_cache
+from app.utils.sale_batch import MAX_SALE_BATCH_SIZE, create_sales_batch
+from app.utils.export import export_response
+from app.utils.sync import MAX_SYNC_PAGE_SIZE, SYNC_PAGE_SIZE, fetch_changes
 
 router = APIRouter(
     prefix="/sales",
@@ -39,42 +52,141 @@ def check_sale_permission(user: User, db: Session, sale: SaleRecord = None, prod
     return True
 
 @router.get("/", response_model=List[SaleSchema])
-def list_sales(
+async def list_sales(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     product_id: Optional[int] = None,
     customer_name: Optional[str] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     status: Optional[str] = None,
     payment_status: Optional[str] = None,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
-    """판매 목록 조회"""
-    query = db.query(SaleRecord).join(Product)
+    """판매 목록 조회 (판매일 최신순)"""
+    query = select(SaleRecord).join(Product)
     
     # 필터링 조건 적용
     if product_id:
-        query = query.filter(SaleRecord.product_id == product_id)
+        query = query.where(SaleRecord.product_id == product_id)
     if customer_name:
-        query = query.filter(SaleRecord.customer_name.ilike(f"%{customer_name}%"))
+        query = query.where(SaleRecord.customer_name.ilike(f"%{customer_name}%"))
     if start_date:
-        query = query.filter(SaleRecord.sale_date >= start_date)
+        query = query.where(SaleRecord.sale_date >= start_date)
     if end_date:
         # 종료일은 해당일 자정까지 포함
         end_date = end_date.replace(hour=23, minute=59, second=59)
-        query = query.filter(SaleRecord.sale_date <= end_date)
+        query = query.where(SaleRecord.sale_date <= end_date)
     if status:
-        query = query.filter(SaleRecord.status == status)
+        query = query.where(SaleRecord.status == status)
     if payment_status:
-        query = query.filter(SaleRecord.payment_status == payment_status)
+        query = query.where(SaleRecord.payment_status == payment_status)
     
     # 권한 확인 및 필터링
     if current_user.role == "user":
-        query = query.filter(Product.company_id == current_user.company_id)
+        query = query.where(Product.company_id == current_user.company_id)
+    
+    # (판매일, ID) 내림차순 커서 페이지네이션
+    query = paginate(query, [SaleRecord.sale_date, SaleRecord.id], cursor, limit, descending=True)
+    if not cursor and skip:
+        query = query.offset(skip)
+    
+    result = await db.execute(query)
+    page, next_cursor = split_page(result.scalars().all(), limit, lambda row: [row.sale_date, row.id])
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return page
+
+@router.get("/export")
+def export_sales(
+    format: str = Query('csv', description="파일 형식 (csv, xlsx)"),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    product_id: Optional[int] = None,
+    company_id: Optional[int] = None,
+    current_user: User = Depends(get_current_active_user)
+):
+    """판매 내역 내보내기 (스트리밍, 판매일 순, 일반 사용자는 본인 회사 판매만)"""
+    if current_user.role == "user":
+        company_id = current_user.company_id
+    if end_date:
+        # 종료일은 해당일 자정까지 포함
+        end_date = end_date.replace(hour=23, minute=59, second=59)
+    return export_response('sales', format, company_id=company_id, start_date=start_date,
+                           end_date=end_date, product_id=product_id)
+
+@router.get("/changes")
+async def list_sale_changes(
+    since: int = Query(0, description="마지막 동기화 토큰 (0이면 전체)"),
+    limit: int = Query(SYNC_PAGE_SIZE, ge=1, le=MAX_SYNC_PAGE_SIZE),
+    company_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """마지막 동기화 이후 변경/삭제된 판매 (증분 동기화, 일반 사용자는 본인 회사 판매만)"""
+    if current_user.role == "user":
+        company_id = current_user.company_id
+    return await db.run_sync(fetch_changes, 'sale_records', since, company_id, limit)
+
+@router.get("/stats/{period}")
+async def get_sales_stats(
+    period: str,
+    group_by: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    product_id: Optional[int] = None,
+    company_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    판매 통계 조회 (일별/월별 집계 테이블 기반, 컬럼 단위 JSON)
+    
+    - **period**: day / week / month / year
+    - **group_by**: product / category / brand (미지정 시 기간별 합계)
+    - **company_id**: 관리자만 지정 가능 (일반 사용자는 본인 회사로 고정)
+    """
+    if period not in PERIOD_FORMATS:
+        raise HTTPException(status_code=400, detail="지원하지 않는 통계 기간입니다. (day, week, month, year)")
+    if group_by is not None and group_by not in GROUP_COLUMNS:
+        raise HTTPException(status_code=400, detail="지원하지 않는 그룹 기준입니다. (product, category, brand)")
+    
+    # 일반 사용자는 본인 회사 통계만 조회
+    if current_user.role == "user":
+        company_id = current_user.company_id
+    
+    async def compute():
+        result = await db.execute(sales_summary_query(
+            period, company_id=company_id, start_date=start_date, end_date=end_date,
+            product_id=product_id, group_by=group_by
+        ))
+        columns = list(result.keys())
+        rows = result.all()
+        stats = {
+            "columns": columns,
+            "data": {column: [row[i] for row in rows] for i, column in enumerate(columns)},
+        }
+        if group_by == 'product':
+            # 제품 ID -> 제품명 (결과에 포함된 제품만)
+            product_ids = set(stats["data"]["group"])
+            labels = await db.execute(select(Product.id, Product.name).where(Product.id.in_(product_ids)))
+            stats["labels"] = {product_id: name for product_id, name in labels.all()}
+        return stats
     
-    return query.offset(skip).limit(limit).all()
+    # (회사, 기간, 그룹) 단위 캐시 - 기간 내 판매가 변경되면 무효화
+    cache_key = (company_id, start_date, end_date, period, group_by, product_id)
+    stats = await sales_stats_cache.get_or_compute_async(cache_key, compute)
+    return {
+        "period": period,
+        "group_by": group_by,
+        "company_id": company_id,
+        "start_date": start_date,
+        "end_date": end_date,
+        **stats,
+    }
 
 @router.post("/", response_model=SaleSchema, status_code=201)
 def create_sale(
@@ -92,45 +204,72 @@ def create_sale(
     if not check_sale_permission(current_user, db, product_id=product.id):
         raise HTTPException(status_code=403, detail="판매 정보를 생성할 권한이 없습니다.")
     
-    # 재고 확인
-    if product.current_stock < sale.quantity:
-        raise HTTPException(status_code=400, detail="재고가 부족합니다.")
-    
     # 총 판매 금액 계산
     total_price = sale.quantity * sale.unit_price
     
-    # 새 판매 정보 생성
-    db_sale = SaleRecord(
-        **sale.dict(),
-        total_price=total_price,
-        created_by=current_user.id
-    )
+    # 새 판매 정보 생성 (판매 기록 테이블에 있는 필드만 저장)
+    sale_data = {
+        field: value for field, value in sale.dict().items()
+        if field in SaleRecord.__table__.columns and field != 'total_price'
+    }
+    db_sale = SaleRecord(**sale_data, total_price=total_price)
     
-    # 제품 재고 감소
-    product.current_stock -= sale.quantity
+    db.add(db_sale)
+    db.flush()  # 재고 원장에 기록할 판매 ID를 얻기 위해 flush
     
-    # 판매 상태가 '완료'이고 결제 상태가 '결제완료'인 경우에만 재고 업데이트
-    if sale.status == 'completed' and sale.payment_status == 'paid':
-        product.current_stock -= sale.quantity
+    # 재고 확인 및 차감 (단일 조건부 UPDATE)
+    if not decrease_stock(db, product.id, sale.quantity, MovementType.SALE,
+                          reference_id=db_sale.id, created_by=current_user.id):
+        db.rollback()
+        raise HTTPException(status_code=400, detail="재고가 부족합니다.")
+    
+    # 일별 판매 집계 반영
+    add_sale_to_rollup(db, db_sale)
     
-    db.add(db_sale)
     db.commit()
     db.refresh(db_sale)
     return db_sale
 
-@router.get("/{sale_id}", response_model=SaleSchema)
-def get_sale(
-    sale_id: int,
+@router.post("/batch")
+def create_sales_batch_endpoint(
+    items: List[Dict[str, Any]] = Body(..., description="판매 목록 (SaleCreate 형식)"),
+    atomic: bool = Query(True, description="True: 하나라도 실패하면 전체 취소, False: 성공한 항목만 등록"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
+):
+    """
+    판매 일괄 등록 (POS 단말 동기화)
+    
+    항목별 결과(index, status, sale_id 또는 error)를 반환합니다.
+    atomic 모드에서 실패한 항목이 있으면 400 응답의 detail에 항목별 결과가 포함됩니다.
+    """
+    if not items:
+        raise HTTPException(status_code=400, detail="등록할 판매 정보가 없습니다.")
+    if len(items) > MAX_SALE_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_SALE_BATCH_SIZE}건까지 등록할 수 있습니다.")
+    
+    report = create_sales_batch(db, items, current_user, atomic=atomic)
+    if atomic and report['failed']:
+        raise HTTPException(status_code=400, detail={"message": "판매 일괄 등록에 실패했습니다.", **report})
+    return report
+
+@router.get("/{sale_id}", response_model=SaleSchema)
+async def get_sale(
+    sale_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     """판매 정보 상세 조회"""
-    sale = db.query(SaleRecord).filter(SaleRecord.id == sale_id).first()
+    # 권한 확인에 필요한 제품 정보를 함께 로드 (비동기 세션은 지연 로딩 불가)
+    result = await db.execute(
+        select(SaleRecord).options(joinedload(SaleRecord.product)).where(SaleRecord.id == sale_id)
+    )
+    sale = result.scalars().first()
     if sale is None:
         raise HTTPException(status_code=404, detail="판매 정보를 찾을 수 없습니다.")
     
     # 권한 확인
-    if not check_sale_permission(current_user, sale):
+    if not check_sale_permission(current_user, None, sale):
         raise HTTPException(status_code=403, detail="접근 권한이 없습니다.")
     
     return sale
@@ -152,18 +291,15 @@ def update_sale(
     if not check_sale_permission(current_user, db, db_sale):
         raise HTTPException(status_code=403, detail="수정 권한이 없습니다.")
     
-    # 제품 재고 조정 (수량이 변경된 경우)
+    # 제품 재고 조정 (수량이 변경된 경우 차이만큼만 증감)
     if sale_update.quantity is not None and sale_update.quantity != db_sale.quantity:
-        product = db_sale.product
-        # 이전 수량만큼 재고 복구
-        product.current_stock += db_sale.quantity
-        # 새로운 수량만큼 재고 차감 (유효성 검사 포함)
-        if product.current_stock < sale_update.quantity:
+        if not adjust_stock(db, db_sale.product_id, db_sale.quantity - sale_update.quantity,
+                            MovementType.SALE_UPDATE, reference_id=db_sale.id, created_by=current_user.id):
             db.rollback()  # 변경 사항 롤백
             raise HTTPException(status_code=400, detail="재고가 부족합니다.")
-        product.current_stock -= sale_update.quantity
     
-    # 판매 정보 업데이트
+    # 판매 정보 업데이트 (일별 집계 보정을 위해 이전 반영분 보관)
+    previous_contribution = sale_contribution(db_sale)
     update_data = sale_update.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(db_sale, field, value)
@@ -172,6 +308,9 @@ def update_sale(
     if any(field in update_data for field in ['quantity', 'unit_price']):
         db_sale.total_price = db_sale.quantity * db_sale.unit_price
     
+    # 일별 판매 집계 보정 (판매일/수량/금액 변경분)
+    update_sale_in_rollup(db, previous_contribution, db_sale)
+    
     db.commit()
     db.refresh(db_sale)
     return db_sale
@@ -189,12 +328,15 @@ def delete_sale(
         raise HTTPException(status_code=404, detail="판매 정보를 찾을 수 없습니다.")
     
     # 권한 확인
-    if not check_sale_permission(current_user, sale):
+    if not check_sale_permission(current_user, db, sale):
         raise HTTPException(status_code=403, detail="삭제 권한이 없습니다.")
     
     # 제품 재고 복구 (판매 취소 시 재고 증가)
-    product = sale.product
-    product.current_stock += sale.quantity
+    increase_stock(db, sale.product_id, sale.quantity, MovementType.SALE_CANCEL,
+                   reference_id=sale.id, created_by=current_user.id)
+    
+    # 일별 판매 집계에서 제외
+    remove_sale_from_rollup(db, sale)
     
     # 판매 정보 삭제
     db.delete(sale)
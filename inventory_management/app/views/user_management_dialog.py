@@ -5,11 +5,12 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineE
 from PySide6.QtCore import Qt, Signal, QSize
 from PySide6.QtGui import QIntValidator, QIcon
 
-import requests
 import json
+import traceback
 from datetime import datetime
 
-from app.config import API_BASE_URL, get_auth_header
+from app.views.api_client import api_client
+from app.views.workers import TaskRunner, BusyIndicator
 
 class UserForm(QWidget):
     """사용자 등록/수정 폼 위젯"""
@@ -144,6 +145,8 @@ class UserManagementDialog(QDialog):
         self.current_user_id = current_user_id
         self.users = []
         self.companies = []
+        # 목록 조회와 저장 요청은 백그라운드에서 실행
+        self.tasks = TaskRunner(self)
         
         self.setWindowTitle("사용자 관리")
         self.setMinimumSize(800, 600)
@@ -179,6 +182,7 @@ class UserManagementDialog(QDialog):
         btn_layout.addWidget(self.edit_btn)
         btn_layout.addWidget(self.delete_btn)
         btn_layout.addStretch()
+        btn_layout.addWidget(BusyIndicator(self.tasks))
         
         layout.addLayout(btn_layout)
         
@@ -197,80 +201,85 @@ class UserManagementDialog(QDialog):
         self.status_bar = QLabel("준비 완료")
         layout.addWidget(self.status_bar)
     
+    def done(self, result):
+        # 닫은 뒤 도착하는 응답은 무시
+        self.tasks.cancel_all()
+        super().done(result)
+    
     def load_companies(self):
         """회사 목록 로드"""
-        try:
-            # 기본 회사 옵션 추가 (슈퍼 관리자인 경우에만)
-            if self.is_super_admin and hasattr(self, 'company_combo'):
-                self.company_combo.clear()
-                self.company_combo.addItem("기본 회사 (자동 생성)", None)
-                
-                # 회사 목록 로드
-                response = requests.get(
-                    f"{API_BASE_URL}/companies/",
-                    headers=get_auth_header()
-                )
-                
-                if response.status_code == 200:
-                    self.companies = response.json()
-                    for company in self.companies:
-                        self.company_combo.addItem(company['name'], company['id'])
-                else:
-                    QMessageBox.warning(self, '경고', '회사 목록을 불러오는 중 오류가 발생했습니다.')
-                    self.companies = []
-        except Exception as e:
-            QMessageBox.critical(self, '오류', f'회사 목록을 불러오는 중 오류가 발생했습니다.\n{str(e)}')
-            self.companies = []
-            return
-            
-        try:
-            print("\n=== 회사 목록 로드 시도 ===")
-            headers = get_auth_header()
-            print(f"요청 헤더: {headers}")
-            
-            response = requests.get(
-                f"{API_BASE_URL}/api/companies/",
-                headers=headers
-            )
-            
-            print(f"응답 상태 코드: {response.status_code}")
-            print(f"응답 내용: {response.text[:200]}...")
-            
-            if response.status_code == 200:
-                self.companies = response.json()
-                print(f"로드된 회사 수: {len(self.companies)}")
-            else:
-                print(f"회사 목록 로드 실패: {response.status_code} - {response.text}")
-                QMessageBox.critical(self, '오류', f'회사 목록을 불러오는 중 오류가 발생했습니다: {response.status_code}')
-        except Exception as e:
-            print(f"회사 목록 로드 중 예외 발생: {str(e)}")
-            QMessageBox.critical(self, '오류', f'회사 목록을 불러오는 중 오류가 발생했습니다: {str(e)}')
+        print("\n=== 회사 목록 로드 시도 ===")
+        self.status_bar.setText("회사 목록을 불러오는 중...")
+        api_client().get(
+            self.tasks, "/api/companies/",
+            key='companies', on_result=self.on_companies_loaded, on_error=self.on_companies_failed,
+        )
+    
+    def on_companies_loaded(self, response):
+        print(f"응답 상태 코드: {response.status_code}")
+        
+        if response.status_code == 200:
+            response_data = response.json()
+            # 목록 API는 {'items': [...], ...} 형식으로 응답함
+            self.companies = response_data['items'] if isinstance(response_data, dict) else response_data
+            print(f"로드된 회사 수: {len(self.companies)}")
+            self.status_bar.setText("준비 완료")
+        else:
+            print(f"회사 목록 로드 실패: {response.status_code} - {response.text}")
+            QMessageBox.critical(self, '오류', f'회사 목록을 불러오는 중 오류가 발생했습니다: {response.status_code}')
+    
+    def on_companies_failed(self, error):
+        print(f"회사 목록 로드 중 예외 발생: {str(error)}")
+        QMessageBox.critical(self, '오류', f'회사 목록을 불러오는 중 오류가 발생했습니다: {str(error)}')
     
     def load_users(self):
-        """사용자 목록 로드"""
+        """사용자 목록 로드 (이전 요청이 끝나지 않았으면 그 결과는 버림)"""
+        print("\n=== 사용자 목록 로드 시도 ===")
+        self.status_bar.setText("사용자 목록을 불러오는 중...")
+        api_client().get(
+            self.tasks, "/api/users/",
+            key='users', on_result=self.on_users_loaded, on_error=self.on_users_failed,
+        )
+    
+    def on_users_loaded(self, response):
+        print(f"응답 상태 코드: {response.status_code}")
+        
+        if response.status_code == 200:
+            self.users = response.json()
+            print(f"로드된 사용자 수: {len(self.users)}")
+            self.update_user_table()
+            self.status_bar.setText(f"사용자 {len(self.users)}명")
+        else:
+            print(f"사용자 목록 로드 실패: {response.status_code} - {response.text}")
+            self.status_bar.setText("사용자 목록을 불러오지 못했습니다.")
+            QMessageBox.critical(self, '오류', f'사용자 목록을 불러오는 중 오류가 발생했습니다: {response.status_code}')
+    
+    def on_users_failed(self, error):
+        print(f"사용자 목록 로드 중 예외 발생: {str(error)}")
+        self.status_bar.setText("사용자 목록을 불러오지 못했습니다.")
+        QMessageBox.critical(self, '오류', f'사용자 목록을 불러오는 중 오류가 발생했습니다: {str(error)}')
+    
+    def on_request_finished(self, response, success_status, success_message, action):
+        """사용자 추가/수정/삭제 응답 처리"""
+        if response.status_code == success_status:
+            QMessageBox.information(self, '성공', success_message)
+            self.load_users()
+            return
+        
         try:
-            print("\n=== 사용자 목록 로드 시도 ===")
-            headers = get_auth_header()
-            print(f"요청 헤더: {headers}")
-            
-            response = requests.get(
-                f"{API_BASE_URL}/api/users/",
-                headers=headers
-            )
-            
-            print(f"응답 상태 코드: {response.status_code}")
-            print(f"응답 내용: {response.text[:200]}...")
-            
-            if response.status_code == 200:
-                self.users = response.json()
-                print(f"로드된 사용자 수: {len(self.users)}")
-                self.update_user_table()
+            error_detail = response.json().get('detail', {})
+            if isinstance(error_detail, dict):
+                error_msg = '\n'.join([f"{k}: {v}" for k, v in error_detail.items()])
             else:
-                print(f"사용자 목록 로드 실패: {response.status_code} - {response.text}")
-                QMessageBox.critical(self, '오류', f'사용자 목록을 불러오는 중 오류가 발생했습니다: {response.status_code}')
-        except Exception as e:
-            print(f"사용자 목록 로드 중 예외 발생: {str(e)}")
-            QMessageBox.critical(self, '오류', f'사용자 목록을 불러오는 중 오류가 발생했습니다: {str(e)}')
+                error_msg = str(error_detail)
+        except:
+            error_msg = response.text or f'사용자 {action} 중 오류가 발생했습니다.'
+        
+        QMessageBox.warning(self, '오류', f'사용자 {action}에 실패했습니다.\n\n{error_msg}')
+    
+    def on_request_failed(self, error, action):
+        error_detail = f'{str(error)}\n\n{"".join(traceback.format_exception(error))}'
+        QMessageBox.critical(self, '오류', f'사용자 {action} 중 오류가 발생했습니다.\n\n{error_detail}')
     
     def update_user_table(self):
         """사용자 테이블 업데이트"""
@@ -354,32 +363,12 @@ class UserManagementDialog(QDialog):
                     del user_data['company_id']
                     print("[사용자 추가] 슈퍼 관리자에서 company_id 제거")
                 
-                try:
-                    print(f"[사용자 추가] API 요청: {user_data}")
-                    response = requests.post(
-                        f"{API_BASE_URL}/api/users/",
-                        json=user_data,
-                        headers=get_auth_header()
-                    )
-                    
-                    if response.status_code == 201:
-                        QMessageBox.information(self, '성공', '사용자가 추가되었습니다.')
-                        self.load_users()
-                    else:
-                        try:
-                            error_detail = response.json().get('detail', {})
-                            if isinstance(error_detail, dict):
-                                error_msg = '\n'.join([f"{k}: {v}" for k, v in error_detail.items()])
-                            else:
-                                error_msg = str(error_detail)
-                        except:
-                            error_msg = response.text or '사용자 추가 중 오류가 발생했습니다.'
-                        
-                        QMessageBox.warning(self, '오류', f'사용자 추가에 실패했습니다.\n\n{error_msg}')
-                except Exception as e:
-                    import traceback
-                    error_detail = f'{str(e)}\n\n{traceback.format_exc()}'
-                    QMessageBox.critical(self, '오류', f'사용자 추가 중 오류가 발생했습니다.\n\n{error_detail}')
+                print(f"[사용자 추가] API 요청: {user_data}")
+                api_client().post(
+                    self.tasks, "/api/users/", json=user_data,
+                    on_result=lambda response: self.on_request_finished(response, 201, '사용자가 추가되었습니다.', '추가'),
+                    on_error=lambda error: self.on_request_failed(error, '추가'),
+                )
         except Exception as e:
             import traceback
             error_detail = f'{str(e)}\n\n{traceback.format_exc()}'
@@ -434,31 +423,11 @@ class UserManagementDialog(QDialog):
             if user_data.get('role') == 'super_admin' and 'company_id' in user_data:
                 del user_data['company_id']
             
-            try:
-                response = requests.put(
-                    f"{API_BASE_URL}/api/users/{user['id']}",
-                    json=user_data,
-                    headers=get_auth_header()
-                )
-                
-                if response.status_code == 200:
-                    QMessageBox.information(self, '성공', '사용자 정보가 수정되었습니다.')
-                    self.load_users()
-                else:
-                    try:
-                        error_detail = response.json().get('detail', {})
-                        if isinstance(error_detail, dict):
-                            error_msg = '\n'.join([f"{k}: {v}" for k, v in error_detail.items()])
-                        else:
-                            error_msg = str(error_detail)
-                    except:
-                        error_msg = response.text or '사용자 수정 중 오류가 발생했습니다.'
-                    
-                    QMessageBox.warning(self, '오류', f'사용자 수정에 실패했습니다.\n\n{error_msg}')
-            except Exception as e:
-                import traceback
-                error_detail = f'{str(e)}\n\n{traceback.format_exc()}'
-                QMessageBox.critical(self, '오류', f'사용자 수정 중 오류가 발생했습니다.\n\n{error_detail}')
+            api_client().put(
+                self.tasks, f"/api/users/{user['id']}", json=user_data,
+                on_result=lambda response: self.on_request_finished(response, 200, '사용자 정보가 수정되었습니다.', '수정'),
+                on_error=lambda error: self.on_request_failed(error, '수정'),
+            )
     
     def delete_user(self):
         """사용자 삭제"""
@@ -475,27 +444,8 @@ class UserManagementDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            try:
-                response = requests.delete(
-                    f"{API_BASE_URL}/api/users/{user['id']}",
-                    headers=get_auth_header()
-                )
-                
-                if response.status_code == 204:
-                    QMessageBox.information(self, '성공', '사용자가 삭제되었습니다.')
-                    self.load_users()
-                else:
-                    try:
-                        error_detail = response.json().get('detail', {})
-                        if isinstance(error_detail, dict):
-                            error_msg = '\n'.join([f"{k}: {v}" for k, v in error_detail.items()])
-                        else:
-                            error_msg = str(error_detail)
-                    except:
-                        error_msg = response.text or '사용자 삭제 중 오류가 발생했습니다.'
-                    
-                    QMessageBox.warning(self, '오류', f'사용자 삭제에 실패했습니다.\n\n{error_msg}')
-            except Exception as e:
-                import traceback
-                error_detail = f'{str(e)}\n\n{traceback.format_exc()}'
-                QMessageBox.critical(self, '오류', f'사용자 삭제 중 오류가 발생했습니다.\n\n{error_detail}')
+            api_client().delete(
+                self.tasks, f"/api/users/{user['id']}",
+                on_result=lambda response: self.on_request_finished(response, 204, '사용자가 삭제되었습니다.', '삭제'),
+                on_error=lambda error: self.on_request_failed(error, '삭제'),
+            )
@@ -0,0 +1,138 @@
+from itertools import count
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtWidgets import QProgressBar
+
+# 작업 스레드 수 (대부분 DB/HTTP 대기이므로 CPU 코어 수와 무관하게 고정)
+WORKER_THREADS = 4
+
+_pool = None
+
+def worker_pool():
+    """백그라운드 작업용 스레드풀 (전역 스레드풀은 코어 수만큼이라 느린 요청 하나가 다른 조회를 막을 수 있음)"""
+    global _pool
+    if _pool is None:
+        _pool = QThreadPool()
+        _pool.setMaxThreadCount(WORKER_THREADS)
+    return _pool
+
+
+class WorkerSignals(QObject):
+    """작업 결과 시그널 (작업 ID, 결과/예외)"""
+    finished = Signal(int, object)
+    failed = Signal(int, object)
+
+
+class Worker(QRunnable):
+    """스레드풀에서 함수 하나를 실행하고 결과를 시그널로 전달"""
+
+    def __init__(self, task_id, fn, *args, **kwargs):
+        super().__init__()
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.task_id, e)
+        else:
+            self.signals.finished.emit(self.task_id, result)
+
+
+class TaskRunner(QObject):
+    """
+    백그라운드 작업 실행기 (위젯/다이얼로그마다 하나씩 생성)
+
+    DB 조회나 HTTP 요청을 스레드풀에서 실행하고, 결과/오류 콜백은 GUI 스레드에서 호출합니다.
+    같은 key로 다시 실행하면 이전 작업은 아직 시작 전이면 대기열에서 빼고, 실행 중이면 결과를 버리므로
+    (오래된 조회 취소) 마지막 요청만 화면에 반영됩니다.
+    작업 함수는 GUI 스레드의 세션이나 위젯에 접근하지 않아야 합니다.
+    """
+
+    # 실행 중인 작업이 생기거나 모두 끝났을 때 발생 (바쁨 표시용)
+    busy_changed = Signal(bool)
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool or worker_pool()
+        self._ids = count(1)
+        self._tasks = {}  # 작업 ID -> (key, 작업, 결과 콜백, 오류 콜백)
+        self._latest = {}  # key -> 마지막으로 실행한 작업 ID
+
+    def run(self, fn, *args, key=None, on_result=None, on_error=None, **kwargs):
+        """fn(*args, **kwargs)를 백그라운드에서 실행하고 작업 ID 반환"""
+        task_id = next(self._ids)
+        worker = Worker(task_id, fn, *args, **kwargs)
+        worker.signals.finished.connect(self._on_finished)
+        worker.signals.failed.connect(self._on_failed)
+
+        if key is not None:
+            self._discard_queued(self._latest.get(key))
+            self._latest[key] = task_id
+        self._tasks[task_id] = (key, worker, on_result, on_error)
+        if len(self._tasks) == 1:
+            self.busy_changed.emit(True)
+        self.pool.start(worker)
+        return task_id
+
+    def is_running(self, key):
+        return key in self._latest
+
+    def is_busy(self):
+        return bool(self._tasks)
+
+    def cancel(self, key):
+        """key 작업 취소 (이미 시작된 작업은 끝까지 실행되고 결과만 버림)"""
+        self._discard_queued(self._latest.pop(key, None))
+
+    def cancel_all(self):
+        """모든 작업 취소 (창을 닫을 때 호출)"""
+        self._latest.clear()
+        for task_id in list(self._tasks):
+            self._discard_queued(task_id)
+        self._tasks = {task_id: (key, worker, None, None) for task_id, (key, worker, _, _) in self._tasks.items()}
+
+    def _discard_queued(self, task_id):
+        """아직 시작하지 않은 작업을 대기열에서 제거"""
+        task = self._tasks.get(task_id)
+        if task is not None and self.pool.tryTake(task[1]):
+            del self._tasks[task_id]
+            if not self._tasks:
+                self.busy_changed.emit(False)
+
+    def _take(self, task_id):
+        """끝난 작업의 콜백 조회 (취소됐거나 더 최근 작업이 있으면 None)"""
+        key, _, on_result, on_error = self._tasks.pop(task_id, (None, None, None, None))
+        if not self._tasks:
+            self.busy_changed.emit(False)
+        if key is not None:
+            if self._latest.get(key) != task_id:
+                return None, None
+            del self._latest[key]
+        return on_result, on_error
+
+    def _on_finished(self, task_id, result):
+        on_result, _ = self._take(task_id)
+        if on_result is not None:
+            on_result(result)
+
+    def _on_failed(self, task_id, error):
+        _, on_error = self._take(task_id)
+        if on_error is not None:
+            on_error(error)
+
+
+class BusyIndicator(QProgressBar):
+    """작업 실행 중에만 보이는 진행 표시줄"""
+
+    def __init__(self, tasks, parent=None):
+        super().__init__(parent)
+        self.setRange(0, 0)
+        self.setTextVisible(False)
+        self.setMaximumWidth(120)
+        self.setVisible(tasks.is_busy())
+        tasks.busy_changed.connect(self.setVisible)
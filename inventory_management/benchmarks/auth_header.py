@@ -0,0 +1,66 @@
+"""
+인증 헤더 생성 벤치마크: 호출마다 QSettings 읽기 vs 메모리 토큰 저장소
+
+API 요청마다 호출되는 get_auth_header()의 비용을 비교합니다.
+- QSettings: 호출마다 QSettings를 열어 토큰을 읽고 정리해 헤더 생성 (이전 방식, 콘솔 출력 제외)
+- 토큰 저장소: 처음 한 번만 읽고 이후에는 메모리의 헤더를 반환
+실제 설정 파일을 건드리지 않도록 임시 디렉터리의 INI 파일을 사용합니다.
+
+사용법:
+    python benchmarks/auth_header.py --calls 100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from PySide6.QtCore import QSettings
+
+from app.config import AUTH_TOKEN_SETTINGS_KEY, AuthTokenStore, _normalize_token
+
+TOKEN = 'eyJhbGciOiJIUzI1NiJ9.eyJzdWIiOiJhZG1pbiIsImV4cCI6NDEwMjQ0NDgwMH0.signature'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인증 헤더 생성 비용 벤치마크")
+    parser.add_argument('--calls', type=int, default=100000, help="헤더 생성 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'auth.ini')
+
+        def open_settings():
+            return QSettings(path, QSettings.IniFormat)
+
+        settings = open_settings()
+        settings.setValue(AUTH_TOKEN_SETTINGS_KEY, TOKEN)
+        settings.sync()
+
+        def settings_header():
+            token = _normalize_token(open_settings().value(AUTH_TOKEN_SETTINGS_KEY, ''))
+            return {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'} if token else {}
+
+        store = AuthTokenStore()
+        store._settings = open_settings
+
+        print(f"인증 헤더 {args.calls:,}회 생성")
+        for label, build in (("QSettings 읽기", settings_header), ("토큰 저장소", store.headers)):
+            assert build()['Authorization'] == f'Bearer {TOKEN}'
+            begin = time.perf_counter()
+            for _ in range(args.calls):
+                build()
+            elapsed = time.perf_counter() - begin
+            print(f"  {label:<14} {elapsed:8.3f}초  호출당 {elapsed / args.calls * 1e6:8.2f}µs")
+
+
+if __name__ == "__main__":
+    main()
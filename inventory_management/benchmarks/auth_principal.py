@@ -0,0 +1,99 @@
+"""
+인증 사용자 조회 벤치마크: 요청마다 users 조회 vs 인증 캐시 vs 토큰 클레임
+
+조회 API의 인증 의존성(get_current_user_async) 한 번에 걸리는 시간을 비교합니다.
+- DB 조회: 요청마다 사용자명으로 users 행 전체를 ORM으로 조회 (이전 방식)
+- 인증 캐시: 권한 클레임이 없는 토큰 - 첫 요청만 조회하고 이후 캐시 적중
+- 토큰 클레임: 로그인 토큰의 사용자 ID/역할/회사 클레임 사용 (조회 없음)
+요청마다 비동기 세션을 새로 열며, 사용자는 --users명 중 무작위로 고릅니다.
+
+사용법:
+    python benchmarks/auth_principal.py --users 1000 --requests 20000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app import create_async_db_engine, create_db_engine
+from app.models import Base, Company, User
+from app.utils.auth import access_token_claims, create_access_token, decode_access_token, get_current_user_async
+from app.utils.principal_cache import principal_cache
+
+
+def seed(path: str, users: int):
+    engine = create_db_engine('production', f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Company), [{'name': "벤치마크 회사", 'business_number': "9999999999"}])
+        conn.execute(insert(User), [
+            {'username': f"user{i}", 'email': f"user{i}@example.com", 'password_hash': 'x' * 60,
+             'role': 'user', 'company_id': 1, 'is_active': True}
+            for i in range(users)
+        ])
+    engine.dispose()
+
+
+async def run(path: str, args):
+    engine = create_async_db_engine('production', f"sqlite+aiosqlite:///{path}")
+    session_factory = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    expires = timedelta(minutes=30)
+    names = [f"user{i}" for i in range(args.users)]
+    plain_tokens = {name: create_access_token({'sub': name}, expires) for name in names}
+    claim_tokens = {}
+    async with session_factory() as db:
+        for user in (await db.execute(select(User))).scalars():
+            claim_tokens[user.username] = create_access_token(access_token_claims(user), expires)
+
+    async def full_row(token, db):
+        # 이전 get_current_user_async 본문
+        username = decode_access_token(token).username
+        return (await db.execute(select(User).where(User.username == username))).scalars().first()
+
+    rng = random.Random(42)
+    picks = [rng.choice(names) for _ in range(args.requests)]
+    print(f"사용자 {args.users:,}명, 인증 {args.requests:,}회")
+    for label, lookup, tokens in (
+        ("DB 조회", full_row, plain_tokens),
+        ("인증 캐시", get_current_user_async, plain_tokens),
+        ("토큰 클레임", get_current_user_async, claim_tokens),
+    ):
+        principal_cache.clear()
+        begin = time.perf_counter()
+        for name in picks:
+            async with session_factory() as db:
+                assert (await lookup(tokens[name], db)).username == name
+        elapsed = time.perf_counter() - begin
+        print(f"  {label:<10} {elapsed:8.3f}초  요청당 {elapsed / args.requests * 1e6:8.1f}µs")
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인증 사용자 조회 비용 벤치마크")
+    parser.add_argument('--users', type=int, default=1000, help="사용자 수")
+    parser.add_argument('--requests', type=int, default=20000, help="인증 요청 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'auth.db')
+        seed(path, args.users)
+        asyncio.run(run(path, args))
+
+
+if __name__ == "__main__":
+    main()
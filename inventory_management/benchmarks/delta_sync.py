@@ -0,0 +1,107 @@
+"""
+증분 동기화 벤치마크: 전체 제품 목록 재조회 vs 변경분 조회(fetch_changes)
+
+회사 카탈로그(--products)를 한 번 동기화한 뒤 일부 제품(--changes)의 재고를 바꾸고 일부를 삭제했을 때,
+새로고침 한 번에 전송되는 JSON 크기와 조회 시간을 비교합니다.
+
+사용법:
+    python benchmarks/delta_sync.py --products 50000 --changes 50
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app import create_db_engine
+from app.models import Base, Company, Product
+from app.utils.sync import MAX_SYNC_PAGE_SIZE, fetch_changes, sync_columns
+
+
+def setup(tmp_dir: str, products: int):
+    engine = create_db_engine('production', f"sqlite:///{os.path.join(tmp_dir, 'sync.db')}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Company), [{'name': "벤치마크 회사", 'business_number': "9999999999"}])
+        conn.execute(insert(Product), [
+            {'name': f"제품 {i}", 'code': f"SKU-{i:06d}", 'category': '식품', 'brand': '농심',
+             'price': 1000.0, 'current_stock': 100, 'company_id': 1}
+            for i in range(products)
+        ])
+    return engine, sessionmaker(bind=engine)
+
+
+def payload_size(data) -> int:
+    return len(json.dumps(jsonable_encoder(data), ensure_ascii=False).encode('utf-8'))
+
+
+def full_reload(db):
+    """기존 방식: 회사 제품 전체 조회"""
+    rows = db.execute(select(*sync_columns('products')).where(Product.company_id == 1)).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def delta(db, since: int):
+    pages = []
+    while True:
+        page = fetch_changes(db, 'products', since, 1, MAX_SYNC_PAGE_SIZE)
+        pages.append(page)
+        since = page['sync_token']
+        if not page['has_more']:
+            return pages, since
+
+
+def measure(run, *args):
+    begin = time.perf_counter()
+    result = run(*args)
+    return result, time.perf_counter() - begin
+
+
+def main():
+    parser = argparse.ArgumentParser(description="증분 동기화 전송량/조회 시간 벤치마크")
+    parser.add_argument('--products', type=int, default=50000, help="카탈로그 제품 수")
+    parser.add_argument('--changes', type=int, default=50, help="새로고침 사이에 변경되는 제품 수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine, session_factory = setup(tmp_dir, args.products)
+        db = session_factory()
+
+        # 처음 동기화 (토큰 0부터 전체)
+        (pages, token), elapsed = measure(delta, db, 0)
+        print(f"제품 {args.products:,}건, 변경 {args.changes}건 (그중 10%는 삭제)")
+        print(f"  {'처음 동기화 (토큰 0)':<24} {sum(payload_size(page) for page in pages) / 1024:>10,.1f} KB  {elapsed * 1000:8.1f}ms")
+
+        changed = rng.sample(range(1, args.products + 1), args.changes)
+        removed = changed[:max(1, args.changes // 10)]
+        db.execute(update(Product).where(Product.id.in_(changed)).values(current_stock=Product.current_stock - 1))
+        db.execute(delete(Product).where(Product.id.in_(removed)))
+        db.commit()
+
+        rows, elapsed = measure(full_reload, db)
+        print(f"  {'새로고침: 전체 재조회':<24} {payload_size(rows) / 1024:>10,.1f} KB  {elapsed * 1000:8.1f}ms")
+        (pages, _), elapsed = measure(delta, db, token)
+        print(f"  {'새로고침: 변경분 조회':<24} {sum(payload_size(page) for page in pages) / 1024:>10,.1f} KB  {elapsed * 1000:8.1f}ms"
+              f"  (변경 {sum(len(page['changed']) for page in pages)}건, 삭제 {sum(len(page['deleted']) for page in pages)}건)")
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+데이터베이스 엔진 프로필별 쓰기 처리량 벤치마크
+
+POST /sales 와 POST /products 가 실행하는 트랜잭션(제품 조회 → 재고 차감 → 판매 기록,
+상품코드 중복 확인 → 제품 등록)을 여러 스레드에서 반복 실행하여
+development / production 프로필의 초당 처리량을 비교합니다.
+
+사용법:
+    python benchmarks/engine_profiles.py --threads 8 --ops 2000
+"""
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from sqlalchemy.orm import sessionmaker
+
+from app import create_db_engine
+from app.config import DB_ENGINE_PROFILES
+from app.models import Base, Company, Product, SaleRecord
+
+
+def seed(session_factory, product_count: int, initial_stock: int) -> int:
+    """벤치마크용 회사와 제품 생성"""
+    db = session_factory()
+    try:
+        company = Company(name="벤치마크 회사", business_number="9999999999")
+        db.add(company)
+        db.flush()
+        for i in range(product_count):
+            db.add(Product(
+                name=f"제품 {i}",
+                code=f"SEED-{i:06d}",
+                current_stock=initial_stock,
+                price=1000.0,
+                company_id=company.id,
+            ))
+        db.commit()
+        return company.id
+    finally:
+        db.close()
+
+
+def sale_write(db, product_id: int):
+    """POST /sales 의 쓰기 트랜잭션"""
+    product = db.query(Product).filter(Product.id == product_id).first()
+    if product.current_stock < 1:
+        db.rollback()
+        return
+    db.add(SaleRecord(product_id=product_id, quantity=1, unit_price=product.price,
+                      customer_name="벤치마크"))
+    product.current_stock -= 1
+    db.commit()
+
+
+def product_write(db, company_id: int, code: str):
+    """POST /products 의 쓰기 트랜잭션"""
+    if db.query(Product).filter(Product.code == code).first():
+        db.rollback()
+        return
+    db.add(Product(name=code, code=code, price=1000.0, company_id=company_id))
+    db.commit()
+
+
+def run_profile(profile: str, threads: int, ops: int, product_count: int) -> dict:
+    """프로필 하나에 대해 판매/제품 쓰기 처리량 측정"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        url = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+        
+        # development 프로필의 echo 로그는 측정에 포함하되 화면에는 출력하지 않음
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            engine = create_db_engine(profile, url)
+            Base.metadata.create_all(bind=engine)
+            session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            company_id = seed(session_factory, product_count, initial_stock=ops)
+            
+            results = {}
+            for name in ('sales', 'products'):
+                errors = []
+                per_thread = ops // threads
+                
+                def worker(worker_id: int):
+                    db = session_factory()
+                    try:
+                        for i in range(per_thread):
+                            if name == 'sales':
+                                sale_write(db, (worker_id + i) % product_count + 1)
+                            else:
+                                product_write(db, company_id, f"BENCH-{worker_id}-{i}")
+                    except Exception as e:
+                        errors.append(e)
+                    finally:
+                        db.close()
+                
+                workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+                start = time.perf_counter()
+                for t in workers:
+                    t.start()
+                for t in workers:
+                    t.join()
+                elapsed = time.perf_counter() - start
+                
+                results[name] = {
+                    'ops': per_thread * threads,
+                    'seconds': elapsed,
+                    'ops_per_sec': per_thread * threads / elapsed if elapsed else 0.0,
+                    'errors': len(errors),
+                }
+            
+            engine.dispose()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔진 프로필별 쓰기 처리량 벤치마크")
+    parser.add_argument('--threads', type=int, default=8, help="동시 실행 스레드 수")
+    parser.add_argument('--ops', type=int, default=2000, help="엔드포인트별 총 쓰기 횟수")
+    parser.add_argument('--products', type=int, default=100, help="판매 대상 제품 수")
+    parser.add_argument('--profile', action='append', choices=sorted(DB_ENGINE_PROFILES),
+                        help="측정할 프로필 (기본값: 전체)")
+    args = parser.parse_args()
+    
+    profiles = args.profile or sorted(DB_ENGINE_PROFILES)
+    
+    print(f"=== 엔진 프로필 벤치마크 (스레드 {args.threads}, 쓰기 {args.ops}회) ===")
+    for profile in profiles:
+        results = run_profile(profile, args.threads, args.ops, args.products)
+        print(f"\n📋 프로필: {profile}")
+        for name, result in results.items():
+            print(f"  - POST /{name}: {result['ops_per_sec']:,.1f} ops/s "
+                  f"({result['ops']}회, {result['seconds']:.2f}초, 오류 {result['errors']}건)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+내보내기 메모리 벤치마크: query.all() 후 CSV 생성 vs yield_per 스트리밍 CSV
+
+판매 기록 수를 늘려 가며 두 방식의 최대 메모리 사용량(tracemalloc)과 소요 시간을 비교합니다.
+스트리밍 방식은 행 수와 관계없이 메모리 사용량이 일정해야 합니다.
+
+사용법:
+    python benchmarks/export_memory.py --sizes 10000 100000 1000000
+"""
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app import create_db_engine
+from app.models import Base, Company, Product, SaleRecord
+from app.utils.export import datetime_positions, export_headers, export_query, iter_partitions, stream_csv
+
+
+def seed(engine, rows: int):
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(Company), [{'name': "벤치마크 회사", 'business_number': "9999999999"}])
+        conn.execute(insert(Product), [
+            {'name': f"제품 {i}", 'code': f"SKU-{i:06d}", 'price': 1000.0, 'company_id': 1} for i in range(1000)
+        ])
+        for offset in range(0, rows, 50000):
+            conn.execute(insert(SaleRecord), [
+                {
+                    'product_id': rng.randint(1, 1000), 'quantity': 1, 'unit_price': 1000.0, 'total_price': 1000.0,
+                    'customer_name': f"고객 {i % 5000}", 'sale_date': start + timedelta(minutes=i),
+                }
+                for i in range(offset, min(rows, offset + 50000))
+            ])
+
+
+def load_all(session_factory, query, headers):
+    """기존 방식: 전체 행을 메모리에 올린 뒤 CSV 생성"""
+    db = session_factory()
+    rows = db.execute(query).all()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    writer.writerows(rows)
+    db.close()
+    return len(buffer.getvalue())
+
+
+def streaming(session_factory, query, headers):
+    partitions = iter_partitions(query, session_factory=session_factory)
+    return sum(len(chunk) for chunk in stream_csv(headers, partitions, datetime_positions('sales')))
+
+
+def measure(run, *args):
+    tracemalloc.start()
+    begin = time.perf_counter()
+    run(*args)
+    elapsed = time.perf_counter() - begin
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="판매 내역 내보내기 메모리 사용량 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000], help="판매 기록 수")
+    args = parser.parse_args()
+
+    headers = export_headers('sales')
+    print(f"{'행 수':>10}  {'전체 로드 peak':>14}  {'시간':>7}  {'스트리밍 peak':>14}  {'시간':>7}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            engine = create_db_engine('production', f"sqlite:///{os.path.join(tmp_dir, 'export.db')}")
+            Base.metadata.create_all(bind=engine)
+            seed(engine, size)
+            session_factory = sessionmaker(bind=engine)
+            query = export_query('sales')
+
+            load_time, load_peak = measure(load_all, session_factory, query, headers)
+            stream_time, stream_peak = measure(streaming, session_factory, query, headers)
+            print(f"{size:>10,}  {load_peak:>11.1f} MB  {load_time:>6.2f}s  {stream_peak:>11.1f} MB  {stream_time:>6.2f}s")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
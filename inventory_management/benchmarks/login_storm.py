@@ -0,0 +1,153 @@
+"""
+로그인 폭주 부하 테스트: 이벤트 루프에서 bcrypt 검증 vs 비밀번호 전용 스레드풀
+
+로그인 요청이 계속 들어오는 동안 다른 조회 API(GET /products/) 응답 시간이 얼마나 늘어나는지 측정합니다.
+- 로그인 없음: 조회 요청만 실행한 기준값
+- 이벤트 루프에서 검증: 이전 로그인 처리 방식 (async 핸들러 안에서 bcrypt.checkpw 직접 호출)
+- 비밀번호 스레드풀: 현재 /auth/token (전용 스레드풀에서 검증, 대기열이 가득 차면 503)
+서버 앱을 같은 프로세스에서 httpx ASGI 전송으로 호출하므로 이벤트 루프 지연이 그대로 드러납니다.
+
+사용법:
+    python benchmarks/login_storm.py --logins 16 --seconds 5
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+import httpx
+from fastapi import Depends, HTTPException
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import create_async_db_engine, create_db_engine, get_async_db, get_db
+from app.models import Base, Company, Product, User
+from app.utils.auth import access_token_claims, create_access_token, get_password_hash, verify_password
+from app.utils.password_pool import PASSWORD_POOL_QUEUE_LIMIT, PASSWORD_POOL_WORKERS
+from main import app
+
+PASSWORD = 'bench-password'
+
+
+def seed(path: str):
+    engine = create_db_engine('production', f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Company), [{'name': "벤치마크 회사", 'business_number': "9999999999"}])
+        conn.execute(insert(User), [{
+            'username': 'bench', 'email': 'bench@example.com', 'password_hash': get_password_hash(PASSWORD),
+            'role': 'admin', 'company_id': 1, 'is_active': True,
+        }])
+        conn.execute(insert(Product), [
+            {'name': f"제품 {i}", 'code': f"SKU-{i:05d}", 'price': 1000.0, 'cost_price': 500.0, 'current_stock': 10, 'company_id': 1}
+            for i in range(200)
+        ])
+    return engine
+
+
+@app.post("/bench/token-inline")
+async def login_inline(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+    """이전 로그인 처리 방식 (비교용)"""
+    user = db.query(User).filter(User.username == form_data.username).first()
+    if not user or not verify_password(form_data.password, user.password_hash):
+        raise HTTPException(status_code=401, detail="Incorrect username or password")
+    return {"access_token": create_access_token({"sub": user.username}), "token_type": "bearer"}
+
+
+async def scenario(client, headers, login_path, args):
+    """조회 요청 지연(초 목록)과 로그인 성공/거절 수"""
+    stop = time.perf_counter() + args.seconds
+    latencies = []
+    logins = {200: 0, 503: 0}
+
+    async def probe():
+        while time.perf_counter() < stop:
+            begin = time.perf_counter()
+            response = await client.get('/products/?limit=20', headers=headers)
+            assert response.status_code == 200, response.text
+            latencies.append(time.perf_counter() - begin)
+            await asyncio.sleep(0.01)
+
+    async def storm():
+        while time.perf_counter() < stop:
+            response = await client.post(login_path, data={'username': 'bench', 'password': PASSWORD})
+            logins[response.status_code] = logins.get(response.status_code, 0) + 1
+            if response.status_code == 503:
+                await asyncio.sleep(0.05)
+
+    storms = [storm() for _ in range(args.logins)] if login_path else []
+    await asyncio.gather(probe(), *storms)
+    return latencies, logins
+
+
+async def run(path: str, sync_engine, args):
+    async_engine = create_async_db_engine('production', f"sqlite+aiosqlite:///{path}")
+    session_factory = sessionmaker(bind=sync_engine, autoflush=False)
+    async_session_factory = async_sessionmaker(
+        bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+
+    def override_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_async_db():
+        async with async_session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_async_db] = override_async_db
+
+    with session_factory() as db:
+        token = create_access_token(access_token_claims(db.query(User).first()))
+    headers = {'Authorization': f'Bearer {token}'}
+
+    print(f"로그인 동시 요청 {args.logins}개, 시나리오당 {args.seconds}초 "
+          f"(비밀번호 스레드 {PASSWORD_POOL_WORKERS}개, 대기열 {PASSWORD_POOL_QUEUE_LIMIT})")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        for label, login_path in (
+            ("로그인 없음", None),
+            ("이벤트 루프에서 검증", '/bench/token-inline'),
+            ("비밀번호 스레드풀", '/auth/token'),
+        ):
+            latencies, logins = await scenario(client, headers, login_path, args)
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(f"  {label:<14} 조회 {len(latencies):5,}회  p50 {statistics.median(latencies) * 1000:7.1f}ms  "
+                  f"p99 {p99 * 1000:7.1f}ms  최대 {latencies[-1] * 1000:7.1f}ms  "
+                  f"로그인 성공 {logins.get(200, 0):4,}  거절(503) {logins.get(503, 0):4,}")
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 폭주 시 조회 API 응답 시간 부하 테스트")
+    parser.add_argument('--logins', type=int, default=16, help="동시에 로그인을 반복하는 클라이언트 수")
+    parser.add_argument('--seconds', type=float, default=5, help="시나리오별 실행 시간 (초)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'login.db')
+        sync_engine = seed(path)
+        asyncio.run(run(path, sync_engine, args))
+        sync_engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+비밀번호 해시 비용 측정 벤치마크: 목표 시간별 bcrypt 비용과 실제 검증 시간
+
+목표 시간(--targets, 밀리초)마다 이 서버에서 측정한 bcrypt 비용과, 그 비용으로 만든 해시의
+실제 검증(checkpw) 시간을 출력합니다. 고정 비용(bcrypt 기본값 12)의 검증 시간도 함께 비교합니다.
+공통 비용이 없는 DB에서 처음 시작한 서버가 이 측정값을 system_settings에 저장하므로, PASSWORD_HASH_TARGET_MS를 정할 때 참고합니다.
+
+사용법:
+    python benchmarks/password_cost.py --targets 100 250 500 --samples 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+import bcrypt
+
+from app.utils.password_cost import calibrate_bcrypt_rounds
+
+PASSWORD = b'bench-password'
+
+
+def verify_ms(rounds: int, samples: int) -> float:
+    """해당 비용 해시의 검증 시간 중앙값 (밀리초)"""
+    hashed = bcrypt.hashpw(PASSWORD, bcrypt.gensalt(rounds=rounds))
+    timings = []
+    for _ in range(samples):
+        begin = time.perf_counter()
+        bcrypt.checkpw(PASSWORD, hashed)
+        timings.append((time.perf_counter() - begin) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목표 시간별 bcrypt 비용 측정 벤치마크")
+    parser.add_argument('--targets', type=int, nargs='+', default=[100, 250, 500], help="목표 해시 시간 (밀리초)")
+    parser.add_argument('--samples', type=int, default=5, help="검증 시간 측정 횟수")
+    args = parser.parse_args()
+
+    print(f"고정 비용 12          검증 {verify_ms(12, args.samples):8.1f}ms")
+    for target in args.targets:
+        begin = time.perf_counter()
+        rounds = calibrate_bcrypt_rounds(target)
+        calibration = (time.perf_counter() - begin) * 1000
+        print(f"목표 {target:5d}ms -> 비용 {rounds:2d}  검증 {verify_ms(rounds, args.samples):8.1f}ms  "
+              f"(측정 {calibration:6.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+제품 대량 등록 벤치마크: 제품별 등록(ProductController.create_product) vs 청크 단위 가져오기(ProductImporter)
+
+같은 CSV 행을 제품당 조회 2회 + 커밋 1회로 등록하는 방식과
+청크 단위 검증/중복 일괄 조회/executemany INSERT 방식의 처리량을 비교합니다.
+FTS 트리거와 초성/자모 검색 키, 초기 재고 원장 기록이 모두 포함된 시간입니다.
+
+사용법:
+    python benchmarks/product_import.py --rows 20000 --chunk-size 1000
+"""
+import argparse
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app import create_db_engine
+from app.controllers.product_controller import ProductController
+from app.models import Base, Company, Product
+from app.models.product_search import ensure_product_search_index
+from app.utils.product_import import ProductImporter, read_csv_rows
+
+
+def make_csv(rows: int, prefix: str) -> str:
+    """가져오기용 CSV 내용 생성"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(['상품명', '상품코드', '분류', '브랜드', '현재 재고', '판매가격'])
+    for i in range(rows):
+        writer.writerow([f"대량 등록 제품 {i}", f"{prefix}-{i:07d}", '식품', '농심', i % 50, 1000 + i])
+    return buffer.getvalue()
+
+
+def setup(tmp_dir: str, name: str):
+    engine = create_db_engine('production', f"sqlite:///{os.path.join(tmp_dir, name)}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        ensure_product_search_index(conn)
+    session_factory = sessionmaker(bind=engine)
+    db = session_factory()
+    company = Company(name="벤치마크 회사", business_number="9999999999")
+    db.add(company)
+    db.commit()
+    return engine, db, company.id
+
+
+def run_per_product(tmp_dir: str, content: str):
+    engine, db, company_id = setup(tmp_dir, 'per_product.db')
+    controller = ProductController(db)
+    begin = time.perf_counter()
+    for row in read_csv_rows(io.StringIO(content)):
+        controller.create_product({
+            'name': row['name'], 'code': row['code'], 'category': row['category'], 'brand': row['brand'],
+            'model': None, 'stock': int(row['current_stock']), 'min_stock': 0,
+            'selling_price': float(row['price']), 'cost_price': 0, 'supplier': {'name': ''},
+        }, company_id)
+    elapsed = time.perf_counter() - begin
+    count = db.scalar(select(func.count(Product.id)))
+    db.close()
+    engine.dispose()
+    return elapsed, count
+
+
+def run_importer(tmp_dir: str, content: str, chunk_size: int):
+    engine, db, company_id = setup(tmp_dir, 'importer.db')
+    begin = time.perf_counter()
+    report = ProductImporter(db, company_id, chunk_size=chunk_size).run(read_csv_rows(io.StringIO(content)))
+    elapsed = time.perf_counter() - begin
+    db.close()
+    engine.dispose()
+    return elapsed, report['imported']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제품 대량 등록 처리량 벤치마크")
+    parser.add_argument('--rows', type=int, default=20000, help="등록할 제품 수")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="가져오기 트랜잭션당 행 수")
+    args = parser.parse_args()
+
+    content = make_csv(args.rows, 'BULK')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print(f"제품 {args.rows:,}건 등록")
+        for label, run in (
+            ("제품별 등록 (조회 2회 + 커밋)", lambda: run_per_product(tmp_dir, content)),
+            (f"청크 가져오기 ({args.chunk_size}행/트랜잭션)", lambda: run_importer(tmp_dir, content, args.chunk_size)),
+        ):
+            elapsed, count = run()
+            print(f"  {label:<32} {elapsed:8.2f}초  {count / elapsed:10,.0f}건/초  (등록 {count:,}건)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+제품 검색 벤치마크: ILIKE 5개 컬럼 스캔 vs FTS5 전문 검색
+
+대량의 제품 카탈로그를 생성한 뒤 기존 ILIKE 조건과 FTS5(bm25 정렬) 검색의
+응답 시간을 비교합니다. 1~2글자 검색어(예: '김')는 부분 문자열 검색 키 색인을 사용하며,
+회사 조건이 없는 관리자 검색도 함께 측정합니다.
+
+사용법:
+    python benchmarks/product_search.py --rows 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from sqlalchemy import insert, select
+
+from app import create_db_engine
+from app.models import Base, Company, Product
+from app.models.product_search import (
+    jamo_match_subquery, product_match_subquery, rebuild_product_search_keys
+)
+
+NAMES = ['김치', '라면', '생수', '커피', '우유', '두부', '참치', '햇반', '과자', '맥주',
+         'Cable', 'Monitor', 'Keyboard', 'Mouse', 'Adapter', 'Charger', 'Speaker', 'Lamp']
+BRANDS = ['종가집', '농심', '삼다수', '동원', '오뚜기', 'CJ', 'Samsung', 'LG', 'Logitech', 'Anker']
+SEARCH_TERMS = ['김', '김치', '농심 라면', 'Keyboard', 'SKU-0042', 'Anker Charger', '없는상품']
+JAMO_TERMS = ['ㄱㅊ', 'ㄹㅁㅋㅍ', '김ㅊ', 'ㅋㅂ', 'ㅎㅂ']
+
+
+def seed(engine, rows: int, companies: int, chunk_size: int = 50000):
+    """대량 제품 데이터 생성"""
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(insert(Company), [
+            {'name': f"회사 {i}", 'business_number': f"{i:010d}"} for i in range(1, companies + 1)
+        ])
+    for start in range(0, rows, chunk_size):
+        batch = []
+        for i in range(start, min(start + chunk_size, rows)):
+            name = f"{rng.choice(NAMES)} {rng.choice(NAMES)} {i % 1000}"
+            batch.append({
+                'name': name,
+                'code': f"SKU-{i:07d}",
+                'brand': rng.choice(BRANDS),
+                'model': f"M{rng.randint(100, 999)}",
+                'description': f"{name} 상세 설명",
+                'current_stock': rng.randint(0, 500),
+                'minimum_stock': 0,
+                'price': 1000.0,
+                'company_id': rng.randint(1, companies),
+            })
+        with engine.begin() as conn:
+            conn.execute(insert(Product), batch)
+        print(f"  제품 {min(start + chunk_size, rows):,}개 생성", end='\r')
+    print()
+
+
+def ilike_query(search: str, company_id: int, limit: int):
+    """기존 방식: 5개 컬럼 ILIKE '%검색어%'"""
+    pattern = f"%{search}%"
+    return select(Product).where(
+        (Product.name.ilike(pattern)) |
+        (Product.code.ilike(pattern)) |
+        (Product.brand.ilike(pattern)) |
+        (Product.model.ilike(pattern)) |
+        (Product.description.ilike(pattern)),
+        Product.company_id == company_id
+    ).limit(limit)
+
+
+def fts_query(search: str, company_id: int, limit: int):
+    """FTS5 방식: trigram 전문 검색 색인 + bm25 정렬 (3글자 미만 단어는 부분 문자열 검색 키 색인)"""
+    matches = product_match_subquery(search, company_id)
+    return (
+        select(Product)
+        .join(matches, Product.id == matches.c.id)
+        .where(Product.company_id == company_id)
+        .order_by(matches.c.rank, Product.id)
+        .limit(limit)
+    )
+
+
+def admin_query(search: str, company_id: int, limit: int):
+    """관리자 검색: 회사 조건 없이 FTS5/부분 문자열 검색 키 색인 사용"""
+    matches = product_match_subquery(search)
+    return (
+        select(Product)
+        .join(matches, Product.id == matches.c.id)
+        .order_by(matches.c.rank, Product.id)
+        .limit(limit)
+    )
+
+
+def jamo_query(search: str, company_id: int, limit: int):
+    """초성/자모 방식: 검색 키 색인 접두어 범위 검색"""
+    matches = jamo_match_subquery(search, company_id)
+    return (
+        select(Product)
+        .join(matches, Product.id == matches.c.id)
+        .order_by(matches.c.rank, Product.id)
+        .limit(limit)
+    )
+
+
+def measure(engine, build_query, repeat: int, limit: int, terms=SEARCH_TERMS):
+    """검색어별 중간값 응답 시간(ms) 측정"""
+    results = {}
+    with engine.connect() as conn:
+        for term in terms:
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                rows = conn.execute(build_query(term, 1, limit)).all()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[term] = (statistics.median(timings), len(rows))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="제품 검색 벤치마크 (ILIKE vs FTS5, 초성/자모)")
+    parser.add_argument('--rows', type=int, default=1000000, help="생성할 제품 수")
+    parser.add_argument('--companies', type=int, default=10, help="회사 수")
+    parser.add_argument('--repeat', type=int, default=5, help="검색어별 반복 횟수")
+    parser.add_argument('--limit', type=int, default=100, help="검색 결과 최대 개수")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_db_engine('production', f"sqlite:///{os.path.join(tmp_dir, 'search.db')}")
+        Base.metadata.create_all(bind=engine)
+        
+        print(f"=== 제품 검색 벤치마크 (제품 {args.rows:,}개, 회사 {args.companies}개) ===")
+        start = time.perf_counter()
+        seed(engine, args.rows, args.companies)
+        print(f"데이터 생성 완료: {time.perf_counter() - start:.1f}초 (FTS 트리거 포함)")
+        
+        # 대량 INSERT는 ORM 이벤트를 거치지 않으므로 초성/자모/부분 문자열 검색 키를 한 번에 생성
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            rebuild_product_search_keys(conn)
+        print(f"초성/자모/부분 문자열 검색 키 생성: {time.perf_counter() - start:.1f}초\n")
+        
+        ilike_results = measure(engine, ilike_query, args.repeat, args.limit)
+        fts_results = measure(engine, fts_query, args.repeat, args.limit)
+        admin_results = measure(engine, admin_query, args.repeat, args.limit)
+        
+        print(f"{'검색어':<16}{'ILIKE (ms)':>12}{'FTS5 (ms)':>12}{'배속':>8}{'관리자 (ms)':>14}")
+        for term in SEARCH_TERMS:
+            ilike_ms, ilike_rows = ilike_results[term]
+            fts_ms, fts_rows = fts_results[term]
+            admin_ms, _ = admin_results[term]
+            speedup = ilike_ms / fts_ms if fts_ms else 0.0
+            print(f"{term:<16}{ilike_ms:>12.2f}{fts_ms:>12.2f}{speedup:>7.1f}x{admin_ms:>14.2f}"
+                  f"   (결과 {ilike_rows} / {fts_rows}건)")
+        
+        print()
+        jamo_results = measure(engine, jamo_query, args.repeat, args.limit, JAMO_TERMS)
+        print(f"{'검색어':<16}{'초성/자모 (ms)':>14}")
+        for term in JAMO_TERMS:
+            jamo_ms, jamo_rows = jamo_results[term]
+            print(f"{term:<16}{jamo_ms:>14.2f}   (결과 {jamo_rows}건)")
+        
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+데스크톱 제품 목록 벤치마크: QTableWidget 전체 로드 vs ProductTableModel(QTableView) 지연 로드
+
+회사 카탈로그(--rows)를 열 때까지 걸리는 시간과 늘어난 메모리(RSS)를 비교합니다.
+- 기존 방식: 전체 제품 ORM 조회 후 행마다 insertRow + QTableWidgetItem 10개, resizeColumnsToContents
+- 모델 방식: 첫 페이지(500행)만 튜플로 조회, 이후 스크롤 시 fetchMore
+모델 방식은 끝까지 스크롤했을 때(전체 행 로드)도 함께 측정합니다.
+Qt 객체의 메모리는 tracemalloc에 잡히지 않으므로 각 방식을 별도 프로세스에서 RSS로 측정합니다.
+
+사용법:
+    python benchmarks/product_table.py --rows 200000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+def rss_mb() -> float:
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+
+
+def seed(path: str, rows: int):
+    from sqlalchemy import insert
+
+    from app import create_db_engine
+    from app.models import Base, Company, Product
+
+    engine = create_db_engine('production', f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Company), [{'name': "벤치마크 회사", 'business_number': "9999999999"}])
+        for offset in range(0, rows, 50000):
+            conn.execute(insert(Product), [
+                {'name': f"제품 {i}", 'code': f"SKU-{i:07d}", 'category': '식품', 'brand': '농심',
+                 'model': f"M-{i % 100}", 'price': 1000.0 + i, 'current_stock': i % 500, 'company_id': 1}
+                for i in range(offset, min(rows, offset + 50000))
+            ])
+    engine.dispose()
+
+
+def run_variant(path: str, variant: str):
+    """한 방식만 측정하고 '시간 메모리 행수'를 출력 (자식 프로세스에서 실행)"""
+    from PySide6.QtCore import QEventLoop
+    from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem, QTableView
+    from sqlalchemy.orm import sessionmaker
+
+    from app import create_db_engine
+    from app.models import Product
+    from app.views.product_table_model import ProductTableModel
+    from app.views.workers import TaskRunner
+
+    app = QApplication.instance() or QApplication([])
+    engine = create_db_engine('production', f"sqlite:///{path}")
+    session_factory = sessionmaker(bind=engine)
+    db = session_factory()
+    before = rss_mb()
+    begin = time.perf_counter()
+
+    if variant == 'widget':
+        table = QTableWidget()
+        table.setColumnCount(10)
+        products = db.query(Product).filter(Product.company_id == 1).order_by(Product.created_at.desc()).all()
+        # PySide6 6.12 + Python 3.11에서는 insertRow/setItem 호출마다 None 참조 카운트가 하나씩 줄어
+        # 수백 행만 넘어도 인터프리터가 비정상 종료되므로, 비교를 위해 호출 수만큼 참조를 미리 잡아 둠
+        none_refs = [None] * (len(products) * 11)
+        for row, product in enumerate(products):
+            table.insertRow(row)
+            for column, value in enumerate((
+                str(product.id), product.code, product.name, product.category or '', product.brand or '',
+                product.model or '', str(product.current_stock), str(product.minimum_stock),
+                f"{product.price:,.0f}원", product.created_at.strftime('%Y-%m-%d') if product.created_at else '',
+            )):
+                table.setItem(row, column, QTableWidgetItem(value))
+        table.resizeColumnsToContents()
+    else:
+        tasks = TaskRunner()
+        model = ProductTableModel(session_factory, 1, tasks)
+        view = QTableView()
+        view.setModel(model)
+
+        def wait():
+            # 페이지는 작업 스레드에서 조회되므로 결과 시그널이 처리될 때까지 대기
+            while tasks.is_busy():
+                app.processEvents(QEventLoop.WaitForMoreEvents)
+
+        model.reset()
+        wait()
+        if variant == 'model_all':
+            while model.canFetchMore():
+                model.fetchMore()
+                wait()
+        table = view
+    table.resize(1024, 768)
+    table.show()
+    app.processEvents()
+
+    elapsed = time.perf_counter() - begin
+    rows = table.model().rowCount()
+    print(f"{elapsed} {rss_mb() - before} {rows}", flush=True)
+    # 종료 시 Qt 객체 정리 순서 문제로 비정상 종료되지 않도록 바로 종료 (측정 프로세스 전용)
+    os._exit(0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데스크톱 제품 목록 열기 시간/메모리 벤치마크")
+    parser.add_argument('--rows', type=int, default=200000, help="카탈로그 제품 수")
+    parser.add_argument('--variant', help=argparse.SUPPRESS)
+    parser.add_argument('--db', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(args.db, args.variant)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'products.db')
+        seed(path, args.rows)
+        print(f"제품 {args.rows:,}건 카탈로그 열기")
+        for label, variant in (
+            ("QTableWidget 전체 로드", 'widget'),
+            ("모델: 첫 페이지", 'model'),
+            ("모델: 끝까지 스크롤", 'model_all'),
+        ):
+            output = subprocess.run(
+                [sys.executable, __file__, '--variant', variant, '--db', path],
+                capture_output=True, text=True, check=True,
+            ).stdout.split()
+            elapsed, memory, rows = float(output[-3]), float(output[-2]), int(output[-1])
+            print(f"  {label:<22} {elapsed:8.2f}초  +{memory:8.1f} MB  (표시 행 {rows:,}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+목록 조회 인덱스 벤치마크: 복합 인덱스 추가 전/후 실행 계획과 응답 시간 비교
+
+대량의 회사/제품/판매/구매/사용자 데이터를 생성한 뒤, 목록 API와 데스크톱 제품 목록이
+사용하는 쿼리의 EXPLAIN QUERY PLAN과 중간값 응답 시간을 인덱스 추가 전/후로 기록합니다.
+
+사용법:
+    python benchmarks/query_indexes.py --products 100000 --sales 1000000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from sqlalchemy import insert, select, text
+
+from app import create_db_engine
+from app.models import Base, Company, Product, PurchaseInfo, SaleRecord, User
+
+# 벤치마크 대상 인덱스 (d8e4b6a1f3c5 마이그레이션과 동일)
+TARGET_INDEXES = {
+    'idx_products_company_created',
+    'idx_sale_records_sale_date', 'idx_sale_records_product_date',
+    'idx_purchase_infos_purchase_date', 'idx_purchase_infos_product_date',
+    'idx_users_company_active_created',
+}
+
+START_DATE = datetime(2024, 1, 1)
+PAGE_SIZE = 100
+
+
+def seed(engine, args, chunk_size: int = 50000):
+    """대량 데이터 생성"""
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(insert(Company), [
+            {'name': f"회사 {i}", 'business_number': f"{i:010d}"} for i in range(1, args.companies + 1)
+        ])
+        conn.execute(insert(User), [
+            {
+                'username': f"user{i}", 'email': f"user{i}@example.com", 'password_hash': 'x',
+                'role': 'user', 'company_id': rng.randint(1, args.companies),
+                'is_active': rng.random() > 0.1,
+                'created_at': START_DATE + timedelta(minutes=i), 'updated_at': START_DATE,
+            }
+            for i in range(args.users)
+        ])
+        conn.execute(insert(Product), [
+            {
+                'name': f"제품 {i}", 'code': f"SKU-{i:07d}", 'price': 1000.0,
+                'company_id': rng.randint(1, args.companies),
+                'created_at': START_DATE + timedelta(seconds=i * 30),
+            }
+            for i in range(args.products)
+        ])
+
+    def insert_rows(model, total, make_row):
+        for start in range(0, total, chunk_size):
+            with engine.begin() as conn:
+                conn.execute(insert(model), [make_row(i) for i in range(start, min(start + chunk_size, total))])
+            print(f"  {model.__tablename__} {min(start + chunk_size, total):,}건 생성", end='\r')
+        print()
+
+    insert_rows(SaleRecord, args.sales, lambda i: {
+        'product_id': rng.randint(1, args.products),
+        'sale_date': START_DATE + timedelta(seconds=rng.randint(0, 365 * 86400)),
+        'quantity': 1, 'unit_price': 1000.0, 'total_price': 1000.0,
+    })
+    insert_rows(PurchaseInfo, args.purchases, lambda i: {
+        'product_id': rng.randint(1, args.products), 'supplier_name': '공급업체',
+        'purchase_date': START_DATE + timedelta(seconds=rng.randint(0, 365 * 86400)),
+        'quantity': 10, 'unit_price': 500.0, 'total_price': 5000.0,
+    })
+
+
+def hot_queries(args):
+    """목록 API / 데스크톱 화면이 실행하는 쿼리"""
+    company_id = 1
+    product_id = args.products // 2
+    month_start = START_DATE + timedelta(days=180)
+    return {
+        'list_sales (회사별)': select(SaleRecord).join(Product)
+            .where(Product.company_id == company_id)
+            .order_by(SaleRecord.sale_date.desc(), SaleRecord.id.desc()).limit(PAGE_SIZE + 1),
+        'list_sales (전체 최신순)': select(SaleRecord).join(Product)
+            .order_by(SaleRecord.sale_date.desc(), SaleRecord.id.desc()).limit(PAGE_SIZE + 1),
+        'list_sales (제품별)': select(SaleRecord).join(Product)
+            .where(SaleRecord.product_id == product_id)
+            .order_by(SaleRecord.sale_date.desc(), SaleRecord.id.desc()).limit(PAGE_SIZE + 1),
+        'list_sales (기간)': select(SaleRecord).join(Product)
+            .where(SaleRecord.sale_date >= month_start,
+                   SaleRecord.sale_date <= month_start + timedelta(days=30))
+            .order_by(SaleRecord.sale_date.desc(), SaleRecord.id.desc()).limit(PAGE_SIZE + 1),
+        'list_purchases (제품별)': select(PurchaseInfo).join(Product)
+            .where(PurchaseInfo.product_id == product_id)
+            .order_by(PurchaseInfo.purchase_date.desc(), PurchaseInfo.id.desc()).limit(PAGE_SIZE + 1),
+        'list_purchases (전체 최신순)': select(PurchaseInfo).join(Product)
+            .order_by(PurchaseInfo.purchase_date.desc(), PurchaseInfo.id.desc()).limit(PAGE_SIZE + 1),
+        'list_products (회사별)': select(Product)
+            .where(Product.company_id == company_id).order_by(Product.id).limit(PAGE_SIZE + 1),
+        'load_products (데스크톱)': select(Product)
+            .where(Product.company_id == company_id).order_by(Product.created_at.desc()),
+        'list_users (회사별)': select(User)
+            .where(User.company_id == company_id, User.is_active == True)
+            .order_by(User.created_at.desc(), User.id.desc()).limit(PAGE_SIZE + 1),
+    }
+
+
+def measure(engine, queries, repeat: int):
+    """쿼리별 실행 계획과 중간값 응답 시간(ms) 측정"""
+    results = {}
+    with engine.connect() as conn:
+        for name, query in queries.items():
+            compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+            plan = [row[3] for row in conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))]
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                conn.execute(query).all()
+                timings.append((time.perf_counter() - start) * 1000)
+            results[name] = (statistics.median(timings), plan)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 조회 복합 인덱스 전/후 벤치마크")
+    parser.add_argument('--companies', type=int, default=50, help="회사 수")
+    parser.add_argument('--users', type=int, default=20000, help="사용자 수")
+    parser.add_argument('--products', type=int, default=100000, help="제품 수")
+    parser.add_argument('--sales', type=int, default=1000000, help="판매 기록 수")
+    parser.add_argument('--purchases', type=int, default=300000, help="구매 기록 수")
+    parser.add_argument('--repeat', type=int, default=5, help="쿼리별 반복 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_db_engine('production', f"sqlite:///{os.path.join(tmp_dir, 'indexes.db')}")
+        Base.metadata.create_all(bind=engine)
+        indexes = [index for table in Base.metadata.sorted_tables
+                   for index in table.indexes if index.name in TARGET_INDEXES]
+
+        print(f"=== 목록 조회 인덱스 벤치마크 (제품 {args.products:,}, 판매 {args.sales:,}, "
+              f"구매 {args.purchases:,}, 사용자 {args.users:,}) ===")
+        with engine.begin() as conn:
+            for index in indexes:
+                index.drop(conn)
+        seed(engine, args)
+        queries = hot_queries(args)
+
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+        before = measure(engine, queries, args.repeat)
+
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            for index in indexes:
+                index.create(conn)
+            conn.execute(text("ANALYZE"))
+        print(f"인덱스 생성: {time.perf_counter() - start:.1f}초\n")
+        after = measure(engine, queries, args.repeat)
+
+        print(f"{'쿼리':<28}{'전 (ms)':>10}{'후 (ms)':>10}{'배속':>8}")
+        for name in queries:
+            before_ms, _ = before[name]
+            after_ms, _ = after[name]
+            speedup = before_ms / after_ms if after_ms else 0.0
+            print(f"{name:<28}{before_ms:>10.2f}{after_ms:>10.2f}{speedup:>7.1f}x")
+
+        print("\n=== 실행 계획 ===")
+        for name in queries:
+            print(f"\n[{name}]")
+            print("  전: " + " / ".join(before[name][1]))
+            print("  후: " + " / ".join(after[name][1]))
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+판매 일괄 등록 벤치마크: 판매별 트랜잭션(POST /sales) vs 일괄 등록(POST /sales/batch)
+
+POS 단말 한 번의 동기화 분량(--batch)을 판매마다 커밋하는 방식과
+create_sales_batch로 한 트랜잭션에 등록하는 방식의 처리량을 비교합니다.
+재고 차감, 재고 원장, 일별/월별 집계 반영이 모두 포함된 시간입니다.
+
+사용법:
+    python benchmarks/sale_batch.py --batches 20 --batch 500
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app import create_db_engine
+from app.models import Base, Company, Product, SaleRecord
+from app.models.inventory_movement import MovementType
+from app.schemas.sale import SaleCreate
+from app.utils.sale_batch import create_sales_batch
+from app.utils.sales_rollup import add_sale_to_rollup
+from app.utils.stock import decrease_stock
+
+
+def setup(tmp_dir: str, name: str, products: int):
+    engine = create_db_engine('production', f"sqlite:///{os.path.join(tmp_dir, name)}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Company), [{'name': "벤치마크 회사", 'business_number': "9999999999"}])
+        conn.execute(insert(Product), [
+            {'name': f"제품 {i}", 'code': f"SKU-{i:06d}", 'price': 1000.0, 'current_stock': 10 ** 6, 'company_id': 1}
+            for i in range(products)
+        ])
+    return engine, sessionmaker(bind=engine)
+
+
+def make_batches(args):
+    rng = random.Random(42)
+    return [
+        [
+            {'product_id': rng.randint(1, args.products), 'customer_name': "POS",
+             'quantity': rng.randint(1, 3), 'unit_price': 1000.0}
+            for _ in range(args.batch)
+        ]
+        for _ in range(args.batches)
+    ]
+
+
+def run_per_sale(session_factory, batches, user):
+    """POST /sales 와 같은 판매별 트랜잭션"""
+    db = session_factory()
+    for batch in batches:
+        for item in batch:
+            sale = SaleCreate(**item)
+            product = db.query(Product).filter(Product.id == sale.product_id).first()
+            db_sale = SaleRecord(product_id=product.id, quantity=sale.quantity, unit_price=sale.unit_price,
+                                 customer_name=sale.customer_name, sale_date=sale.sale_date)
+            db.add(db_sale)
+            db.flush()
+            decrease_stock(db, product.id, sale.quantity, MovementType.SALE,
+                           reference_id=db_sale.id, created_by=user.id)
+            add_sale_to_rollup(db, db_sale)
+            db.commit()
+    db.close()
+
+
+def run_batch(session_factory, batches, user):
+    db = session_factory()
+    for batch in batches:
+        report = create_sales_batch(db, batch, user)
+        assert report['failed'] == 0, report
+    db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="판매 일괄 등록 처리량 벤치마크")
+    parser.add_argument('--products', type=int, default=1000, help="제품 수")
+    parser.add_argument('--batches', type=int, default=20, help="동기화 횟수")
+    parser.add_argument('--batch', type=int, default=500, help="동기화 1회당 판매 수")
+    args = parser.parse_args()
+
+    batches = make_batches(args)
+    total = args.batches * args.batch
+    user = SimpleNamespace(id=None, role='admin', company_id=1)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print(f"판매 {total:,}건 등록 (동기화 {args.batches}회 x {args.batch}건)")
+        for label, name, run in (
+            ("판매별 트랜잭션", 'per_sale.db', run_per_sale),
+            ("일괄 등록", 'batch.db', run_batch),
+        ):
+            engine, session_factory = setup(tmp_dir, name, args.products)
+            begin = time.perf_counter()
+            run(session_factory, batches, user)
+            elapsed = time.perf_counter() - begin
+            engine.dispose()
+            print(f"  {label:<16} {elapsed:8.2f}초  {total / elapsed:10,.0f}건/초  "
+                  f"동기화당 {elapsed / args.batches * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+판매 통계 벤치마크: 일별/월별 집계 기반 통계 쿼리의 p50/p99 응답 시간
+
+수년치 일별 집계 데이터(와 이로부터 만든 월별 집계)를 생성한 뒤 기간(일/주/월/연) x
+그룹(전체/제품/분류/브랜드) 조합을 캐시 없이(cold) / 캐시 적중(warm) 상태로 반복 조회합니다.
+조회 기간은 대시보드 기준으로 일별 최대 90일, 주별 최대 1년, 월별 최대 3년(월 단위), 연별 전체입니다.
+
+사용법:
+    python benchmarks/sales_stats.py --years 5 --products 2000
+"""
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from sqlalchemy import func, insert, select, text
+
+from app import create_db_engine
+from app.models import Base, Company, Product, SalesDaily, SalesMonthly
+from app.utils.sales_rollup import sales_summary_query, PERIOD_FORMATS
+from app.utils.stats_cache import StatsCache
+
+CATEGORIES = ['식품', '음료', '생활용품', '전자제품', '문구']
+BRANDS = ['종가집', '농심', '삼다수', 'CJ', 'Samsung', 'LG', 'Anker']
+GROUPS = [None, 'product', 'category', 'brand']
+
+
+def seed(engine, args):
+    """회사/제품 및 수년치 일별 집계 데이터 생성"""
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(insert(Company), [
+            {'name': f"회사 {i}", 'business_number': f"{i:010d}"} for i in range(1, args.companies + 1)
+        ])
+        conn.execute(insert(Product), [
+            {
+                'name': f"제품 {i}", 'code': f"SKU-{i:07d}", 'price': 1000.0,
+                'category': rng.choice(CATEGORIES), 'brand': rng.choice(BRANDS),
+                'company_id': i % args.companies + 1,
+            }
+            for i in range(args.products)
+        ])
+
+    start = date.today() - timedelta(days=365 * args.years)
+    total = 0
+    for offset in range(365 * args.years):
+        day = start + timedelta(days=offset)
+        rows = []
+        for product_index in rng.sample(range(args.products), args.daily_products):
+            quantity = rng.randint(1, 20)
+            rows.append({
+                'company_id': product_index % args.companies + 1, 'product_id': product_index + 1,
+                'sale_date': day, 'quantity': quantity, 'revenue': quantity * 1000.0,
+                'sale_count': rng.randint(1, 5),
+            })
+        with engine.begin() as conn:
+            conn.execute(insert(SalesDaily), rows)
+        total += len(rows)
+
+    sale_month = func.date(SalesDaily.sale_date, 'start of month')
+    with engine.begin() as conn:
+        conn.execute(SalesMonthly.__table__.insert().from_select(
+            ['company_id', 'product_id', 'sale_month', 'quantity', 'revenue', 'sale_count'],
+            select(SalesDaily.company_id, SalesDaily.product_id, sale_month,
+                   func.sum(SalesDaily.quantity), func.sum(SalesDaily.revenue), func.sum(SalesDaily.sale_count))
+            .group_by(SalesDaily.company_id, SalesDaily.product_id, sale_month)
+        ))
+    print(f"일별 집계 {total:,}행 생성 ({args.years}년)")
+    return start
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def month_end(day):
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+
+
+def random_range(rng, period, first_day, last_day):
+    """기간별 대시보드 조회 범위"""
+    if period == 'year':
+        return None, None
+    if period == 'month':
+        end_date = month_end(first_day + timedelta(days=rng.randint(0, (last_day - first_day).days)))
+        start_date = month_start(end_date - timedelta(days=rng.randint(28, 365 * 3)))
+        return max(start_date, month_start(first_day)), end_date
+    span = 90 if period == 'day' else 365
+    end_date = first_day + timedelta(days=rng.randint(span, (last_day - first_day).days))
+    return end_date - timedelta(days=rng.randint(6, span)), end_date
+
+
+def check_week_buckets(conn, first_day, last_day):
+    """연도가 바뀌는 주(12/31과 1/1이 같은 주)가 주별 통계에서 한 행(주 시작 월요일)으로 집계되는지 확인"""
+    checked = 0
+    for year in range(first_day.year, last_day.year):
+        monday = date(year, 12, 31) - timedelta(days=date(year, 12, 31).weekday())
+        if monday.year != year or monday < first_day or monday + timedelta(days=6) > last_day:
+            continue  # 12/31이 일요일이면 다음 주가 1/1부터 시작하므로 확인 대상 아님
+        rows = conn.execute(sales_summary_query('week', company_id=1, start_date=monday,
+                                                end_date=monday + timedelta(days=6))).all()
+        assert [row.period for row in rows] == [monday.isoformat()], rows
+        checked += 1
+    print(f"연도가 바뀌는 주 {checked}개가 각각 한 행으로 집계됨")
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="판매 통계 (일별 집계 기반) 응답 시간 벤치마크")
+    parser.add_argument('--companies', type=int, default=10, help="회사 수")
+    parser.add_argument('--products', type=int, default=2000, help="제품 수")
+    parser.add_argument('--years', type=int, default=5, help="집계 기간 (년)")
+    parser.add_argument('--daily-products', type=int, default=200, help="하루에 판매되는 제품 수")
+    parser.add_argument('--repeat', type=int, default=50, help="조합별 반복 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_db_engine('production', f"sqlite:///{os.path.join(tmp_dir, 'stats.db')}")
+        Base.metadata.create_all(bind=engine)
+        first_day = seed(engine, args)
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+
+        rng = random.Random(7)
+        cache = StatsCache()
+        with engine.connect() as conn:
+            check_week_buckets(conn, first_day, date.today())
+            print(f"\n{'기간':<8}{'그룹':<10}{'cold p50':>10}{'cold p99':>10}{'warm p99':>10}   (ms, 회사 1개)")
+            for period in PERIOD_FORMATS:
+                for group_by in GROUPS:
+                    cold, warm = [], []
+                    for _ in range(args.repeat):
+                        start_date, end_date = random_range(rng, period, first_day, date.today())
+                        query = sales_summary_query(period, company_id=1, start_date=start_date,
+                                                    end_date=end_date, group_by=group_by)
+                        key = (1, start_date, end_date, period, group_by, None)
+
+                        # 같은 키가 다시 나와도 cold는 항상 쿼리 실행, GC 일시 정지는 측정에서 제외
+                        cache.clear()
+                        gc.collect()
+                        begin = time.perf_counter()
+                        cache.get_or_compute(key, lambda: conn.execute(query).all())
+                        cold.append((time.perf_counter() - begin) * 1000)
+
+                        begin = time.perf_counter()
+                        cache.get_or_compute(key, lambda: conn.execute(query).all())
+                        warm.append((time.perf_counter() - begin) * 1000)
+
+                    print(f"{period:<8}{group_by or '-':<10}{statistics.median(cold):>10.2f}"
+                          f"{percentile(cold, 0.99):>10.2f}{percentile(warm, 0.99):>10.3f}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
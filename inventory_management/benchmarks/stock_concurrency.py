@@ -0,0 +1,142 @@
+"""
+판매 등록 재고 차감 동시성 스트레스 테스트
+
+여러 스레드가 동시에 같은 제품에 대해 create_sale 을 호출하여
+재고보다 많이 판매되는 경우(초과 판매)가 없는지 검증하고 처리량을 측정합니다.
+
+사용법:
+    python benchmarks/stock_concurrency.py --threads 16 --requests 4000 --stock 1000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from fastapi import HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+from app import create_db_engine
+from app.models import Base, Company, InventoryMovement, MovementType, Product, SaleRecord, User
+from app.utils.stock import record_movement
+from app.schemas.sale import SaleCreate
+from app.views.sales import create_sale
+
+
+def run(threads: int, requests: int, stock: int, products: int, max_quantity: int) -> bool:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_db_engine('production', f"sqlite:///{os.path.join(tmp_dir, 'stress.db')}")
+        Base.metadata.create_all(bind=engine)
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        
+        # 테스트 데이터 생성
+        db = session_factory()
+        company = Company(name="스트레스 테스트", business_number="8888888888")
+        db.add(company)
+        db.flush()
+        product_ids = []
+        for i in range(products):
+            product = Product(name=f"제품 {i}", code=f"STRESS-{i}", current_stock=stock,
+                              price=1000.0, company_id=company.id)
+            db.add(product)
+            db.flush()
+            record_movement(db, product.id, stock, MovementType.INITIAL)
+            product_ids.append(product.id)
+        db.commit()
+        current_user = User(id=1, username="stress", role="admin", company_id=company.id, is_active=True)
+        db.close()
+        
+        counters = {'accepted': 0, 'rejected': 0, 'errors': 0}
+        lock = threading.Lock()
+        per_thread = requests // threads
+        
+        def worker(seed: int):
+            rng = random.Random(seed)
+            db = session_factory()
+            try:
+                for _ in range(per_thread):
+                    sale = SaleCreate(
+                        product_id=rng.choice(product_ids),
+                        customer_name="동시성 테스트",
+                        quantity=rng.randint(1, max_quantity),
+                        unit_price=1000.0,
+                    )
+                    try:
+                        create_sale(sale=sale, db=db, current_user=current_user)
+                        key = 'accepted'
+                    except HTTPException as e:
+                        key = 'rejected' if e.status_code == 400 else 'errors'
+                    except Exception:
+                        db.rollback()
+                        key = 'errors'
+                    with lock:
+                        counters[key] += 1
+            finally:
+                db.close()
+        
+        workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+        start = time.perf_counter()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        elapsed = time.perf_counter() - start
+        
+        # 결과 검증: 제품별 (초기 재고 - 판매 수량 합계) == 재고 원장 합계 == 현재 재고 >= 0
+        db = session_factory()
+        sold = dict(
+            db.query(SaleRecord.product_id, func.sum(SaleRecord.quantity))
+            .group_by(SaleRecord.product_id).all()
+        )
+        ledger = dict(
+            db.query(InventoryMovement.product_id, func.sum(InventoryMovement.quantity))
+            .group_by(InventoryMovement.product_id).all()
+        )
+        ok = True
+        for product in db.query(Product).all():
+            expected = stock - (sold.get(product.id) or 0)
+            if product.current_stock < 0 or product.current_stock != expected \
+                    or ledger.get(product.id) != expected:
+                ok = False
+                print(f"  ❌ 제품 {product.id}: 재고 {product.current_stock}, "
+                      f"원장 합계 {ledger.get(product.id)}, 기대값 {expected}")
+        sale_count = db.query(SaleRecord).count()
+        db.close()
+        engine.dispose()
+        
+        total = per_thread * threads
+        print(f"요청 {total}회 / {elapsed:.2f}초 ({total / elapsed:,.1f} req/s)")
+        print(f"  - 판매 성공: {counters['accepted']} (판매 기록 {sale_count}건)")
+        print(f"  - 재고 부족 거절: {counters['rejected']}")
+        print(f"  - 오류: {counters['errors']}")
+        ok = ok and sale_count == counters['accepted'] and counters['errors'] == 0
+        print("✅ 초과 판매 없음" if ok else "❌ 재고 불일치 발생")
+        return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="판매 등록 재고 차감 동시성 스트레스 테스트")
+    parser.add_argument('--threads', type=int, default=16, help="동시 실행 스레드 수")
+    parser.add_argument('--requests', type=int, default=4000, help="총 판매 요청 수")
+    parser.add_argument('--stock', type=int, default=1000, help="제품별 초기 재고")
+    parser.add_argument('--products', type=int, default=3, help="판매 대상 제품 수")
+    parser.add_argument('--max-quantity', type=int, default=3, help="판매 1건당 최대 수량")
+    args = parser.parse_args()
+    
+    ok = run(args.threads, args.requests, args.stock, args.products, args.max_quantity)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
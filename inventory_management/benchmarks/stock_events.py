@@ -0,0 +1,77 @@
+"""
+재고 변경 알림 벤치마크: 커밋 스레드에서 발행한 이벤트가 구독자 큐에 도착하기까지의 지연
+
+동기 엔드포인트처럼 작업 스레드(--threads)에서 커밋 후 이벤트를 발행하고,
+이벤트 루프의 구독자(--subscribers, 회사 --companies개에 나눠 구독)가 받기까지의 지연을 측정합니다.
+
+사용법:
+    python benchmarks/stock_events.py --subscribers 1000 --events 2000
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent.parent)
+sys.path.insert(0, project_root)
+
+# 모듈 로드 시 생성되는 기본 엔진의 SQL 로그가 결과 출력을 가리지 않도록 함
+os.environ.setdefault('DB_PROFILE', 'production')
+
+from app.utils.stock_events import StockEventHub
+
+
+async def run(args):
+    hub = StockEventHub(queue_size=args.events + 1)
+    queues = [hub.subscribe(i % args.companies + 1) for i in range(args.subscribers)]
+    sent_at = {}
+    latencies = []
+
+    async def consume(queue, expected):
+        for _ in range(expected):
+            message = await queue.get()
+            latencies.append(time.perf_counter() - sent_at[message['products'][0][1]])
+
+    def publish(worker):
+        for seq in range(worker, args.events, args.threads):
+            sent_at[seq] = time.perf_counter()
+            hub.publish({seq: (seq % args.companies + 1, seq)})
+
+    expected = [
+        sum(1 for seq in range(args.events) if seq % args.companies == i % args.companies)
+        for i in range(args.subscribers)
+    ]
+    consumers = [asyncio.create_task(consume(queue, count)) for queue, count in zip(queues, expected)]
+
+    begin = time.perf_counter()
+    threads = [threading.Thread(target=publish, args=(worker,)) for worker in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    await asyncio.to_thread(lambda: [thread.join() for thread in threads])
+    await asyncio.gather(*consumers)
+    elapsed = time.perf_counter() - begin
+
+    latencies.sort()
+    print(f"구독자 {args.subscribers:,}명 (회사 {args.companies}곳), 이벤트 {args.events:,}건, 발행 스레드 {args.threads}개")
+    print(f"  전달 {len(latencies):,}건  {elapsed:6.2f}초  {len(latencies) / elapsed:10,.0f}건/초")
+    print(f"  지연 p50 {statistics.median(latencies) * 1000:7.2f}ms  "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:7.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재고 변경 알림 전달 지연 벤치마크")
+    parser.add_argument('--subscribers', type=int, default=1000, help="연결된 클라이언트 수")
+    parser.add_argument('--companies', type=int, default=10, help="회사 수")
+    parser.add_argument('--events', type=int, default=2000, help="발행할 이벤트 수 (커밋 수)")
+    parser.add_argument('--threads', type=int, default=8, help="발행 스레드 수")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
+import argparse
+import json
 import os
+import sys
 from pathlib import Path
 from sqlalchemy import create_engine, inspect, MetaData
 
@@ -62,5 +65,112 @@ def check_tables():
                 unique = "UNIQUE " if idx.get('unique') else ""
                 print(f"    - {unique}INDEX {idx['name']} ({', '.join(idx['column_names'])})")
 
+# 인덱스 분석용 기본 워크로드 (라우터별 대표 조회 요청, 데이터를 변경하지 않음)
+DEFAULT_WORKLOAD = [
+    {"method": "GET", "path": "/products/"},
+    {"method": "GET", "path": "/products/", "params": {"search": "김치"}},
+    {"method": "GET", "path": "/products/", "params": {"search": "ㄱㅊ"}},
+    {"method": "GET", "path": "/products/1"},
+    {"method": "GET", "path": "/products/1/stock", "params": {"as_of": "2030-01-01T00:00:00"}},
+    {"method": "GET", "path": "/sales/"},
+    {"method": "GET", "path": "/sales/", "params": {"product_id": 1}},
+    {"method": "GET", "path": "/sales/", "params": {"start_date": "2024-01-01T00:00:00", "status": "completed"}},
+    {"method": "GET", "path": "/purchases/"},
+    {"method": "GET", "path": "/purchases/", "params": {"product_id": 1}},
+    {"method": "GET", "path": "/purchases/", "params": {"payment_status": "pending"}},
+    {"method": "GET", "path": "/api/users/"},
+    {"method": "GET", "path": "/api/users/1"},
+    {"method": "GET", "path": "/api/companies/"},
+    {"method": "GET", "path": "/api/companies/", "params": {"search": "테스트"}},
+]
+
+def advise_indexes(workload_path=None, username="admin", password="admin123"):
+    """
+    워크로드를 실행하며 라우터별 실제 SQL을 캡처하고 EXPLAIN QUERY PLAN으로 분석
+    
+    전체 테이블 스캔(SCAN)과 임시 B-트리 정렬을 찾아 커버링 인덱스를 제안함.
+    워크로드 파일 형식: [{"method": "GET", "path": "/sales/", "params": {...}, "json": {...}}, ...]
+    """
+    sys.path.insert(0, str(BASE_DIR))
+    from fastapi.testclient import TestClient
+    from app import engine, async_engine
+    from app.utils.query_plan import StatementRecorder, explain_query_plan, analyze_plan
+    import main
+    
+    # SQL 로그가 분석 결과를 가리지 않도록 함
+    engine.echo = False
+    async_engine.sync_engine.echo = False
+    
+    if workload_path:
+        with open(workload_path, encoding="utf-8") as f:
+            workload = json.load(f)
+    else:
+        workload = DEFAULT_WORKLOAD
+    
+    client = TestClient(main.app, raise_server_exceptions=False)
+    response = client.post("/auth/token", data={"username": username, "password": password})
+    if response.status_code != 200:
+        print(f"❌ 로그인 실패 ({response.status_code}): {response.text}")
+        return
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    
+    # 워크로드 실행 중 발생한 SQL 캡처
+    recorder = StatementRecorder()
+    recorder.attach(engine, async_engine.sync_engine)
+    print(f"=== 워크로드 실행 ({len(workload)}개 요청) ===")
+    try:
+        for item in workload:
+            method = item.get("method", "GET").upper()
+            recorder.source = f"{method} {item['path']}"
+            response = client.request(method, item["path"], params=item.get("params"),
+                                      json=item.get("json"), headers=headers)
+            print(f"  {recorder.source} {item.get('params') or ''} -> {response.status_code}")
+    finally:
+        recorder.detach(engine, async_engine.sync_engine)
+    
+    # 캡처한 SQL별 실행 계획 분석
+    print(f"\n=== 실행 계획 분석 ({len(recorder.statements)}개 SQL) ===")
+    suggestions = {}
+    tables = set(inspect(engine).get_table_names())
+    with engine.connect() as conn:
+        for captured in recorder.statements.values():
+            try:
+                plan = explain_query_plan(conn, captured["statement"], captured["parameters"])
+            except Exception as e:
+                print(f"\n⚠️ 실행 계획 조회 실패: {e}")
+                continue
+            issues = analyze_plan(captured["statement"], plan, tables)
+            if not issues:
+                continue
+            
+            print(f"\n📌 {', '.join(captured['sources'])} (실행 {captured['count']}회)")
+            print(f"  SQL: {' '.join(captured['statement'].split())[:300]}")
+            for detail in plan:
+                print(f"    | {detail}")
+            for issue in issues:
+                label = "전체 테이블 스캔" if issue["kind"] == "full_scan" else "임시 B-트리 정렬"
+                print(f"  ⚠️ {label}: {issue['detail']}")
+                if issue["suggestion"]:
+                    print(f"     💡 {issue['suggestion']}")
+                    suggestions.setdefault(issue["suggestion"], set()).update(captured["sources"])
+                else:
+                    print("     (인덱스로 개선할 WHERE/ORDER BY 조건 없음)")
+    
+    print("\n=== 인덱스 제안 요약 ===")
+    if not suggestions:
+        print("  ✅ 전체 테이블 스캔이나 임시 정렬이 필요한 쿼리가 없습니다.")
+    for suggestion, sources in suggestions.items():
+        print(f"  {suggestion}\n    사용처: {', '.join(sorted(sources))}")
+
 if __name__ == "__main__":
-    check_tables()
+    parser = argparse.ArgumentParser(description="데이터베이스 테이블/인덱스 확인 및 인덱스 분석")
+    parser.add_argument("--advise", action="store_true", help="워크로드 실행 후 EXPLAIN QUERY PLAN 기반 인덱스 제안")
+    parser.add_argument("--workload", help="워크로드 JSON 파일 경로 (기본: 내장 조회 워크로드)")
+    parser.add_argument("--username", default="admin", help="워크로드 실행 계정")
+    parser.add_argument("--password", default="admin123", help="워크로드 실행 계정 비밀번호")
+    args = parser.parse_args()
+    
+    if args.advise:
+        advise_indexes(args.workload, args.username, args.password)
+    else:
+        check_tables()
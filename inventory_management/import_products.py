@@ -0,0 +1,43 @@
+import argparse
+import sys
+import traceback
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent)
+sys.path.append(project_root)
+
+def import_products(path, company_id, chunk_size):
+    """CSV/XLSX 파일의 제품을 대량 등록"""
+    from app import SessionLocal
+    from app.utils.product_import import ProductImporter, read_import_rows
+    
+    def show_progress(report):
+        print(f"  {report['total']:,}행 처리: 등록 {report['imported']:,}건, 실패 {report['failed']:,}건", flush=True)
+    
+    db = SessionLocal()
+    try:
+        with open(path, 'rb') as stream:
+            importer = ProductImporter(db, company_id, chunk_size=chunk_size, progress=show_progress)
+            report = importer.run(read_import_rows(stream, path))
+        
+        for error in report['errors']:
+            print(f"  ⚠️ {error['row']}행 ({error['code']}): {error['error']}")
+        if report['failed'] > len(report['errors']):
+            print(f"  ... 외 {report['failed'] - len(report['errors']):,}건")
+        print(f"✅ 제품 {report['imported']:,}건을 등록했습니다. (실패 {report['failed']:,}건)")
+    except Exception:
+        db.rollback()
+        print("\n❌ 제품 대량 등록 중 오류가 발생했습니다:", file=sys.stderr)
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="제품 대량 등록 (CSV/XLSX)")
+    parser.add_argument('path', help="제품 목록 파일 경로")
+    parser.add_argument('company_id', type=int, help="등록할 회사 ID")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="트랜잭션당 행 수")
+    args = parser.parse_args()
+    import_products(args.path, args.company_id, args.chunk_size)
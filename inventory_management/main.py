@@ -3,6 +3,9 @@ from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.sql_metrics import SQL_METRICS_HEADERS
+
 # 애플리케이션 초기화
 app = FastAPI(
     title="재고 관리 시스템 API",
@@ -17,8 +20,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 브라우저 클라이언트가 목록 다음 페이지 커서와 요청별 SQL 통계 헤더를 읽을 수 있도록 노출
+    expose_headers=[NEXT_CURSOR_HEADER, *SQL_METRICS_HEADERS],
 )
 
+# 요청 단위 SQL 계측 (쿼리 수, DB 시간, N+1 의심 SQL)
+from app import engine, async_engine
+from app.utils.sql_metrics import install_sql_metrics, sql_metrics_middleware
+
+install_sql_metrics(engine, async_engine.sync_engine)
+app.middleware("http")(sql_metrics_middleware)
+
 # 라우터 등록
 from app.views import get_routers
 
@@ -26,6 +38,67 @@ from app.views import get_routers
 for router in get_routers():
     app.include_router(router)
 
+# 재고 변경 알림 (WebSocket)
+import asyncio
+from typing import Optional
+from fastapi import WebSocket
+from sqlalchemy import select
+from app import AsyncSessionLocal
+from app.models.user import User
+from app.utils.auth import decode_access_token
+from app.utils.stock_events import stock_event_hub
+
+async def _wait_disconnect(websocket: WebSocket):
+    """클라이언트가 보내는 메시지는 무시하고 연결 종료만 감지"""
+    while True:
+        message = await websocket.receive()
+        if message['type'] == 'websocket.disconnect':
+            return
+
+@app.websocket("/ws/stock")
+async def stock_events(websocket: WebSocket, token: Optional[str] = None, company_id: Optional[int] = None):
+    """
+    재고 변경 이벤트 구독
+    
+    판매/구매 등으로 재고가 바뀐 트랜잭션이 커밋될 때마다
+    {"type": "stock", "company_id": 1, "products": [[제품 ID, 재고], ...]}를 전송합니다.
+    이벤트가 밀리면 {"type": "resync"}를 보내므로 증분 동기화(/products/changes)로 따라잡습니다.
+    
+    토큰은 Authorization 헤더(Bearer) 또는 token 쿼리 파라미터로 전달하며,
+    일반 사용자는 본인 회사, 관리자는 company_id(생략 시 전체 회사)의 이벤트를 받습니다.
+    """
+    authorization = websocket.headers.get('authorization', '')
+    if not token and authorization.lower().startswith('bearer '):
+        token = authorization[7:].strip()
+    try:
+        username = decode_access_token(token or '').username
+    except HTTPException:
+        await websocket.close(code=1008)
+        return
+    
+    async with AsyncSessionLocal() as db:
+        user = (await db.execute(select(User).where(User.username == username))).scalars().first()
+    if user is None or not user.is_active:
+        await websocket.close(code=1008)
+        return
+    if user.role == "user":
+        company_id = user.company_id
+    
+    await websocket.accept()
+    queue = stock_event_hub.subscribe(company_id)
+    disconnected = asyncio.create_task(_wait_disconnect(websocket))
+    try:
+        while True:
+            next_event = asyncio.create_task(queue.get())
+            done, _ = await asyncio.wait({next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected in done:
+                next_event.cancel()
+                break
+            await websocket.send_json(next_event.result())
+    finally:
+        disconnected.cancel()
+        stock_event_hub.unsubscribe(company_id, queue)
+
 # 루트 엔드포인트
 @app.get("/")
 async def root():
@@ -0,0 +1,29 @@
+import sys
+import traceback
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent)
+sys.path.append(project_root)
+
+def rebuild_sales_rollup(company_id=None):
+    """판매 기록으로 일별/월별 판매 집계(sales_daily, sales_monthly) 재생성 (백필/정합성 복구용)"""
+    from app import SessionLocal
+    from app.utils.sales_rollup import rebuild_sales_daily
+    
+    db = SessionLocal()
+    try:
+        count = rebuild_sales_daily(db, company_id=company_id)
+        db.commit()
+        print(f"✅ 일별 판매 집계 {count}건을 생성했습니다.")
+    except Exception:
+        db.rollback()
+        print("\n❌ 판매 집계 재생성 중 오류가 발생했습니다:", file=sys.stderr)
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    # 사용법: python rebuild_sales_rollup.py [회사 ID]
+    rebuild_sales_rollup(int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,29 @@
+import sys
+import traceback
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = str(Path(__file__).resolve().parent)
+sys.path.append(project_root)
+
+def snapshot_inventory(company_id=None):
+    """재고 스냅샷 생성 (cron 등으로 주기적으로 실행)"""
+    from app import SessionLocal
+    from app.utils.stock import create_stock_snapshots
+    
+    db = SessionLocal()
+    try:
+        count = create_stock_snapshots(db, company_id=company_id)
+        db.commit()
+        print(f"✅ 재고 스냅샷 {count}건을 생성했습니다.")
+    except Exception:
+        db.rollback()
+        print("\n❌ 재고 스냅샷 생성 중 오류가 발생했습니다:", file=sys.stderr)
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    # 사용법: python snapshot_inventory.py [회사 ID]
+    snapshot_inventory(int(sys.argv[1]) if len(sys.argv) > 1 else None)